@@ -3,18 +3,56 @@ Audio stack listener for detecting playback sources.
 
 Uses PulseAudio sink-inputs for reliable source detection and D-Bus MPRIS for metadata.
 Supports multiple simultaneous sources (Spotify, AirPlay, etc.)
+
+When pulsectl (libpulse bindings) is installed, sink-input changes are received as
+PulseAudio events instead of polling pactl every poll_interval; otherwise a
+long-running `pactl subscribe` process, read on an asyncio loop, provides the same
+events. When PyGObject is installed, MPRIS metadata/volume are cached from
+PropertiesChanged signals, which are dispatched by pumping a GLib main context in
+the listener thread (by the asyncio loop itself when asyncio-glib is installed).
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import logging
 import re
+import shutil
 import subprocess
 import threading
 import time
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable
+from types import MappingProxyType
+from typing import Any, Callable
+
+try:
+    import dbus
+    HAS_DBUS = True
+except ImportError:
+    HAS_DBUS = False
+
+try:
+    import pulsectl
+    HAS_PULSECTL = True
+except ImportError:
+    HAS_PULSECTL = False
+
+try:
+    from dbus.mainloop.glib import DBusGMainLoop
+    from gi.repository import GLib
+    HAS_GLIB = True
+except ImportError:
+    HAS_GLIB = False
+
+try:
+    import asyncio_glib
+    HAS_ASYNCIO_GLIB = True
+except ImportError:
+    HAS_ASYNCIO_GLIB = False
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +64,17 @@ class PlaybackState(Enum):
     PAUSED = "paused"
 
 
+# Enum values bound once for the state-publishing paths
+_IDLE_VALUE = PlaybackState.IDLE.value
+_PLAYING_VALUE = PlaybackState.PLAYING.value
+_PAUSED_VALUE = PlaybackState.PAUSED.value
+_STATE_VALUES = {
+    PlaybackState.IDLE: _IDLE_VALUE,
+    PlaybackState.PLAYING: _PLAYING_VALUE,
+    PlaybackState.PAUSED: _PAUSED_VALUE,
+}
+
+
 class AudioSource(Enum):
     """Known audio sources."""
     SPOTIFY = "spotify"
@@ -34,9 +83,9 @@ class AudioSource(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SourceState:
-    """State of a single audio source."""
+    """State of a single audio source (immutable)."""
     state: PlaybackState = PlaybackState.IDLE
     volume: int = 100  # Source-specific volume (0-100)
     title: str = ""
@@ -44,20 +93,25 @@ class SourceState:
     album: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioState:
-    """Current audio/playback state with multiple sources."""
-    sources: dict[str, SourceState] = field(default_factory=dict)
-    active_sources: list[str] = field(default_factory=list)
+    """
+    Current audio/playback state with multiple sources.
+    
+    Snapshots handed out by AudioListener.state are read-only: sources is a
+    mapping proxy and active_sources a tuple.
+    """
+    sources: Mapping[str, SourceState] = field(default_factory=dict)
+    active_sources: Sequence[str] = field(default_factory=list)
     primary_source: str = "unknown"
     last_update: float = field(default_factory=time.time)
 
     def to_dict(self) -> dict:
         """Convert to dict for MQTT publishing."""
         return {
-            "playback_state": self._get_primary_state().value,
+            "playback_state": _STATE_VALUES[self._get_primary_state()],
             "playback_source": self.primary_source,
-            "active_sources": self.active_sources,
+            "active_sources": list(self.active_sources),
             "title": self._get_metadata("title"),
             "artist": self._get_metadata("artist"),
         }
@@ -88,6 +142,77 @@ SOURCE_PATTERNS = {
     "airplay": AudioSource.AIRPLAY,
 }
 
+# Sink-input state indexed by its corked flag
+_PLAY_STATES = (PlaybackState.PLAYING, PlaybackState.PAUSED)
+
+# One alternation over all source patterns - a single search per field
+_SOURCE_RE = re.compile("|".join(map(re.escape, SOURCE_PATTERNS)))
+
+# Substring identifying each source's MPRIS bus name (org.mpris.MediaPlayer2.<name>)
+MPRIS_KEYWORDS = {
+    AudioSource.SPOTIFY: "spotify",
+}
+
+MPRIS_PATH = "/org/mpris/MediaPlayer2"
+MPRIS_PLAYER_IFACE = "org.mpris.MediaPlayer2.Player"
+DBUS_PROPS_IFACE = "org.freedesktop.DBus.Properties"
+
+# D-Bus errors meaning the cached MPRIS player no longer exists
+MPRIS_GONE_ERRORS = frozenset({
+    "org.freedesktop.DBus.Error.ServiceUnknown",
+    "org.freedesktop.DBus.Error.NameHasNoOwner",
+    "org.freedesktop.DBus.Error.UnknownObject",
+    "org.freedesktop.DBus.Error.UnknownMethod",
+})
+
+# Precompiled patterns for parsing `pactl list sink-inputs` output. _PACTL_TEXT_RE
+# picks out only the lines we use: the header, Corked/Volume and three properties.
+_VOLUME_RE = re.compile(r'(\d+)%')
+_PACTL_TEXT_RE = re.compile(
+    r'^Sink Input #(\d+)'
+    r'|^[ \t]+(Corked|Volume): ([^\n]+)'
+    r'|^[ \t]+(application\.name|application\.process\.binary|media\.name) = "([^"\n]*)"',
+    re.MULTILINE,
+)
+
+
+def _parse_volume_percent(value: str) -> int | None:
+    """Parse the first percentage from "front-left: 65536 / 100% / 0.00 dB, ..."."""
+    match = _VOLUME_RE.search(value)
+    return int(match.group(1)) if match else None
+
+
+# pactl "Key: value" fields -> (sink-input dict key, value parser)
+_FIELD_KEY_MAP = {
+    "Corked": ("corked", lambda value: value.strip().lower() == "yes"),
+    "Volume": ("volume", _parse_volume_percent),
+}
+
+# PulseAudio properties -> sink-input dict key
+_PROP_KEY_MAP = {
+    "application.name": "app_name",
+    "application.process.binary": "binary",
+    "media.name": "media_name",
+}
+
+# `pactl subscribe` lines that mean the sink-input list must be re-read
+_PACTL_EVENT_RE = re.compile(rb"^Event '(?:new|change|remove)' on sink-input #\d+")
+
+# Absolute pactl path: together with close_fds=False this lets subprocess use
+# posix_spawn instead of fork+exec (our own fds are non-inheritable anyway)
+PACTL = shutil.which("pactl") or "pactl"
+
+
+def _run_pactl(*args: str) -> subprocess.CompletedProcess:
+    """Run a short-lived pactl command and capture its text output."""
+    return subprocess.run(
+        [PACTL, *args],
+        capture_output=True,
+        text=True,
+        timeout=5,
+        close_fds=False,
+    )
+
 
 class AudioListener:
     """
@@ -98,44 +223,96 @@ class AudioListener:
     - D-Bus MPRIS (for metadata from Spotify, etc.)
     """
 
+    # Upper bound for the poll interval while nothing is changing (pactl polling only)
+    MAX_IDLE_POLL_INTERVAL = 5.0
+
     def __init__(
         self,
         on_state_change: Callable[[str, str | list], None] | None = None,
         poll_interval: float = 1.0,
+        use_libpulse: bool = True,
+        on_state_batch: Callable[[dict[str, Any]], None] | None = None,
     ):
         self.on_state_change = on_state_change
+        # If set, receives all changes from one poll as a single {key: value} dict
+        # instead of one on_state_change call per key
+        self.on_state_batch = on_state_batch
         self.poll_interval = poll_interval
+        # Event-driven updates via libpulse (falls back to pactl polling if unavailable)
+        self.use_libpulse = use_libpulse
         
         self._state = AudioState()
+        # Serializes writers only; readers use the published snapshot
         self._lock = threading.Lock()
+        # Immutable copy of _state, rebuilt by writers only when something changed
+        self._snapshot = self._make_snapshot()
+        
+        # Keys of the last applied poll, for a cheap "nothing changed" early-out
+        self._active_key: tuple[str, ...] = ()
+        self._states_key: tuple[tuple[str, SourceState], ...] = ()
         self._running = False
         self._thread: threading.Thread | None = None
         
+        # Use pactl's JSON output until it turns out to be unsupported
+        self._pactl_json = True
+        
+        # Set by PulseAudio subscription events, cleared when state is re-read
+        self._pulse_dirty = False
+        
         # D-Bus for MPRIS metadata
         self._dbus_available = False
         self._bus = None
+        
+        # Resolved MPRIS bus names per source, evicted on NameOwnerChanged
+        self._mpris_targets: dict[AudioSource, str] = {}
+        
+        # Signal-driven MPRIS state (only used when a GLib main context is pumped)
+        self._glib_context = None
+        self._mpris_cache: dict[AudioSource, dict] = {}
+        self._mpris_matches: dict[AudioSource, object] = {}
+        self._mpris_dirty = False
+        
+        # Set while the pactl subscribe loop runs, to wake it on MPRIS signals
+        self._wake_event: asyncio.Event | None = None
 
     @property
     def state(self) -> AudioState:
-        with self._lock:
-            return AudioState(
-                sources=self._state.sources.copy(),
-                active_sources=self._state.active_sources.copy(),
-                primary_source=self._state.primary_source,
-                last_update=self._state.last_update,
-            )
+        # The snapshot is immutable and swapped in with a single attribute store,
+        # so readers never need the lock
+        return self._snapshot
+
+    def _make_snapshot(self) -> AudioState:
+        """Build a read-only copy of the current state (call with _lock held)."""
+        return AudioState(
+            sources=MappingProxyType(dict(self._state.sources)),
+            active_sources=tuple(self._state.active_sources),
+            primary_source=self._state.primary_source,
+            last_update=self._state.last_update,
+        )
 
     def _init_dbus(self) -> bool:
         """Initialize D-Bus connection for MPRIS."""
+        if not HAS_DBUS:
+            logger.warning("python-dbus not installed, MPRIS metadata disabled")
+            return False
+        
         try:
-            import dbus
+            # Signals are only dispatched if the bus is attached to a main loop
+            if HAS_GLIB:
+                DBusGMainLoop(set_as_default=True)
+                self._glib_context = GLib.MainContext.default()
+            else:
+                logger.info("PyGObject not installed, polling MPRIS properties")
+            
             self._bus = dbus.SessionBus()
+            self._bus.add_signal_receiver(
+                self._on_name_owner_changed,
+                signal_name="NameOwnerChanged",
+                dbus_interface="org.freedesktop.DBus",
+            )
             self._dbus_available = True
             logger.info("D-Bus initialized for MPRIS monitoring")
             return True
-        except ImportError:
-            logger.warning("python-dbus not installed, MPRIS metadata disabled")
-            return False
         except Exception as e:
             logger.warning(f"Failed to connect to D-Bus: {e}")
             return False
@@ -143,77 +320,224 @@ class AudioListener:
     def _get_pulse_sink_inputs(self) -> list[dict]:
         """Get list of active sink inputs from PulseAudio."""
         try:
-            result = subprocess.run(
-                ["pactl", "list", "sink-inputs"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
+            if self._pactl_json:
+                result = _run_pactl("--format=json", "list", "sink-inputs")
+                if result.returncode == 0:
+                    try:
+                        return self._parse_sink_inputs_json(result.stdout)
+                    except json.JSONDecodeError:
+                        pass
+                elif "format" not in result.stderr:
+                    # Not an option error (e.g. PulseAudio still starting) - retry JSON next time
+                    return []
+                # Older pactl (< PulseAudio 16) rejects --format or ignores it and
+                # prints text - use the text parser from now on
+                logger.info("pactl JSON output not supported, falling back to text parsing")
+                self._pactl_json = False
+            
+            result = _run_pactl("list", "sink-inputs")
             if result.returncode != 0:
                 return []
             
-            inputs = []
-            current = {}
-            
-            for line in result.stdout.split('\n'):
-                stripped = line.strip()
-                
-                if stripped.startswith("Sink Input #"):
-                    if current:
-                        inputs.append(current)
-                    current = {"id": stripped.split("#")[1]}
-                elif current:
-                    # Handle "Key: Value" format
-                    if ": " in stripped and "=" not in stripped:
-                        key, _, value = stripped.partition(": ")
-                        key = key.strip()
-                        value = value.strip().strip('"')
-                        
-                        if key == "Corked":
-                            current["corked"] = value.lower() == "yes"
-                        elif key == "Volume":
-                            # Parse volume percentage from "front-left: 65536 / 100% / 0.00 dB, ..."
-                            match = re.search(r'(\d+)%', value)
-                            if match:
-                                current["volume"] = int(match.group(1))
-                    
-                    # Handle "key = value" format (properties)
-                    elif " = " in stripped:
-                        key, _, value = stripped.partition(" = ")
-                        key = key.strip()
-                        value = value.strip().strip('"')
-                        
-                        if key == "application.name":
-                            current["app_name"] = value
-                        elif key == "application.process.binary":
-                            current["binary"] = value
-                        elif key == "media.name":
-                            current["media_name"] = value
-            
-            if current:
-                inputs.append(current)
-            
-            return inputs
+            return self._parse_sink_inputs_text(result.stdout)
             
         except Exception as e:
             logger.debug(f"Failed to get sink inputs: {e}")
             return []
 
+    def _parse_sink_inputs_json(self, output: str) -> list[dict]:
+        """Parse `pactl --format=json list sink-inputs` output."""
+        inputs = []
+        
+        for entry in json.loads(output):
+            # Volume is per-channel: {"front-left": {"value_percent": "65%", ...}, ...}
+            volume = None
+            for channel in entry.get("volume", {}).values():
+                percent = channel.get("value_percent", "")
+                if percent:
+                    volume = int(percent.rstrip("%"))
+                    break
+            
+            inputs.append(self._sink_input_from_props(
+                str(entry["index"]),
+                entry.get("corked", False),
+                volume,
+                entry.get("properties", {}),
+            ))
+        
+        return inputs
+
+    def _get_libpulse_sink_inputs(self, pulse: pulsectl.Pulse) -> list[dict]:
+        """Get list of sink inputs via an open libpulse connection."""
+        return [
+            self._sink_input_from_props(
+                str(si.index),
+                bool(si.corked),
+                int(round(si.volume.value_flat * 100)),
+                si.proplist,
+            )
+            for si in pulse.sink_input_list()
+        ]
+
+    @staticmethod
+    def _sink_input_from_props(
+        sink_id: str,
+        corked: bool,
+        volume: int | None,
+        props: dict,
+    ) -> dict:
+        """Build a sink-input dict from structured (JSON/libpulse) fields."""
+        current = {"id": sink_id, "corked": corked}
+        if volume is not None:
+            current["volume"] = volume
+        for prop_key, target in _PROP_KEY_MAP.items():
+            if prop_key in props:
+                current[target] = props[prop_key]
+        return current
+
+    def _parse_sink_inputs_text(self, output: str) -> list[dict]:
+        """Parse human-readable `pactl list sink-inputs` output."""
+        inputs = []
+        current: dict | None = None
+        
+        for match in _PACTL_TEXT_RE.finditer(output):
+            sink_id, field_key, field_value, prop_key, prop_value = match.groups()
+            
+            if sink_id is not None:
+                current = {"id": sink_id}
+                inputs.append(current)
+            elif current is None:
+                continue
+            elif field_key is not None:
+                target, parse = _FIELD_KEY_MAP[field_key]
+                value = parse(field_value)
+                if value is not None:
+                    current[target] = value
+            else:
+                current[_PROP_KEY_MAP[prop_key]] = prop_value
+        
+        return inputs
+
     def _detect_source_type(self, sink_input: dict) -> AudioSource:
         """Detect source type from sink input properties."""
-        # Check binary name
-        binary = sink_input.get("binary", "").lower()
-        for pattern, source in SOURCE_PATTERNS.items():
-            if pattern in binary:
-                return source
+        # Check binary name, then application name
+        match = (
+            _SOURCE_RE.search(sink_input.get("binary", "").lower())
+            or _SOURCE_RE.search(sink_input.get("app_name", "").lower())
+        )
+        return SOURCE_PATTERNS[match.group(0)] if match else AudioSource.UNKNOWN
+
+    def _on_name_owner_changed(self, name: str, old_owner: str, new_owner: str) -> None:
+        """Evict cached MPRIS targets when their bus name changes owner."""
+        for source, target in list(self._mpris_targets.items()):
+            if target == name:
+                logger.debug(f"MPRIS player {name} changed owner, evicting cache")
+                self._evict_mpris(source)
+
+    def _evict_mpris(self, source: AudioSource) -> None:
+        """Forget the resolved MPRIS player for a source and its cached properties."""
+        self._mpris_targets.pop(source, None)
+        self._mpris_cache.pop(source, None)
+        match = self._mpris_matches.pop(source, None)
+        if match is not None:
+            match.remove()
+
+    def _on_mpris_props_changed(
+        self,
+        source: AudioSource,
+        interface: str,
+        changed: dict,
+        invalidated: list,
+    ) -> None:
+        """Merge a PropertiesChanged signal into the cached MPRIS state."""
+        if interface != MPRIS_PLAYER_IFACE:
+            return
+        cached = self._mpris_cache.get(source)
+        if cached is None:
+            return  # Not seeded yet - next poll reads all properties
+        self._mpris_cache[source] = {**cached, **self._parse_mpris_props(changed)}
+        self._mpris_dirty = True
+        if self._wake_event is not None:
+            self._wake_event.set()
+
+    def _wait_for_events(self, timeout: float) -> None:
+        """Sleep for timeout, dispatching D-Bus signals in the meantime."""
+        if self._glib_context is None:
+            time.sleep(timeout)
+            return
+        
+        fired = []
+        source_id = GLib.timeout_add(int(timeout * 1000), lambda: fired.append(True))
+        while self._running and not fired and not self._mpris_dirty:
+            self._glib_context.iteration(True)
+        if not fired:
+            GLib.source_remove(source_id)
+
+    def _dispatch_dbus_events(self) -> None:
+        """Dispatch any pending D-Bus signals without blocking."""
+        if self._glib_context is not None:
+            while self._glib_context.iteration(False):
+                pass
+
+    def _resolve_mpris(self, source: AudioSource) -> str | None:
+        """
+        Resolve the MPRIS bus name for a source, using the cached name if present.
+        
+        AudioSource.UNKNOWN resolves to any MPRIS player.
+        """
+        target = self._mpris_targets.get(source)
+        if target:
+            return target
+        
+        obj = self._bus.get_object("org.freedesktop.DBus", "/org/freedesktop/DBus")
+        iface = dbus.Interface(obj, "org.freedesktop.DBus")
+        names = iface.ListNames()
+        
+        # Look for matching player
+        keyword = MPRIS_KEYWORDS.get(source)
+        for name in names:
+            if not name.startswith("org.mpris.MediaPlayer2."):
+                continue
+            if keyword is None or keyword in name.lower():
+                target = str(name)
+                break
+        
+        if target:
+            self._mpris_targets[source] = target
+            if self._glib_context is not None:
+                self._mpris_matches[source] = self._bus.add_signal_receiver(
+                    functools.partial(self._on_mpris_props_changed, source),
+                    signal_name="PropertiesChanged",
+                    dbus_interface=DBUS_PROPS_IFACE,
+                    path=MPRIS_PATH,
+                    bus_name=target,
+                )
+        return target
+
+    @staticmethod
+    def _parse_mpris_props(props: dict) -> dict:
+        """Extract title/artist/album/volume from MPRIS player properties."""
+        metadata = {}
         
-        # Check application name
-        app_name = sink_input.get("app_name", "").lower()
-        for pattern, source in SOURCE_PATTERNS.items():
-            if pattern in app_name:
-                return source
+        # Track metadata
+        if "Metadata" in props:
+            meta = props["Metadata"]
+            metadata["title"] = ""
+            metadata["artist"] = ""
+            metadata["album"] = ""
+            if (title := meta.get("xesam:title")) is not None:
+                metadata["title"] = str(title)
+            if artists := meta.get("xesam:artist"):
+                # xesam:artist is a list (dbus.Array subclasses list); tolerate a bare string
+                metadata["artist"] = str(artists[0]) if isinstance(artists, (list, tuple)) else str(artists)
+            if (album := meta.get("xesam:album")) is not None:
+                metadata["album"] = str(album)
         
-        return AudioSource.UNKNOWN
+        # Volume (0.0 - 1.0 range)
+        if "Volume" in props:
+            metadata["volume"] = int(float(props["Volume"]) * 100)
+        
+        return metadata
 
     def _get_mpris_metadata(self, source: AudioSource) -> dict:
         """Get metadata and volume from MPRIS D-Bus interface."""
@@ -221,66 +545,60 @@ class AudioListener:
             return {}
         
         try:
-            import dbus
-            
-            # Find MPRIS player
-            obj = self._bus.get_object("org.freedesktop.DBus", "/org/freedesktop/DBus")
-            iface = dbus.Interface(obj, "org.freedesktop.DBus")
-            names = iface.ListNames()
-            
-            # Look for matching player
-            target = None
-            for name in names:
-                if not name.startswith("org.mpris.MediaPlayer2."):
-                    continue
-                name_lower = name.lower()
-                if source == AudioSource.SPOTIFY and ("spotify" in name_lower or "spotifyd" in name_lower):
-                    target = name
-                    break
-            
-            if not target:
+            if source not in MPRIS_KEYWORDS:
                 return {}
             
-            obj = self._bus.get_object(target, "/org/mpris/MediaPlayer2")
-            props = dbus.Interface(obj, "org.freedesktop.DBus.Properties")
-            
-            metadata = {}
+            # Kept current by PropertiesChanged signals once seeded
+            cached = self._mpris_cache.get(source)
+            if cached is not None:
+                return cached
             
-            # Get track metadata
-            try:
-                meta = props.Get("org.mpris.MediaPlayer2.Player", "Metadata")
-                if "xesam:title" in meta:
-                    metadata["title"] = str(meta["xesam:title"])
-                if "xesam:artist" in meta:
-                    artists = meta["xesam:artist"]
-                    if artists:
-                        metadata["artist"] = str(artists[0]) if hasattr(artists, "__iter__") else str(artists)
-                if "xesam:album" in meta:
-                    metadata["album"] = str(meta["xesam:album"])
-            except Exception:
-                pass
-            
-            # Get volume (0.0 - 1.0 range)
-            try:
-                volume = props.Get("org.mpris.MediaPlayer2.Player", "Volume")
-                metadata["volume"] = int(float(volume) * 100)
-            except Exception:
-                pass
+            target = self._resolve_mpris(source)
+            if not target:
+                return {}
             
+            obj = self._bus.get_object(target, MPRIS_PATH)
+            props = dbus.Interface(obj, DBUS_PROPS_IFACE)
+            
+            values = {}
+            for prop in ("Metadata", "Volume"):
+                try:
+                    values[prop] = props.Get(MPRIS_PLAYER_IFACE, prop)
+                except dbus.DBusException as e:
+                    if e.get_dbus_name() in MPRIS_GONE_ERRORS:
+                        # Player went away - stop querying it until re-resolved
+                        self._evict_mpris(source)
+                        return {}
+                    # Otherwise the player just doesn't expose this property
+            
+            metadata = self._parse_mpris_props(values)
+            if self._glib_context is not None:
+                self._mpris_cache[source] = metadata
             return metadata
             
         except Exception as e:
             logger.debug(f"Error getting MPRIS metadata: {e}")
+            # Player may have gone away - re-resolve next time
+            self._evict_mpris(source)
             return {}
 
     def _update_state(
         self,
         active_sources: list[str],
         source_states: dict[str, SourceState],
-    ) -> None:
-        """Update internal state and notify callbacks."""
+    ) -> bool:
+        """Update internal state and notify callbacks. Returns True if anything changed."""
+        # active_sources arrives sorted, so tuples compare without building sets
+        active_key = tuple(active_sources)
+        states_key = tuple(sorted(source_states.items()))
+        
         with self._lock:
+            if active_key == self._active_key and states_key == self._states_key:
+                return False
+            
             changed = False
+            sources_changed = False
+            updates: dict[str, Any] = {}
             
             # Determine primary source (prefer spotify, then airplay, then first active)
             old_primary = self._state.primary_source
@@ -294,17 +612,15 @@ class AudioListener:
                 new_primary = "unknown"
             
             # Check for changes
-            if set(active_sources) != set(self._state.active_sources):
+            if active_key != self._active_key:
                 self._state.active_sources = active_sources
                 changed = True
-                if self.on_state_change:
-                    self.on_state_change("active_sources", active_sources)
+                updates["active_sources"] = active_sources
             
             if new_primary != old_primary:
                 self._state.primary_source = new_primary
                 changed = True
-                if self.on_state_change:
-                    self.on_state_change("playback_source", new_primary)
+                updates["playback_source"] = new_primary
             
             # Update source states and check for per-source changes
             for source_name, source_state in source_states.items():
@@ -316,19 +632,20 @@ class AudioListener:
                     changed = True
                     
                     # Publish per-source state
-                    if self.on_state_change:
-                        self.on_state_change(f"source/{source_name}/state", source_state.state.value)
-                        self.on_state_change(f"source/{source_name}/volume", source_state.volume)
+                    updates[f"source/{source_name}/state"] = _STATE_VALUES[source_state.state]
+                    updates[f"source/{source_name}/volume"] = source_state.volume
                 
+                if old_state != source_state:
+                    sources_changed = True
                 self._state.sources[source_name] = source_state
             
             # Clean up inactive sources
             for source_name in list(self._state.sources.keys()):
                 if source_name not in source_states:
                     # Publish idle state for removed source
-                    if self.on_state_change:
-                        self.on_state_change(f"source/{source_name}/state", PlaybackState.IDLE.value)
+                    updates[f"source/{source_name}/state"] = _IDLE_VALUE
                     del self._state.sources[source_name]
+                    sources_changed = True
             
             # Publish overall playback state based on primary source
             if changed:
@@ -336,47 +653,72 @@ class AudioListener:
                 
                 if new_primary in source_states:
                     state = source_states[new_primary].state
-                    if self.on_state_change:
-                        self.on_state_change("playback_state", state.value)
+                    updates["playback_state"] = _STATE_VALUES[state]
                     
                     # Also publish metadata if available
                     title = source_states[new_primary].title
                     artist = source_states[new_primary].artist
-                    if title and self.on_state_change:
-                        self.on_state_change("title", title)
-                    if artist and self.on_state_change:
-                        self.on_state_change("artist", artist)
+                    if title:
+                        updates["title"] = title
+                    if artist:
+                        updates["artist"] = artist
                 elif not active_sources:
-                    if self.on_state_change:
-                        self.on_state_change("playback_state", PlaybackState.IDLE.value)
+                    updates["playback_state"] = _IDLE_VALUE
                 
                 logger.info(f"Audio: active={active_sources}, primary={new_primary}")
+            
+            if changed or sources_changed:
+                # Build fully, then publish with one store - readers see old or new
+                self._snapshot = self._make_snapshot()
+            
+            self._active_key = active_key
+            self._states_key = states_key
+        
+        # Notify outside the lock, once per poll when batching
+        if self.on_state_batch and updates:
+            self.on_state_batch(updates)
+        elif self.on_state_change:
+            for key, value in updates.items():
+                self.on_state_change(key, value)
+        
+        return True
 
-    def _poll_state(self) -> None:
-        """Poll all audio sources for state."""
+    def _poll_state(
+        self,
+        pulse: pulsectl.Pulse | None = None,
+        sink_inputs: list[dict] | None = None,
+    ) -> bool:
+        """Poll all audio sources for state. Returns True if anything changed.
+        
+        sink_inputs, if given, were already read by the caller (the asyncio
+        loop reads them off-thread).
+        """
         # Get active sink inputs from PulseAudio
-        sink_inputs = self._get_pulse_sink_inputs()
+        if sink_inputs is not None:
+            pass
+        elif pulse is not None:
+            sink_inputs = self._get_libpulse_sink_inputs(pulse)
+        else:
+            sink_inputs = self._get_pulse_sink_inputs()
         
         active_sources = []
         source_states = {}
         
         for sink_input in sink_inputs:
             source_type = self._detect_source_type(sink_input)
-            source_name = source_type.value
-            
-            if source_name == "unknown":
+            if source_type is AudioSource.UNKNOWN:
                 continue
+            source_name = source_type.value
             
             # Determine if playing or paused
-            is_corked = sink_input.get("corked", False)
-            state = PlaybackState.PAUSED if is_corked else PlaybackState.PLAYING
+            state = _PLAY_STATES[bool(sink_input.get("corked", False))]
             
             # Get stream volume from sink-input (fallback)
             stream_volume = sink_input.get("volume", 100)
             
             # Get metadata from MPRIS if available (includes volume for Spotify)
             metadata = {}
-            if source_type == AudioSource.SPOTIFY:
+            if source_type is AudioSource.SPOTIFY:
                 metadata = self._get_mpris_metadata(source_type)
             
             # Prefer MPRIS volume over stream volume for Spotify
@@ -390,10 +732,12 @@ class AudioListener:
                 album=metadata.get("album", ""),
             )
             
-            if state == PlaybackState.PLAYING:
+            if state is PlaybackState.PLAYING:
                 active_sources.append(source_name)
         
-        self._update_state(active_sources, source_states)
+        # Sorted so the change check in _update_state is a plain tuple compare
+        active_sources.sort()
+        return self._update_state(active_sources, source_states)
 
     def _run(self) -> None:
         """Main listener loop."""
@@ -401,16 +745,162 @@ class AudioListener:
         
         self._init_dbus()
         
+        # Preferred: libpulse events, then `pactl subscribe`, then plain polling
+        if self.use_libpulse and HAS_PULSECTL:
+            try:
+                self._run_pulse_events()
+            except Exception as e:
+                logger.warning(f"libpulse subscription failed, falling back to pactl: {e}")
+        elif self.use_libpulse:
+            logger.info("pulsectl not installed, using pactl for sink-inputs")
+        
+        if self._running:
+            try:
+                self._run_pactl_subscribe()
+            except Exception as e:
+                logger.warning(f"pactl subscribe failed, falling back to polling: {e}")
+        
+        # Back off exponentially while polls keep reporting no change
+        idle_streak = 0
+        max_interval = max(self.poll_interval, self.MAX_IDLE_POLL_INTERVAL)
+        
         while self._running:
             try:
-                self._poll_state()
-                time.sleep(self.poll_interval)
+                self._mpris_dirty = False
+                if self._poll_state():
+                    idle_streak = 0
+                else:
+                    idle_streak = min(idle_streak + 1, 8)
+                self._wait_for_events(min(self.poll_interval * (1 << idle_streak), max_interval))
             except Exception as e:
                 logger.error(f"Error in audio listener loop: {e}")
                 time.sleep(2.0)
         
         logger.info("Audio listener thread stopped")
 
+    def _refresh_after_events(self, pulse: pulsectl.Pulse | None = None) -> None:
+        """
+        Re-read state if a PulseAudio event or MPRIS signal arrived.
+        
+        Without D-Bus signal dispatch, also refresh while playing so MPRIS
+        metadata changes are picked up.
+        """
+        if not self._take_refresh():
+            return
+        
+        try:
+            self._poll_state(pulse)
+        except Exception as e:
+            if HAS_PULSECTL and isinstance(e, pulsectl.PulseError):
+                raise  # Connection lost - let the caller fall back
+            logger.error(f"Error in audio listener loop: {e}")
+
+    async def _arefresh_after_events(self) -> None:
+        """_refresh_after_events for the asyncio loop; pactl runs off the loop thread."""
+        if not self._take_refresh():
+            return
+        
+        try:
+            await self._apoll_state()
+        except Exception as e:
+            logger.error(f"Error in audio listener loop: {e}")
+
+    def _take_refresh(self) -> bool:
+        """Dispatch pending D-Bus signals and consume the dirty flags; True if a re-read is due."""
+        self._dispatch_dbus_events()
+        
+        poll_metadata = self._glib_context is None and bool(self._state.active_sources)
+        if not (self._pulse_dirty or self._mpris_dirty or poll_metadata):
+            return False
+        
+        self._pulse_dirty = False
+        self._mpris_dirty = False
+        return True
+
+    async def _apoll_state(self) -> bool:
+        """_poll_state without blocking the event loop on the pactl subprocess."""
+        loop = asyncio.get_running_loop()
+        sink_inputs = await loop.run_in_executor(None, self._get_pulse_sink_inputs)
+        return self._poll_state(sink_inputs=sink_inputs)
+
+    def _on_pulse_event(self, event: pulsectl.PulseEventInfo) -> None:
+        """Handle a PulseAudio sink-input event (runs inside event_listen)."""
+        self._pulse_dirty = True
+        # libpulse calls can't be made from the callback - return to the loop
+        raise pulsectl.PulseLoopStop
+
+    def _run_pulse_events(self) -> None:
+        """Event-driven loop: re-read sink-inputs only when PulseAudio reports a change."""
+        with pulsectl.Pulse("media-bridge") as pulse:
+            pulse.event_mask_set("sink_input")
+            pulse.event_callback_set(self._on_pulse_event)
+            logger.info("Subscribed to PulseAudio sink-input events")
+            
+            self._poll_state(pulse)
+            
+            while self._running:
+                pulse.event_listen(timeout=self.poll_interval)
+                self._refresh_after_events(pulse)
+
+    def _run_pactl_subscribe(self) -> None:
+        """Run the `pactl subscribe` loop on an asyncio event loop in this thread."""
+        loop_factory = None
+        if HAS_ASYNCIO_GLIB and self._glib_context is not None:
+            # D-Bus signals are then dispatched by the asyncio loop itself
+            loop_factory = functools.partial(
+                asyncio_glib.GLibEventLoop, main_context=self._glib_context
+            )
+        
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(self._arun_pactl_subscribe())
+
+    async def _arun_pactl_subscribe(self) -> None:
+        """Event-driven loop using a long-running `pactl subscribe` process."""
+        proc = await asyncio.create_subprocess_exec(
+            PACTL, "subscribe",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            close_fds=False,
+        )
+        logger.info("Subscribed to PulseAudio events via pactl subscribe")
+        
+        self._wake_event = asyncio.Event()
+        reader = asyncio.create_task(self._read_pactl_events(proc))
+        try:
+            await self._apoll_state()
+            
+            while self._running:
+                waiter = asyncio.create_task(self._wake_event.wait())
+                await asyncio.wait(
+                    {reader, waiter},
+                    timeout=self.poll_interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                waiter.cancel()
+                if reader.done():
+                    reader.result()  # Re-raise why pactl stopped
+                
+                self._wake_event.clear()
+                await self._arefresh_after_events()
+        finally:
+            self._wake_event = None
+            reader.cancel()
+            if proc.returncode is None:
+                proc.terminate()
+                try:
+                    await asyncio.wait_for(proc.wait(), timeout=2)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+
+    async def _read_pactl_events(self, proc: asyncio.subprocess.Process) -> None:
+        """Flag sink-input events from `pactl subscribe` and wake the loop."""
+        while line := await proc.stdout.readline():
+            if _PACTL_EVENT_RE.match(line):
+                self._pulse_dirty = True
+                self._wake_event.set()
+        raise RuntimeError(f"pactl subscribe exited ({await proc.wait()})")
+
     def start(self) -> None:
         """Start the audio listener thread."""
         if self._running:
@@ -450,25 +940,12 @@ class AudioListener:
             return False
         
         try:
-            import dbus
-            
-            obj = self._bus.get_object("org.freedesktop.DBus", "/org/freedesktop/DBus")
-            iface = dbus.Interface(obj, "org.freedesktop.DBus")
-            names = iface.ListNames()
-            
-            # Find MPRIS players
-            players = [n for n in names if n.startswith("org.mpris.MediaPlayer2.")]
-            if not players:
+            # Prefer spotifyd, fall back to any MPRIS player
+            target = self._resolve_mpris(AudioSource.SPOTIFY) or self._resolve_mpris(AudioSource.UNKNOWN)
+            if not target:
                 logger.warning("No MPRIS players found")
                 return False
             
-            # Prefer spotifyd
-            target = players[0]
-            for p in players:
-                if "spotify" in p.lower():
-                    target = p
-                    break
-            
             obj = self._bus.get_object(target, "/org/mpris/MediaPlayer2")
             player = dbus.Interface(obj, "org.mpris.MediaPlayer2.Player")
             
@@ -478,6 +955,8 @@ class AudioListener:
             
         except Exception as e:
             logger.error(f"Error sending MPRIS command: {e}")
+            for source in list(self._mpris_targets):
+                self._evict_mpris(source)
             return False
 
     def set_source_volume(self, source: str, volume: int) -> bool:
@@ -501,19 +980,8 @@ class AudioListener:
             return False
         
         try:
-            import dbus
-            
-            obj = self._bus.get_object("org.freedesktop.DBus", "/org/freedesktop/DBus")
-            iface = dbus.Interface(obj, "org.freedesktop.DBus")
-            names = iface.ListNames()
-            
             # Find spotifyd
-            target = None
-            for name in names:
-                if name.startswith("org.mpris.MediaPlayer2.") and "spotify" in name.lower():
-                    target = name
-                    break
-            
+            target = self._resolve_mpris(AudioSource.SPOTIFY)
             if not target:
                 logger.warning("Spotifyd not found on D-Bus")
                 return False
@@ -533,4 +1001,5 @@ class AudioListener:
             
         except Exception as e:
             logger.error(f"Error setting Spotify volume: {e}")
+            self._evict_mpris(AudioSource.SPOTIFY)
             return False
@@ -3,26 +3,91 @@ HDMI-CEC listener using cec-ctl (Linux kernel CEC API).
 
 Uses cec-ctl for CEC communication and pactl for PulseAudio volume control.
 Based on proven bash script approach for RPi5 vc4-hdmi.
+
+TV power status requests and power on/standby commands are transmitted directly on
+the CEC device (CEC_TRANSMIT ioctl); the TV's replies arrive on the cec-ctl message
+stream.
 """
 
 from __future__ import annotations
 
+import ctypes
+import fcntl
+import functools
 import logging
 import os
 import re
+import select
 import subprocess
 import threading
 import time
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import Callable
 
 logger = logging.getLogger(__name__)
 
+# Linux CEC uAPI (linux/cec.h)
+CEC_MAX_MSG_SIZE = 16
+CEC_TX_STATUS_NACK = 0x04
+CEC_LOG_ADDR_TV = 0
+CEC_LOG_ADDR_UNREGISTERED = 15
+CEC_MSG_IMAGE_VIEW_ON = 0x04
+CEC_MSG_STANDBY = 0x36
+CEC_MSG_GIVE_DEVICE_POWER_STATUS = 0x8F
+
+
+class CECMsg(ctypes.Structure):
+    """struct cec_msg"""
+    _fields_ = [
+        ("tx_ts", ctypes.c_uint64),
+        ("rx_ts", ctypes.c_uint64),
+        ("len", ctypes.c_uint32),
+        ("timeout", ctypes.c_uint32),
+        ("sequence", ctypes.c_uint32),
+        ("flags", ctypes.c_uint32),
+        ("msg", ctypes.c_uint8 * CEC_MAX_MSG_SIZE),
+        ("reply", ctypes.c_uint8),
+        ("rx_status", ctypes.c_uint8),
+        ("tx_status", ctypes.c_uint8),
+        ("tx_arb_lost_cnt", ctypes.c_uint8),
+        ("tx_nack_cnt", ctypes.c_uint8),
+        ("tx_low_drive_cnt", ctypes.c_uint8),
+        ("tx_error_cnt", ctypes.c_uint8),
+    ]
+
+
+# _IOWR('a', 5, struct cec_msg)
+CEC_TRANSMIT = (3 << 30) | (ctypes.sizeof(CECMsg) << 16) | (ord("a") << 8) | 5
+
+# One pass per cec-ctl output line; the matching group name selects the action.
+# cec-ctl prints operands (ui-cmd, pwr-state) on their own line after the opcode.
+_CEC_RE = re.compile(
+    rb"(?:user[ _]control[ _]pressed|ui-cmd:).*?(?:"
+    rb"(?P<volume_up>volume[ -]up)"
+    rb"|(?P<volume_down>volume[ -]down)"
+    rb"|(?P<mute_toggle>mute|restore-volume))"
+    rb"|(?P<power_on>(?:pwr-state|power-status):\s*on\b)"
+    rb"|(?P<power_off>(?:pwr-state|power-status):\s*(?:standby|off))"
+    rb"|(?P<standby>(?:received|>>).*?standby)"
+    rb"|(?P<tv_on>received.*?(?:active source|image view on))",
+    re.IGNORECASE,
+)
 
-@dataclass
+
+def _cec_transmit(fd: int, initiator: int, dest: int, *payload: int) -> CECMsg:
+    """Transmit a CEC message and wait for it to be sent. Returns the completed message."""
+    msg = CECMsg()
+    msg.len = 1 + len(payload)
+    msg.msg[0] = (initiator << 4) | dest
+    for i, byte in enumerate(payload, 1):
+        msg.msg[i] = byte
+    fcntl.ioctl(fd, CEC_TRANSMIT, msg)
+    return msg
+
+
+@dataclass(frozen=True, slots=True)
 class CECState:
-    """Current state from CEC."""
+    """Current state from CEC (immutable - replaced on change)."""
     tv_power: bool = False
     last_update: float = field(default_factory=time.time)
 
@@ -58,41 +123,93 @@ class CECListener:
         self.volume_step = volume_step
         
         self._state = CECState()
-        self._lock = threading.Lock()
         self._running = False
+        self._stop = threading.Event()  # Wakes the monitor loop promptly on stop()
         self._cec_thread: threading.Thread | None = None
         self._cec_available = False
         self._dev_num = "0"
+        self._log_addr = CEC_LOG_ADDR_UNREGISTERED
+        self._cec_fd: int | None = None
+        self._edid_cache: str | None = None  # "" once scanned and nothing found
+        
+        # _CEC_RE group name -> action
+        self._cec_actions: dict[str, Callable[[], None]] = {
+            "volume_up": functools.partial(self._volume_command, "volume_up"),
+            "volume_down": functools.partial(self._volume_command, "volume_down"),
+            "mute_toggle": functools.partial(self._volume_command, "mute_toggle"),
+            "power_on": functools.partial(self._update_power, True),
+            "power_off": functools.partial(self._update_power, False),
+            "standby": functools.partial(self._update_power, False),
+            "tv_on": functools.partial(self._update_power, True),
+        }
 
     @property
     def state(self) -> CECState:
-        with self._lock:
-            return CECState(
-                tv_power=self._state.tv_power,
-                last_update=self._state.last_update,
-            )
+        # CECState is immutable and replaced with a single assignment - no lock needed
+        return self._state
 
     def _get_dev_num(self) -> str:
         """Extract device number from device path."""
-        match = re.search(r'cec(\d+)', self.device)
-        return match.group(1) if match else "0"
+        dev_num = self.device.rpartition("cec")[2]
+        return dev_num if dev_num.isdigit() else "0"
 
     def _find_hdmi_edid(self) -> str | None:
-        """Find connected HDMI EDID file for physical address."""
-        drm_path = Path("/sys/class/drm")
-        for d in drm_path.glob("*HDMI-A-*"):
-            status_file = d / "status"
-            if status_file.exists():
-                try:
-                    status = status_file.read_text().strip()
-                    if status == "connected":
-                        edid_file = d / "edid"
-                        if edid_file.exists():
-                            return str(edid_file)
-                except Exception:
-                    pass
+        """Find connected HDMI EDID file for physical address (cached after first scan)."""
+        if self._edid_cache is None:
+            self._edid_cache = self._scan_hdmi_edid("/sys/class/drm", depth=2) or ""
+        return self._edid_cache or None
+
+    @classmethod
+    def _scan_hdmi_edid(cls, path: str, depth: int) -> str | None:
+        """Scan a DRM directory for a connected HDMI connector, descending into cards."""
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return None
+        
+        for entry in entries:
+            if "HDMI-A-" not in entry.name:
+                continue
+            try:
+                with open(f"{entry.path}/status", "rb") as f:
+                    if not f.read(10).startswith(b"connected"):
+                        continue
+            except OSError:
+                continue
+            edid_file = f"{entry.path}/edid"
+            if os.path.exists(edid_file):
+                return edid_file
+        
+        # Connectors nested under their card (KVM / multi-GPU layouts)
+        if depth > 1:
+            for entry in entries:
+                if entry.name.startswith("card") and "-" not in entry.name:
+                    if edid_file := cls._scan_hdmi_edid(entry.path, depth - 1):
+                        return edid_file
         return None
 
+    def _register_cec(self, device_type: str, osd_name: str, edid_file: str | None) -> str:
+        """
+        Register as a CEC device type, enable System Audio Mode and read back the
+        logical address - all in one cec-ctl invocation.
+        
+        Returns the logical address as printed by cec-ctl ("15" if unknown).
+        """
+        cmd = ["cec-ctl", "-d", self._dev_num, device_type, "--osd-name", osd_name]
+        if edid_file:
+            cmd.extend(["--phys-addr-from-edid", edid_file])
+        cmd.extend(["--set-system-audio-mode", "sys-aud-status=on", "-l"])
+        
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        if result.returncode != 0:
+            return "15"
+        # -l prints the address on a line of its own, among the adapter info
+        for line in reversed(result.stdout.splitlines()):
+            if line.strip().isdigit():
+                return line.strip()
+        return "15"
+
     def _init_cec(self) -> bool:
         """Initialize CEC adapter - try Audio System first, fall back to Playback."""
         self._dev_num = self._get_dev_num()
@@ -104,67 +221,19 @@ class CECListener:
             logger.info(f"Using EDID from {edid_file}")
         
         try:
-            # Step 1: Clear any existing logical addresses
-            subprocess.run(
-                ["cec-ctl", "-d", self._dev_num, "--clear"],
-                capture_output=True,
-                timeout=5,
-            )
-            
-            # Step 2: Try to register as Audio System first (for volume control)
-            audio_cmd = ["cec-ctl", "-d", self._dev_num, "--audio", "--osd-name", "Pi Audio"]
-            if edid_file:
-                audio_cmd.extend(["--phys-addr-from-edid", edid_file])
-            
-            subprocess.run(audio_cmd, capture_output=True, text=True, timeout=10)
-            
-            # Check if Audio System registration worked
-            check = subprocess.run(
-                ["cec-ctl", "-d", self._dev_num, "-l"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            la = check.stdout.strip().split('\n')[-1] if check.returncode == 0 else "15"
+            # Try to register as Audio System first (for volume control)
+            la = self._register_cec("--audio", "Pi Audio", edid_file)
             
             if la == "5":
                 logger.info("Registered as Audio System (address 5) - volume commands enabled")
-                # Enable System Audio Mode
-                subprocess.run(
-                    ["cec-ctl", "-d", self._dev_num, "--set-system-audio-mode", "sys-aud-status=on"],
-                    capture_output=True,
-                    timeout=5,
-                )
             else:
-                # Fall back to Playback device (this usually works)
+                # Fall back to Playback device (this usually works). System Audio
+                # Mode is still requested (might work for some TVs)
                 logger.info("Audio System not available, registering as Playback device")
-                subprocess.run(
-                    ["cec-ctl", "-d", self._dev_num, "--clear"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                playback_cmd = ["cec-ctl", "-d", self._dev_num, "--playback", "--osd-name", "Pi Media"]
-                if edid_file:
-                    playback_cmd.extend(["--phys-addr-from-edid", edid_file])
-                subprocess.run(playback_cmd, capture_output=True, text=True, timeout=10)
-                
-                # Still try to enable System Audio Mode (might work for some TVs)
-                subprocess.run(
-                    ["cec-ctl", "-d", self._dev_num, "--set-system-audio-mode", "sys-aud-status=on"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                
-                # Get final address
-                check = subprocess.run(
-                    ["cec-ctl", "-d", self._dev_num, "-l"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                la = check.stdout.strip().split('\n')[-1] if check.returncode == 0 else "?"
+                la = self._register_cec("--playback", "Pi Media", edid_file)
                 logger.info(f"Registered as Playback device (address {la})")
             
+            self._log_addr = int(la)
             self._cec_available = True
             logger.info(f"CEC initialized on /dev/cec{self._dev_num}")
             return True
@@ -180,58 +249,58 @@ class CECListener:
             return False
 
     def _update_power(self, power_on: bool) -> None:
-        """Update TV power state."""
-        with self._lock:
-            if self._state.tv_power != power_on:
-                self._state.tv_power = power_on
-                self._state.last_update = time.time()
-                logger.info(f"TV power changed: {power_on}")
-                if self.on_state_change:
-                    self.on_state_change("tv_power", power_on)
+        """Update TV power state (only called from the monitor thread)."""
+        if self._state.tv_power != power_on:
+            self._state = CECState(tv_power=power_on)
+            logger.info(f"TV power changed: {power_on}")
+            if self.on_state_change:
+                self.on_state_change("tv_power", power_on)
 
     def _poll_tv_power(self) -> None:
-        """Poll TV power status via CEC."""
-        if not self._cec_available:
+        """Ask the TV for its power status; the reply arrives on the monitor stream."""
+        if self._cec_fd is None:
             return
         
         try:
-            # Send power status request to TV (address 0)
-            result = subprocess.run(
-                ["cec-ctl", "-d", self._dev_num, "--to", "0", "--give-device-power-status"],
-                capture_output=True,
-                text=True,
-                timeout=5,
+            msg = _cec_transmit(
+                self._cec_fd, self._log_addr, CEC_LOG_ADDR_TV, CEC_MSG_GIVE_DEVICE_POWER_STATUS
             )
-            
-            output = result.stdout + result.stderr
-            output_lower = output.lower()
-            
-            # Parse power status from response (handles both "pwr-state" and "power-status")
-            if "pwr-state: on" in output_lower or "power-status: on" in output_lower:
-                self._update_power(True)
-            elif any(x in output_lower for x in ["pwr-state: standby", "power-status: standby", 
-                                                   "pwr-state: off", "power-status: off"]):
+            # No acknowledgement usually means the TV is off or disconnected
+            if msg.tx_status & CEC_TX_STATUS_NACK:
                 self._update_power(False)
-            # If no response or error, TV might be off or not responding
-            elif "timed out" in output_lower or "not present" in output_lower or "failed" in output_lower:
-                self._update_power(False)
-            
-            logger.debug(f"TV power poll result: {output[:100]}")
-                
-        except subprocess.TimeoutExpired:
-            # Timeout usually means TV is off
-            self._update_power(False)
-        except Exception as e:
-            logger.debug(f"Error polling TV power: {e}")
+        except OSError as e:
+            logger.debug("Error polling TV power: %s", e)
+
+    def _volume_command(self, command: str) -> None:
+        """Pass a volume command from the TV remote to the callback."""
+        logger.info(f"CEC: {command}")
+        if self.on_volume_command:
+            self.on_volume_command(command)
+
+    def _handle_cec_line(self, line: bytes) -> None:
+        """Handle one line of cec-ctl --wait-for-msgs output."""
+        match = _CEC_RE.search(line)
+        if match is None:
+            return
+        
+        # Hot path - only decode the line when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("CEC: %s", line.decode(errors="replace"))
+        self._cec_actions[match.lastgroup]()
 
     def _run_cec_monitor(self) -> None:
-        """Monitor CEC bus for events including volume commands."""
+        """Monitor CEC bus for events and periodically poll TV power status."""
         logger.info("CEC monitor thread started")
         
         if not self._init_cec():
             logger.error("CEC init failed, monitor thread exiting")
             return
         
+        try:
+            self._cec_fd = os.open(self.device, os.O_RDWR)
+        except OSError as e:
+            logger.warning(f"Cannot open {self.device}, TV power polling disabled: {e}")
+        
         while self._running:
             try:
                 # Use --wait-for-msgs to receive CEC messages
@@ -240,85 +309,58 @@ class CECListener:
                     ["cec-ctl", "-d", self._dev_num, "--wait-for-msgs"],
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
+                    bufsize=0,
                 )
                 
                 logger.info("CEC monitor listening for messages...")
                 
-                for line in iter(proc.stdout.readline, ''):
-                    if not self._running:
-                        break
-                    
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    line_lower = line.lower()
-                    
-                    # Log CEC traffic at debug level
-                    if "received" in line_lower or "user control" in line_lower:
-                        logger.debug(f"CEC: {line}")
-                    
-                    # Handle volume controls - look for User Control Pressed messages
-                    # Format: "User Control Pressed" or "USER_CONTROL_PRESSED"
-                    if "user control pressed" in line_lower or "user_control_pressed" in line_lower:
-                        if "volume up" in line_lower or "volume-up" in line_lower or "ui-cmd: volume up" in line_lower:
-                            logger.info("CEC: Volume UP")
-                            if self.on_volume_command:
-                                self.on_volume_command("volume_up")
-                        elif "volume down" in line_lower or "volume-down" in line_lower or "ui-cmd: volume down" in line_lower:
-                            logger.info("CEC: Volume DOWN")
-                            if self.on_volume_command:
-                                self.on_volume_command("volume_down")
-                        elif "mute" in line_lower or "mute-function" in line_lower or "restore-volume" in line_lower:
-                            logger.info("CEC: Mute toggle")
-                            if self.on_volume_command:
-                                self.on_volume_command("mute_toggle")
-                    
-                    # Handle power status changes
-                    if "report-power-status" in line_lower or "report power status" in line_lower:
-                        if "pwr-state: on" in line_lower or "power-status: on" in line_lower:
-                            self._update_power(True)
-                        elif "pwr-state: standby" in line_lower or "power-status: standby" in line_lower:
-                            self._update_power(False)
-                    
-                    # Handle standby broadcast
-                    if "standby" in line_lower and ("received" in line_lower or ">>" in line):
-                        self._update_power(False)
-                    
-                    # Handle active source / image view on (TV turning on)
-                    if ("active source" in line_lower or "image view on" in line_lower) and "received" in line_lower:
-                        self._update_power(True)
-                
-                proc.terminate()
                 try:
-                    proc.wait(timeout=2)
-                except subprocess.TimeoutExpired:
-                    proc.kill()
+                    fd = proc.stdout.fileno()
+                    poller = select.poll()
+                    poller.register(fd, select.POLLIN)
+                    buf = bytearray()
+                    next_poll = time.monotonic()
+                    
+                    while not self._stop.is_set():
+                        # Wait for CEC traffic until the next power poll is due,
+                        # at most 250ms so stop() is noticed quickly
+                        timeout_ms = min(250, max(0, int((next_poll - time.monotonic()) * 1000)))
+                        if poller.poll(timeout_ms):
+                            chunk = os.read(fd, 4096)
+                            if not chunk:
+                                break  # cec-ctl exited
+                            
+                            buf += chunk
+                            end = buf.rfind(b"\n")
+                            if end >= 0:
+                                # Whole lines only - any partial line stays in buf
+                                for line in buf[:end].splitlines():
+                                    if line:
+                                        self._handle_cec_line(line)
+                                del buf[:end + 1]
+                        
+                        if time.monotonic() >= next_poll:
+                            self._poll_tv_power()
+                            next_poll = time.monotonic() + self.poll_interval
+                finally:
+                    proc.terminate()
+                    try:
+                        proc.wait(timeout=2)
+                    except subprocess.TimeoutExpired:
+                        proc.kill()
                 
             except Exception as e:
                 logger.error(f"CEC monitor error: {e}")
             
             if self._running:
                 logger.info("CEC monitor restarting in 2s...")
-                time.sleep(2)
+                self._stop.wait(2)
         
-        logger.info("CEC monitor thread stopped")
-
-    def _run_power_poll(self) -> None:
-        """Periodically poll TV power status."""
-        logger.info("TV power poll thread started")
-        
-        while self._running:
-            try:
-                self._poll_tv_power()
-                time.sleep(self.poll_interval)
-            except Exception as e:
-                logger.error(f"TV power poll error: {e}")
-                time.sleep(2.0)
+        if self._cec_fd is not None:
+            os.close(self._cec_fd)
+            self._cec_fd = None
         
-        logger.info("TV power poll thread stopped")
+        logger.info("CEC monitor thread stopped")
 
     def start(self) -> None:
         """Start the CEC listener."""
@@ -326,8 +368,9 @@ class CECListener:
             return
         
         self._running = True
+        self._stop.clear()
         
-        # Start CEC monitor thread (handles messages and volume commands)
+        # Start CEC monitor thread (handles messages, volume commands and power polling)
         self._cec_thread = threading.Thread(
             target=self._run_cec_monitor,
             name="cec-monitor",
@@ -335,61 +378,44 @@ class CECListener:
         )
         self._cec_thread.start()
         
-        # Start power poll thread (periodic TV power check)
-        self._power_poll_thread = threading.Thread(
-            target=self._run_power_poll,
-            name="power-poll",
-            daemon=True,
-        )
-        self._power_poll_thread.start()
-        
         logger.info("CEC listener started")
 
     def stop(self) -> None:
         """Stop the CEC listener."""
         self._running = False
+        self._stop.set()
         
         if self._cec_thread:
             self._cec_thread.join(timeout=5.0)
             self._cec_thread = None
         
-        if hasattr(self, '_power_poll_thread') and self._power_poll_thread:
-            self._power_poll_thread.join(timeout=5.0)
-            self._power_poll_thread = None
-        
         logger.info("CEC listener stopped")
 
     # TV power control methods
 
-    def tv_on(self) -> bool:
-        """Turn TV on via CEC."""
-        if not self._cec_available:
+    def _transmit_to_tv(self, opcode: int) -> bool:
+        """Send a single-opcode CEC message to the TV. Returns True if acknowledged."""
+        if not self._cec_available or self._cec_fd is None:
             return False
         
+        msg = _cec_transmit(self._cec_fd, self._log_addr, CEC_LOG_ADDR_TV, opcode)
+        if msg.tx_status & CEC_TX_STATUS_NACK:
+            raise OSError("TV did not acknowledge")
+        return True
+
+    def tv_on(self) -> bool:
+        """Turn TV on via CEC."""
         try:
-            subprocess.run(
-                ["cec-ctl", "-d", self._dev_num, "--to", "0", "--image-view-on"],
-                check=True,
-                timeout=5,
-            )
-            return True
-        except Exception as e:
+            return self._transmit_to_tv(CEC_MSG_IMAGE_VIEW_ON)
+        except OSError as e:
             logger.error(f"Failed to turn TV on: {e}")
             return False
 
     def tv_off(self) -> bool:
         """Turn TV off (standby) via CEC."""
-        if not self._cec_available:
-            return False
-        
         try:
-            subprocess.run(
-                ["cec-ctl", "-d", self._dev_num, "--to", "0", "--standby"],
-                check=True,
-                timeout=5,
-            )
-            return True
-        except Exception as e:
+            return self._transmit_to_tv(CEC_MSG_STANDBY)
+        except OSError as e:
             logger.error(f"Failed to turn TV off: {e}")
             return False
 
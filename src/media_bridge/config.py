@@ -9,24 +9,42 @@ Supports:
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
-DEFAULT_CONFIG_PATHS = [
-    Path("/etc/media-bridge/config.yaml"),
-    Path.home() / ".config" / "media-bridge" / "config.yaml",
-    Path("config.yaml"),
-]
 
+@functools.cache
+def _default_paths() -> tuple[str, ...]:
+    """Default config file locations, in search order (resolved on first use)."""
+    return (
+        "/etc/media-bridge/config.yaml",
+        os.path.expanduser("~/.config/media-bridge/config.yaml"),
+        "config.yaml",
+    )
+
+
+def _populate(cls: type, data: dict[str, Any]) -> Any:
+    """Build a config dataclass from the keys of data that name its fields.
 
-@dataclass
+    Missing keys fall back to the dataclass defaults; unknown keys are ignored.
+    """
+    return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+@dataclass(frozen=True, slots=True)
 class MQTTConfig:
     """MQTT broker configuration."""
     host: str = "localhost"
@@ -39,7 +57,7 @@ class MQTTConfig:
     reconnect_delay: float = 5.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CECConfig:
     """HDMI-CEC and PulseAudio configuration."""
     enabled: bool = True
@@ -49,7 +67,7 @@ class CECConfig:
     volume_step: int = 5  # Volume change per step (%)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VolumeConfig:
     """Volume configuration for all sources."""
     # Master volume (0-100) - scales all output, default 50% for safety
@@ -64,7 +82,7 @@ class VolumeConfig:
     slew_rate: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AudioConfig:
     """Audio stack configuration."""
     enabled: bool = True
@@ -73,11 +91,13 @@ class AudioConfig:
     tv_alsa_device: str = "hw:CARD=ClearClick,DEV=0"
     # Output sink (auto-detect Scarlett if None)
     pulse_sink: str | None = None
+    # Pin the AirPlay metadata/poll thread to the last CPU core (Linux only)
+    airplay_cpu_affinity: bool = False
     # Volume settings
     volume: VolumeConfig = field(default_factory=VolumeConfig)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LogConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -85,7 +105,28 @@ class LogConfig:
     file: str | None = None
 
 
-@dataclass
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in _TRUE_VALUES
+
+
+# Environment variable -> (config section, field, parser)
+_ENV_OVERRIDES = (
+    ("MQTT_HOST", "mqtt", "host", str),
+    ("MQTT_PORT", "mqtt", "port", int),
+    ("MQTT_USERNAME", "mqtt", "username", str),
+    ("MQTT_PASSWORD", "mqtt", "password", str),
+    ("MQTT_TOPIC_PREFIX", "mqtt", "topic_prefix", str),
+    ("CEC_ENABLED", "cec", "enabled", _parse_bool),
+    ("CEC_DEVICE", "cec", "device", str),
+    ("AUDIO_ENABLED", "audio", "enabled", _parse_bool),
+    ("LOG_LEVEL", "log", "level", str.upper),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Main configuration container."""
     mqtt: MQTTConfig = field(default_factory=MQTTConfig)
@@ -96,87 +137,39 @@ class Config:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Config:
         """Create Config from dictionary."""
-        mqtt_data = data.get("mqtt", {})
-        cec_data = data.get("cec", {})
-        audio_data = data.get("audio", {})
-        log_data = data.get("log", {})
+        audio_data = data.get("audio") or {}
 
         return cls(
-            mqtt=MQTTConfig(
-                host=mqtt_data.get("host", "localhost"),
-                port=mqtt_data.get("port", 1883),
-                username=mqtt_data.get("username"),
-                password=mqtt_data.get("password"),
-                client_id=mqtt_data.get("client_id", "media-bridge-living-room"),
-                topic_prefix=mqtt_data.get("topic_prefix", "media/living_room"),
-                keepalive=mqtt_data.get("keepalive", 60),
-                reconnect_delay=mqtt_data.get("reconnect_delay", 5.0),
-            ),
-            cec=CECConfig(
-                enabled=cec_data.get("enabled", True),
-                device=cec_data.get("device", "/dev/cec0"),
-                poll_interval=cec_data.get("poll_interval", 5.0),
-                pulse_sink=cec_data.get("pulse_sink"),
-                volume_step=cec_data.get("volume_step", 5),
-            ),
-            audio=AudioConfig(
-                enabled=audio_data.get("enabled", True),
-                poll_interval=audio_data.get("poll_interval", 1.0),
-                tv_alsa_device=audio_data.get("tv_alsa_device", "hw:CARD=ClearClick,DEV=0"),
-                pulse_sink=audio_data.get("pulse_sink"),
-                volume=VolumeConfig(
-                    master=audio_data.get("volume", {}).get("master", 100),
-                    default_spotify=audio_data.get("volume", {}).get("default_spotify", 15),
-                    default_airplay=audio_data.get("volume", {}).get("default_airplay", 15),
-                    default_tv=audio_data.get("volume", {}).get("default_tv", 15),
-                    reset_on_stop=audio_data.get("volume", {}).get("reset_on_stop", True),
-                    slew_rate=audio_data.get("volume", {}).get("slew_rate", 25),
-                ),
-            ),
-            log=LogConfig(
-                level=log_data.get("level", "INFO"),
-                format=log_data.get(
-                    "format",
-                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-                ),
-                file=log_data.get("file"),
-            ),
+            mqtt=_populate(MQTTConfig, data.get("mqtt") or {}),
+            cec=_populate(CECConfig, data.get("cec") or {}),
+            audio=_populate(AudioConfig, {
+                **audio_data,
+                "volume": _populate(VolumeConfig, audio_data.get("volume") or {}),
+            }),
+            log=_populate(LogConfig, data.get("log") or {}),
         )
 
     @classmethod
-    def from_yaml(cls, path: Path) -> Config:
+    def from_yaml(cls, path: str | Path) -> Config:
         """Load config from YAML file."""
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader) or {}
         return cls.from_dict(data)
 
-    def apply_env_overrides(self) -> None:
-        """Apply environment variable overrides."""
-        # MQTT overrides
-        if host := os.environ.get("MQTT_HOST"):
-            self.mqtt.host = host
-        if port := os.environ.get("MQTT_PORT"):
-            self.mqtt.port = int(port)
-        if username := os.environ.get("MQTT_USERNAME"):
-            self.mqtt.username = username
-        if password := os.environ.get("MQTT_PASSWORD"):
-            self.mqtt.password = password
-        if topic_prefix := os.environ.get("MQTT_TOPIC_PREFIX"):
-            self.mqtt.topic_prefix = topic_prefix
-
-        # CEC overrides
-        if cec_enabled := os.environ.get("CEC_ENABLED"):
-            self.cec.enabled = cec_enabled.lower() in ("true", "1", "yes")
-        if cec_device := os.environ.get("CEC_DEVICE"):
-            self.cec.device = cec_device
-
-        # Audio overrides
-        if audio_enabled := os.environ.get("AUDIO_ENABLED"):
-            self.audio.enabled = audio_enabled.lower() in ("true", "1", "yes")
-
-        # Log overrides
-        if log_level := os.environ.get("LOG_LEVEL"):
-            self.log.level = log_level.upper()
+    def apply_env_overrides(self) -> Config:
+        """Return a copy of this config with environment variable overrides applied."""
+        env = os.environ
+        overrides: dict[str, dict[str, Any]] = {}
+        for var, section, name, parse in _ENV_OVERRIDES:
+            if value := env.get(var):
+                overrides.setdefault(section, {})[name] = parse(value)
+
+        if not overrides:
+            return self
+        return replace(self, **{
+            section: replace(getattr(self, section), **values)
+            for section, values in overrides.items()
+        })
 
 
 def load_config(config_path: str | Path | None = None) -> Config:
@@ -193,16 +186,16 @@ def load_config(config_path: str | Path | None = None) -> Config:
     
     # Find config file
     if config_path:
-        path = Path(config_path)
-        if path.exists():
+        path = config_path
+        if os.path.isfile(path):
             logger.info(f"Loading config from {path}")
             config = Config.from_yaml(path)
         else:
             logger.warning(f"Config file not found: {path}, using defaults")
     else:
         # Search default locations
-        for path in DEFAULT_CONFIG_PATHS:
-            if path.exists():
+        for path in _default_paths():
+            if os.path.isfile(path):
                 logger.info(f"Loading config from {path}")
                 config = Config.from_yaml(path)
                 break
@@ -210,30 +203,28 @@ def load_config(config_path: str | Path | None = None) -> Config:
             logger.info("No config file found, using defaults")
     
     # Apply environment overrides
-    config.apply_env_overrides()
-    
-    return config
+    return config.apply_env_overrides()
 
 
 def setup_logging(config: LogConfig) -> None:
     """Configure logging based on config."""
     handlers: list[logging.Handler] = []
+    formatter = logging.Formatter(config.format)
     
     # Console handler
     console = logging.StreamHandler()
-    console.setFormatter(logging.Formatter(config.format))
+    console.setFormatter(formatter)
     handlers.append(console)
     
     # File handler if specified
     if config.file:
         file_handler = logging.FileHandler(config.file)
-        file_handler.setFormatter(logging.Formatter(config.format))
+        file_handler.setFormatter(formatter)
         handlers.append(file_handler)
     
-    # Configure root logger
+    # Configure root logger (formatters are already set on the handlers)
     logging.basicConfig(
         level=getattr(logging, config.level.upper(), logging.INFO),
-        format=config.format,
         handlers=handlers,
         force=True,
     )
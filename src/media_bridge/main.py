@@ -10,20 +10,75 @@ Orchestrates all components:
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
+import queue
+import re
 import signal
 import sys
 import threading
 import time
-from typing import Any
+from collections import OrderedDict
+from dataclasses import dataclass, fields, replace
+from typing import TYPE_CHECKING, Any, Callable
 
-from media_bridge.cec_listener import CECListener
 from media_bridge.config import Config, load_config, setup_logging
-from media_bridge.mixer import AudioMixer
-from media_bridge.mqtt_client import MQTTClient, MQTTConfig
+
+if TYPE_CHECKING:
+    # Imported in MediaBridge.start() so --version and config errors stay fast
+    from media_bridge.cec_listener import CECListener
+    from media_bridge.mixer import AudioMixer
+    from media_bridge.mqtt_client import MQTTClient
 
 logger = logging.getLogger(__name__)
 
+# Boolean command payloads; common spellings hit the first set without lower()
+_TRUTHY = frozenset({"true", "True", "TRUE", "1", "yes", "Yes", "YES", "on", "On", "ON"})
+_TRUTHY_LOWER = frozenset({"true", "1", "yes", "on"})
+
+# Per-source commands: source_<name>_<action>, e.g. source_spotify_set_volume
+_CMD_RE = re.compile(
+    r"source_(?P<src>[a-z]+)_"
+    r"(?P<act>set_volume|set_mute|mute|play|pause|stop|set_default_volume)"
+)
+
+
+def _is_truthy(payload: str) -> bool:
+    return payload in _TRUTHY or payload.lower() in _TRUTHY_LOWER
+
+
+# Bound on per-source bookkeeping keyed by names taken from MQTT commands
+MAX_TRACKED_SOURCES = 128
+
+
+@functools.lru_cache(maxsize=64)
+def _source_topic(source: str, key: str) -> str:
+    """Per-source topic suffix, built once per (source, key)."""
+    return f"source/{source}/{key}"
+
+
+@dataclass(slots=True)
+class BridgeSourceState:
+    """Last reported state of a source (or the "master" pseudo-source)."""
+    state: str = "idle"
+    volume: int = 0
+    muted: bool = False
+    level: int = 0
+    level_db: float = -100.0
+    title: str = ""
+    artist: str = ""
+    default_volume: int | None = None
+    # TV silence detection
+    silence_threshold: int | None = None
+    silence_duration: float | None = None
+    auto_mute: bool | None = None
+    # Master settings
+    reset_on_stop: bool | None = None
+    slew_rate: int | None = None
+
+
+_SOURCE_STATE_FIELDS = frozenset(f.name for f in fields(BridgeSourceState))
+
 
 class MediaBridge:
     """
@@ -35,45 +90,76 @@ class MediaBridge:
     def __init__(self, config: Config):
         self.config = config
         self._running = False
+        self._stop_event = threading.Event()  # Set by stop(); run_forever waits on it
         self._lock = threading.Lock()
         
         # Current combined state
-        self._state: dict[str, Any] = {
-            "tv_power": False,
-            # Per-source state stored as nested dicts
-            "sources": {},
-        }
+        self._tv_power = False
+        self._sources: dict[str, BridgeSourceState] = {}
         
         # Initialize components
         self._mqtt: MQTTClient | None = None
         self._cec: CECListener | None = None
         self._mixer: AudioMixer | None = None
         
-        # Rate limiting for volume commands (prevent feedback loops)
-        self._last_volume_cmd: dict[str, float] = {}
-        self._volume_cmd_cooldown = 0.2  # 200ms between commands per source
+        # Rate limiting for volume commands (prevent feedback loops). Commands
+        # inside the cooldown are coalesced and the latest one applied after it.
+        # time.monotonic_ns() of the last apply, LRU-bounded against arbitrary source names
+        self._last_volume_cmd: OrderedDict[str, int] = OrderedDict()
+        self._volume_cmd_cooldown_ns = 200_000_000  # 200ms between commands per source
+        self._pending_volume: dict[str, threading.Timer] = {}
+        
+        # MQTT commands are queued by the paho network thread and run by a worker,
+        # so slow mixer calls never hold up message delivery
+        self._cmd_queue: queue.Queue[tuple[str, str] | None] = queue.Queue(maxsize=256)
+        self._cmd_worker: threading.Thread | None = None
+        self._initial_publish_timer: threading.Timer | None = None
+        
+        # MQTT command dispatch: exact command names, then source_<name>_<action>
+        self._exact_cmds: dict[str, Callable[[str], None]] = {
+            "tv_power_on": self._cmd_tv_power_on,
+            "tv_power_off": self._cmd_tv_power_off,
+            "tv_set_silence_threshold": self._cmd_tv_set_silence_threshold,
+            "tv_set_silence_duration": self._cmd_tv_set_silence_duration,
+            "tv_set_auto_mute": self._cmd_tv_set_auto_mute,
+            "set_master_volume": self._cmd_set_master_volume,
+            "set_reset_on_stop": self._cmd_set_reset_on_stop,
+            "set_slew_rate": self._cmd_set_slew_rate,
+        }
+        self._source_actions: dict[str, Callable[[str, str], None]] = {
+            "set_volume": self._cmd_source_set_volume,
+            "set_mute": self._cmd_source_set_mute,
+            "mute": self._cmd_source_mute,
+            "play": self._cmd_source_play,
+            "pause": self._cmd_source_pause,
+            "stop": self._cmd_source_stop,
+            "set_default_volume": self._cmd_source_set_default_volume,
+        }
 
     def _on_cec_state_change(self, state_type: str, value: bool | int | str) -> None:
         """Handle CEC state changes (TV power only now)."""
+        if state_type != "tv_power":
+            return
+        
         with self._lock:
-            if state_type == "tv_power":
-                self._state["tv_power"] = value
+            self._tv_power = bool(value)
         
         # Publish to MQTT
-        if self._mqtt:
-            if state_type == "tv_power":
-                self._mqtt.publish("tv/on", value)
+        mqtt = self._mqtt
+        if mqtt:
+            mqtt.publish("tv/on", value)
         
         # Notify mixer of TV power state (enables/disables TV audio pipeline)
-        if state_type == "tv_power" and self._mixer:
-            self._mixer.set_tv_power(bool(value))
+        mixer = self._mixer
+        if mixer:
+            mixer.set_tv_power(bool(value))
 
     def _on_cec_volume_command(self, command: str) -> None:
         """Handle CEC volume commands from TV remote - route to TV source."""
         if not self._mixer:
             return
         
-        logger.info(f"CEC volume command: {command}")
+        logger.info("CEC volume command: %s", command)
         
         if command == "volume_up":
             self._mixer.tv_volume_up(step=self.config.cec.volume_step)
@@ -84,137 +170,194 @@ class MediaBridge:
 
     def _on_source_state_change(self, source: str, key: str, value: Any) -> None:
         """Handle audio source state changes."""
-        logger.debug(f"Source state change: {source}/{key} = {value}")
+        logger.debug("Source state change: %s/%s = %s", source, key, value)
         
-        with self._lock:
-            if source not in self._state["sources"]:
-                self._state["sources"][source] = {}
-            self._state["sources"][source][key] = value
+        if key in _SOURCE_STATE_FIELDS:
+            with self._lock:
+                entry = self._sources.get(source)
+                if entry is None:
+                    entry = self._sources[source] = BridgeSourceState()
+                setattr(entry, key, value)
         
         # Publish to MQTT - per-source topics
-        if self._mqtt:
-            topic = f"source/{source}/{key}"
-            self._mqtt.publish(topic, value)
-            
-            # Also publish active sources list
-            if key == "state":
-                active = self._mixer.get_active_sources() if self._mixer else []
-                self._mqtt.publish("sources/active", active)
+        mqtt = self._mqtt
+        if not mqtt:
+            return
+        mqtt.publish(_source_topic(source, key), value)
+        
+        # Also publish active sources list
+        if key == "state":
+            mixer = self._mixer
+            mqtt.publish("sources/active", mixer.get_active_sources() if mixer else [])
 
     def _on_mqtt_command(self, command: str, payload: str) -> None:
+        """Queue an MQTT command for the worker.
+        
+        Runs on the paho network thread and on volume rate-limit timers.
+        """
+        item = (command, payload)
+        while True:
+            try:
+                self._cmd_queue.put_nowait(item)
+                return
+            except queue.Full:
+                pass
+            # Drop the oldest command - the newest state wins. Another producer
+            # may take the freed slot first, so retry until the put succeeds
+            try:
+                dropped = self._cmd_queue.get_nowait()
+                logger.warning(f"Command queue full, dropping {dropped}")
+            except queue.Empty:
+                pass
+
+    def _run_cmd_worker(self) -> None:
+        """Run queued MQTT commands until a None sentinel arrives."""
+        while (item := self._cmd_queue.get()) is not None:
+            self._handle_command(*item)
+
+    def _handle_command(self, command: str, payload: str) -> None:
         """Handle MQTT commands."""
-        logger.info(f"Processing command: {command}, payload: {payload}")
+        logger.info("Processing command: %s, payload: %s", command, payload)
         
         try:
-            # TV power control (via CEC)
-            if command == "tv_power_on":
-                if self._cec:
-                    self._cec.power_on_tv()
+            handler = self._exact_cmds.get(command)
+            if handler:
+                handler(payload)
+                return
             
-            elif command == "tv_power_off":
-                if self._cec:
-                    self._cec.standby_tv()
+            if match := _CMD_RE.fullmatch(command):
+                self._source_actions[match["act"]](match["src"], payload)
+                return
             
-            # Per-source volume commands (with rate limiting)
-            elif command.startswith("source_") and command.endswith("_set_volume"):
-                # e.g., source_spotify_set_volume
-                source = command[7:-11]  # Extract source name
-                volume = int(payload)
-                
-                # Rate limit to prevent feedback loops from HA slider
-                now = time.time()
-                last_cmd = self._last_volume_cmd.get(source, 0)
-                if now - last_cmd < self._volume_cmd_cooldown:
-                    logger.debug(f"Rate limiting volume command for {source}")
-                    return
-                self._last_volume_cmd[source] = now
-                
-                if self._mixer:
-                    self._mixer.set_source_volume(source, volume)
-            
-            # Note: _set_mute must be checked BEFORE _mute (more specific first)
-            elif command.startswith("source_") and command.endswith("_set_mute"):
-                source = command[7:-9]
-                muted = payload.lower() in ("true", "1", "yes", "on")
-                if self._mixer:
-                    self._mixer.set_source_mute(source, muted)
-            
-            elif command.startswith("source_") and command.endswith("_mute"):
-                source = command[7:-5]
-                if self._mixer:
-                    self._mixer.toggle_source_mute(source)
-            
-            # Playback control
-            elif command.startswith("source_") and command.endswith("_play"):
-                source = command[7:-5]
-                if self._mixer:
-                    self._mixer.source_play(source)
-            
-            elif command.startswith("source_") and command.endswith("_pause"):
-                source = command[7:-6]
-                if self._mixer:
-                    self._mixer.source_pause(source)
-            
-            elif command.startswith("source_") and command.endswith("_stop"):
-                source = command[7:-5]
-                if self._mixer:
-                    self._mixer.source_stop(source)
-            
-            # TV silence detection settings
-            elif command == "tv_set_silence_threshold":
-                threshold = int(payload)
-                if self._mixer:
-                    self._mixer.set_tv_silence_threshold(threshold)
-            
-            elif command == "tv_set_silence_duration":
-                duration = float(payload)
-                if self._mixer:
-                    self._mixer.set_tv_silence_duration(duration)
-            
-            elif command == "tv_set_auto_mute":
-                enabled = payload.lower() in ("true", "1", "yes", "on")
-                if self._mixer:
-                    self._mixer.set_tv_auto_mute(enabled)
-            
-            # Master volume control
-            elif command == "set_master_volume":
-                volume = int(payload)
-                if self._mixer:
-                    self._mixer.set_master_volume(volume)
-            
-            # Default volume settings
-            elif command.startswith("source_") and command.endswith("_set_default_volume"):
-                source = command[7:-19]  # Extract source name
-                volume = int(payload)
-                if self._mixer:
-                    self._mixer.set_default_volume(source, volume)
-            
-            elif command == "set_reset_on_stop":
-                enabled = payload.lower() in ("true", "1", "yes", "on")
-                if self._mixer:
-                    self._mixer.set_reset_on_stop(enabled)
-            
-            elif command == "set_slew_rate":
-                rate = int(payload)
-                if self._mixer:
-                    self._mixer.set_slew_rate(rate)
-            
-            else:
-                logger.warning(f"Unknown command: {command}")
+            logger.warning(f"Unknown command: {command}")
                 
         except ValueError as e:
             logger.error(f"Invalid command payload: {e}")
         except Exception as e:
             logger.error(f"Error processing command {command}: {e}")
 
+    # TV power control (via CEC)
+
+    def _cmd_tv_power_on(self, payload: str) -> None:
+        if self._cec:
+            self._cec.power_on_tv()
+
+    def _cmd_tv_power_off(self, payload: str) -> None:
+        if self._cec:
+            self._cec.standby_tv()
+
+    # Per-source volume and playback commands
+
+    def _cmd_source_set_volume(self, source: str, payload: str) -> None:
+        volume = int(payload)
+        
+        pending = self._pending_volume.pop(source, None)
+        if pending:
+            pending.cancel()  # Superseded by this value
+        
+        # Rate limit to prevent feedback loops from HA slider
+        now = time.monotonic_ns()
+        last_cmd = self._last_volume_cmd.get(source)
+        wait_ns = 0 if last_cmd is None else last_cmd + self._volume_cmd_cooldown_ns - now
+        if wait_ns > 0:
+            # Re-queue the latest value for when the cooldown ends, so the
+            # final position of a slider drag is always applied
+            logger.debug("Rate limiting volume command for %s", source)
+            timer = threading.Timer(
+                wait_ns / 1e9, self._on_mqtt_command, (f"source_{source}_set_volume", payload)
+            )
+            timer.daemon = True
+            self._pending_volume[source] = timer
+            timer.start()
+            return
+        self._last_volume_cmd[source] = now
+        self._last_volume_cmd.move_to_end(source)
+        if len(self._last_volume_cmd) > MAX_TRACKED_SOURCES:
+            self._last_volume_cmd.popitem(last=False)
+        
+        if self._mixer:
+            self._mixer.set_source_volume(source, volume)
+
+    def _cmd_source_set_mute(self, source: str, payload: str) -> None:
+        muted = _is_truthy(payload)
+        if self._mixer:
+            self._mixer.set_source_mute(source, muted)
+
+    def _cmd_source_mute(self, source: str, payload: str) -> None:
+        if self._mixer:
+            self._mixer.toggle_source_mute(source)
+
+    def _cmd_source_play(self, source: str, payload: str) -> None:
+        if self._mixer:
+            self._mixer.source_play(source)
+
+    def _cmd_source_pause(self, source: str, payload: str) -> None:
+        if self._mixer:
+            self._mixer.source_pause(source)
+
+    def _cmd_source_stop(self, source: str, payload: str) -> None:
+        if self._mixer:
+            self._mixer.source_stop(source)
+
+    def _cmd_source_set_default_volume(self, source: str, payload: str) -> None:
+        volume = int(payload)
+        if self._mixer:
+            self._mixer.set_default_volume(source, volume)
+
+    # TV silence detection settings
+
+    def _cmd_tv_set_silence_threshold(self, payload: str) -> None:
+        threshold = int(payload)
+        if self._mixer:
+            self._mixer.set_tv_silence_threshold(threshold)
+
+    def _cmd_tv_set_silence_duration(self, payload: str) -> None:
+        duration = float(payload)
+        if self._mixer:
+            self._mixer.set_tv_silence_duration(duration)
+
+    def _cmd_tv_set_auto_mute(self, payload: str) -> None:
+        enabled = _is_truthy(payload)
+        if self._mixer:
+            self._mixer.set_tv_auto_mute(enabled)
+
+    # Master volume and settings
+
+    def _cmd_set_master_volume(self, payload: str) -> None:
+        volume = int(payload)
+        if self._mixer:
+            self._mixer.set_master_volume(volume)
+
+    def _cmd_set_reset_on_stop(self, payload: str) -> None:
+        enabled = _is_truthy(payload)
+        if self._mixer:
+            self._mixer.set_reset_on_stop(enabled)
+
+    def _cmd_set_slew_rate(self, payload: str) -> None:
+        rate = int(payload)
+        if self._mixer:
+            self._mixer.set_slew_rate(rate)
+
     def start(self) -> None:
         """Start all components."""
         if self._running:
             return
         
+        from media_bridge.cec_listener import CECListener
+        from media_bridge.mixer import AudioMixer
+        from media_bridge.mqtt_client import MQTTClient, MQTTConfig
+        
         self._running = True
+        self._stop_event.clear()
         logger.info("Starting Media Bridge...")
         
+        self._cmd_worker = threading.Thread(
+            target=self._run_cmd_worker,
+            name="mqtt-commands",
+            daemon=True,
+        )
+        self._cmd_worker.start()
+        
         # Start MQTT client
         mqtt_config = MQTTConfig(
             host=self.config.mqtt.host,
@@ -230,12 +373,7 @@ class MediaBridge:
         self._mqtt.start()
         
         # Wait for MQTT connection
-        for _ in range(50):  # 5 second timeout
-            if self._mqtt.connected:
-                break
-            time.sleep(0.1)
-        
-        if not self._mqtt.connected:
+        if not self._mqtt.wait_connected(timeout=5.0):
             logger.warning("MQTT not connected after timeout, continuing anyway")
         
         # Start CEC listener (TV power + volume commands to mixer)
@@ -266,14 +404,16 @@ class MediaBridge:
                 },
                 reset_on_stop=vol_cfg.reset_on_stop,
                 slew_rate=vol_cfg.slew_rate,
+                airplay_cpu_affinity=self.config.audio.airplay_cpu_affinity,
             )
             self._mixer.start()
         else:
             logger.info("Audio mixer disabled in config")
         
-        # Publish initial state after short delay
-        time.sleep(1.0)
-        self._publish_full_state()
+        # Publish initial state after a short delay, once sources have settled
+        self._initial_publish_timer = threading.Timer(1.0, self._publish_full_state)
+        self._initial_publish_timer.daemon = True
+        self._initial_publish_timer.start()
         
         logger.info("Media Bridge started successfully")
 
@@ -283,9 +423,22 @@ class MediaBridge:
             return
         
         self._running = False
+        self._stop_event.set()
         logger.info("Stopping Media Bridge...")
         
+        if self._initial_publish_timer:
+            self._initial_publish_timer.cancel()
+            self._initial_publish_timer = None
+        
         # Stop in reverse order
+        if self._cmd_worker:
+            self._cmd_queue.put(None)
+            self._cmd_worker.join(timeout=5.0)
+            self._cmd_worker = None
+        for timer in self._pending_volume.values():
+            timer.cancel()
+        self._pending_volume.clear()
+        
         if self._mixer:
             self._mixer.stop()
             self._mixer = None
@@ -300,18 +453,19 @@ class MediaBridge:
         
         logger.info("Media Bridge stopped")
 
+    def request_stop(self) -> None:
+        """Ask run_forever() to shut down (safe to call from a signal handler)."""
+        self._stop_event.set()
+
     def _publish_full_state(self) -> None:
         """Publish complete state to MQTT."""
         if not self._mqtt:
             return
         
-        # Clear dedup cache
-        self._mqtt._last_state.clear()
-        
         # Publish TV power
         with self._lock:
-            tv_power = self._state.get("tv_power", False)
-        self._mqtt.publish("tv/on", tv_power)
+            tv_power = self._tv_power
+        pending: list[tuple[str, Any]] = [("tv/on", tv_power)]
         
         # Publish all source states
         if self._mixer:
@@ -319,27 +473,28 @@ class MediaBridge:
             for source_name, source_state in states.items():
                 for key, value in source_state.items():
                     if key != "name":  # Skip the name field
-                        self._mqtt.publish(f"source/{source_name}/{key}", value)
+                        pending.append((_source_topic(source_name, key), value))
             
             # Publish active sources
-            active = self._mixer.get_active_sources()
-            self._mqtt.publish("sources/active", active)
+            pending.append(("sources/active", self._mixer.get_active_sources()))
             
             # Publish TV silence detection settings
-            self._mqtt.publish("source/tv/silence_threshold", self._mixer.get_tv_silence_threshold())
-            self._mqtt.publish("source/tv/silence_duration", self._mixer.get_tv_silence_duration())
-            self._mqtt.publish("source/tv/auto_mute", self._mixer.get_tv_auto_mute())
-            self._mqtt.publish("source/tv/level_db", round(self._mixer.get_tv_level_db(), 1))
+            pending.append(("source/tv/silence_threshold", self._mixer.get_tv_silence_threshold()))
+            pending.append(("source/tv/silence_duration", self._mixer.get_tv_silence_duration()))
+            pending.append(("source/tv/auto_mute", self._mixer.get_tv_auto_mute()))
+            pending.append(("source/tv/level_db", round(self._mixer.get_tv_level_db(), 1)))
             
             # Publish master volume and settings
-            self._mqtt.publish("master/volume", self._mixer.get_master_volume())
-            self._mqtt.publish("master/reset_on_stop", self._mixer.get_reset_on_stop())
-            self._mqtt.publish("master/slew_rate", self._mixer.get_slew_rate())
+            pending.append(("master/volume", self._mixer.get_master_volume()))
+            pending.append(("master/reset_on_stop", self._mixer.get_reset_on_stop()))
+            pending.append(("master/slew_rate", self._mixer.get_slew_rate()))
             
             # Publish default volumes
             for source in ["spotify", "airplay", "tv"]:
-                self._mqtt.publish(f"source/{source}/default_volume", self._mixer.get_default_volume(source))
+                pending.append((_source_topic(source, "default_volume"), self._mixer.get_default_volume(source)))
         
+        # Bypass dedup - this is the full broadcast
+        self._mqtt.publish_batch(pending, force=True)
         logger.info("Published full state")
 
     def run_forever(self) -> None:
@@ -347,13 +502,9 @@ class MediaBridge:
         self.start()
         
         try:
-            while self._running:
-                time.sleep(1.0)
-                
-                # Periodic health check / reconnect logic could go here
-                if self._mqtt and not self._mqtt.connected:
-                    logger.warning("MQTT disconnected, will auto-reconnect")
-                    
+            # Block until stop(); MQTT disconnects are logged (and reconnected)
+            # from the client's own callbacks
+            self._stop_event.wait()
         except KeyboardInterrupt:
             logger.info("Interrupted by user")
         finally:
@@ -393,23 +544,23 @@ def main() -> int:
     
     # Override log level if verbose
     if args.verbose:
-        config.log.level = "DEBUG"
+        config = replace(config, log=replace(config.log, level="DEBUG"))
     
     # Setup logging
     setup_logging(config.log)
     
     logger.info("Media Bridge starting...")
-    logger.debug(f"Config: MQTT={config.mqtt.host}:{config.mqtt.port}, "
-                 f"CEC={config.cec.enabled}, Audio={config.audio.enabled}")
+    logger.debug("Config: MQTT=%s:%s, CEC=%s, Audio=%s",
+                 config.mqtt.host, config.mqtt.port, config.cec.enabled, config.audio.enabled)
     
     # Create and run bridge
     bridge = MediaBridge(config)
     
     # Setup signal handlers
     def handle_signal(signum: int, frame: Any) -> None:
-        logger.info(f"Received signal {signum}, shutting down...")
-        bridge.stop()
-        sys.exit(0)
+        # Only wake run_forever - it tears everything down outside signal context
+        logger.info("Received signal %s, shutting down...", signum)
+        bridge.request_stop()
     
     signal.signal(signal.SIGTERM, handle_signal)
     signal.signal(signal.SIGINT, handle_signal)
@@ -5,7 +5,7 @@ Provides:
 - Unified interface to all sources
 - State aggregation for MQTT publishing
 - Per-source control routing
-- Master volume control
+- Master volume control (libpulse when available, pactl otherwise)
 - Default volumes with reset-on-stop
 - Volume slew rate limiting
 """
@@ -13,12 +13,24 @@ Provides:
 from __future__ import annotations
 
 import logging
+import queue
 import subprocess
 import re
+import shutil
 import threading
 import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from types import MappingProxyType, SimpleNamespace
 from typing import Callable
 
+try:
+    import pulsectl
+    HAS_PULSECTL = True
+except ImportError:
+    HAS_PULSECTL = False
+
 from media_bridge.sources import (
     AudioSource,
     SpotifySource,
@@ -29,6 +41,59 @@ from media_bridge.sources import (
 logger = logging.getLogger(__name__)
 
 
+def _noop(source: str, key: str, value: any) -> None:
+    """State callback used when the mixer has no listener."""
+
+
+@dataclass(frozen=True, slots=True)
+class SlewState:
+    """An in-progress volume ramp for one source.
+    
+    The ramp position is fixed-point (hundredths of a percent) so steps need no
+    float rounding; last_volume is the integer volume most recently applied.
+    """
+    target: int
+    current: int
+    last_volume: int
+
+
+# Interval between slew steps (seconds)
+_SLEW_STEP_INTERVAL = 0.05
+
+# Delay before applying the default volume to a source that started playing,
+# so its sink-input is available (seconds)
+_DEFAULT_VOLUME_DELAY = 0.3
+
+# State keys whose intermediate updates are rate-limited, and the minimum
+# interval between two forwarded updates of the same key (seconds)
+_COALESCED_KEYS = frozenset({"volume"})
+_MIN_EMIT_INTERVAL = 0.2
+
+# pactl argv prefixes for master (default sink) volume. As in audio_listener,
+# the absolute path together with close_fds=False lets subprocess use
+# posix_spawn instead of fork+exec (our own fds are non-inheritable anyway)
+_PACTL = shutil.which("pactl") or "pactl"
+_PACTL_SET_MASTER = (_PACTL, "set-sink-volume", "@DEFAULT_SINK@")
+_PACTL_GET_MASTER = (_PACTL, "get-sink-volume", "@DEFAULT_SINK@")
+
+# pactl answers in milliseconds on a healthy system (seconds)
+_PACTL_TIMEOUT = 1.0
+
+# Volume percentage in `pactl get-sink-volume` output
+_PULSE_VOL_RE = re.compile(r'(\d+)%')
+
+# pactl master-volume reads: how long a reading stays fresh, and how long to
+# wait for pactl before falling back to the last known value (seconds)
+_MASTER_VOL_CACHE_TTL = 0.5
+_MASTER_VOL_READ_TIMEOUT = 0.2
+
+# Default volume for sources without a configured one (%)
+_DEFAULT_SOURCE_VOLUME = 15
+
+# Playback states that count as the source being active
+_PLAYING_STATES = frozenset({"playing"})
+
+
 class AudioMixer:
     """
     Coordinates all audio sources and provides unified interface.
@@ -46,19 +111,31 @@ class AudioMixer:
         default_volumes: dict[str, int] | None = None,
         reset_on_stop: bool = True,
         slew_rate: int = 25,
+        airplay_cpu_affinity: bool = False,
     ):
-        self._on_state_change = on_state_change
-        self._running = False
+        # Main state callback, resolved once so call sites need no None check
+        self._emit_state: Callable[[str, str, any], None] = on_state_change or _noop
+        
+        # Set by stop(); wakes and ends the slew worker deterministically
+        self._stop_event = threading.Event()
+        
+        # Last forwarded (timestamp, value) per (source, key), for coalescing
+        self._last_emit: dict[tuple[str, str], tuple[float, any]] = {}
         
         # Master volume (0-100) - applied to main output sink
         self._master_volume = max(0, min(100, master_volume))
         
-        # Default volumes per source
-        self._default_volumes = default_volumes or {
-            "spotify": 15,
-            "airplay": 15,
-            "tv": 15,
-        }
+        # Long-lived libpulse connection for master volume (None: not connected).
+        # pulsectl connections aren't thread-safe, so every use holds _pulse_lock.
+        self._pulse: pulsectl.Pulse | None = None
+        self._pulse_lock = threading.Lock()
+        
+        # Last master volume read via pactl, and when (monotonic)
+        self._master_vol_cache = self._master_volume
+        self._master_vol_read_ts = float("-inf")
+        
+        # Default volumes per source (own copy; filled in for every source below)
+        self._default_volumes = dict(default_volumes or {})
         
         # Reset to default when source stops
         self._reset_on_stop = reset_on_stop
@@ -69,57 +146,109 @@ class AudioMixer:
         # Track which sources were active (for reset-on-stop detection)
         self._was_active: dict[str, bool] = {}
         
-        # Slew tracking per source: {source_name: {"target": int, "current": float, "thread": Thread}}
-        self._slew_state: dict[str, dict] = {}
-        self._slew_lock = threading.Lock()
+        # Pending default-volume applications for sources that just started
+        self._default_volume_timers: dict[str, threading.Timer] = {}
+        
+        # Slew requests for the worker thread, which alone owns the ramp table:
+        # (source_name, target), target None to cancel
+        self._slew_queue: queue.SimpleQueue[tuple[str, int | None]] = queue.SimpleQueue()
+        self._slew_wake = threading.Event()
+        self._slew_worker: threading.Thread | None = None
         
-        # Initialize sources
-        self._sources: dict[str, AudioSource] = {}
+        # Sources with an active ramp (written only by the slew worker). Their
+        # own volume reports aren't forwarded: the worker emits the ramp itself
+        self._slewing: set[str] = set()
+        
+        # Initialize sources (fixed after construction, exposed read-only)
+        sources: dict[str, AudioSource] = {}
         
         # Spotify source
-        self._sources["spotify"] = SpotifySource(
+        sources["spotify"] = SpotifySource(
             on_state_change=self._handle_source_state_change,
             on_external_volume=self._handle_external_volume,
         )
         
         # AirPlay source
-        self._sources["airplay"] = AirPlaySource(
+        sources["airplay"] = AirPlaySource(
             on_state_change=self._handle_source_state_change,
             on_external_volume=self._handle_external_volume,
+            cpu_affinity=airplay_cpu_affinity,
         )
         
         # TV source
-        self._sources["tv"] = TVSource(
+        sources["tv"] = TVSource(
             on_state_change=self._handle_source_state_change,
             on_external_volume=self._handle_external_volume,
             alsa_device=tv_alsa_device,
             pulse_sink=pulse_sink,
         )
         
-        # Initialize was_active tracking
-        for name in self._sources:
+        self._sources: Mapping[str, AudioSource] = MappingProxyType(sources)
+        self._source_names = tuple(sources)
+        self._source_items = tuple(sources.items())
+        
+        # TV-specific methods, bound once (None if the TV source lacks one)
+        tv = sources["tv"]
+        self._tv = tv
+        self._tv_api = SimpleNamespace(**{
+            name: getattr(tv, name, None)
+            for name in (
+                "get_silence_threshold",
+                "set_silence_threshold",
+                "get_silence_duration",
+                "set_silence_duration",
+                "get_level_db",
+                "set_tv_power",
+                "get_auto_mute",
+                "set_auto_mute",
+            )
+        })
+        
+        # Initialize was_active tracking, and resolve each source's default
+        # volume once so event handlers index it directly
+        for name in self._source_names:
             self._was_active[name] = False
+            self._default_volumes.setdefault(name, _DEFAULT_SOURCE_VOLUME)
+
+    def _emit(self, source: str, key: str, value: any, *, force: bool = False) -> None:
+        """Forward a state change to the main callback.
+        
+        Updates of coalesced keys are dropped when the value is unchanged or the
+        previous update was less than _MIN_EMIT_INTERVAL ago, unless force is set.
+        Callers force the final value of a ramp and user-initiated changes.
+        """
+        if key in _COALESCED_KEYS:
+            now = time.monotonic()
+            last = self._last_emit.get((source, key))
+            if not force and last is not None and (
+                last[1] == value or now - last[0] < _MIN_EMIT_INTERVAL
+            ):
+                return
+            self._last_emit[(source, key)] = (now, value)
+        
+        self._emit_state(source, key, value)
 
     def _handle_source_state_change(self, source: str, key: str, value: any) -> None:
         """Forward state changes to main callback and handle volume defaults."""
         # Check for state changes (idle/playing/paused)
         if key == "state":
-            is_active = value in ("playing",)
+            is_active = value in _PLAYING_STATES
             was_active = self._was_active.get(source, False)
             
             # Source just started playing - apply default volume
             if is_active and not was_active:
-                default_vol = self._default_volumes.get(source, 15)
-                logger.info(f"Source {source} started, setting volume to {default_vol}%")
-                src = self._sources.get(source)
-                if src:
-                    # Small delay to ensure sink-input is available
-                    time.sleep(0.3)
-                    # Set default volume directly (slew is for user-initiated changes)
-                    src.set_volume(default_vol)
-                    # Notify of volume change
-                    if self._on_state_change:
-                        self._on_state_change(source, "volume", default_vol)
+                if source in self._sources:
+                    # Applied after a small delay so the sink-input is available,
+                    # without blocking the source's event thread
+                    pending = self._default_volume_timers.pop(source, None)
+                    if pending:
+                        pending.cancel()
+                    timer = threading.Timer(
+                        _DEFAULT_VOLUME_DELAY, self._apply_default_volume, (source,)
+                    )
+                    timer.daemon = True
+                    self._default_volume_timers[source] = timer
+                    timer.start()
             
             # Source just became inactive - reset to default
             elif was_active and not is_active:
@@ -127,20 +256,42 @@ class AudioMixer:
                 self.stop_slew(source)
                 
                 if self._reset_on_stop:
-                    default_vol = self._default_volumes.get(source, 15)
+                    default_vol = self._default_volumes[source]
                     logger.info(f"Source {source} stopped, resetting volume to {default_vol}%")
                     src = self._sources.get(source)
                     if src:
                         src.set_volume(default_vol)
                         # Notify of volume change
-                        if self._on_state_change:
-                            self._on_state_change(source, "volume", default_vol)
+                        self._emit(source, "volume", default_vol, force=True)
             
             self._was_active[source] = is_active
         
-        # Forward to main callback
-        if self._on_state_change:
-            self._on_state_change(source, key, value)
+        # Volume set by a ramp step - the slew worker emits it (coalesced)
+        elif key == "volume" and source in self._slewing:
+            return
+        
+        # Forward to main callback (values reported by the source are never dropped)
+        self._emit(source, key, value, force=True)
+
+    def _apply_default_volume(self, source: str) -> None:
+        """Set a newly started source to its default volume (runs on a timer)."""
+        self._default_volume_timers.pop(source, None)
+        
+        # The source may have stopped again during the delay
+        if self._stop_event.is_set() or not self._was_active.get(source, False):
+            return
+        
+        default_vol = self._default_volumes[source]
+        logger.info(f"Source {source} started, setting volume to {default_vol}%")
+        try:
+            # Set default volume directly (slew is for user-initiated changes)
+            self._sources[source].set_volume(default_vol)
+        except Exception as e:
+            logger.error(f"Error applying default volume to {source}: {e}")
+            return
+        
+        # Notify of volume change
+        self._emit(source, "volume", default_vol, force=True)
 
     def _handle_external_volume(self, source: str, volume: int) -> None:
         """Handle external volume change from phone/app/remote.
@@ -158,12 +309,19 @@ class AudioMixer:
         
         # Just notify HA - don't call back to source (it already has the volume)
         # The source will update its own state via normal polling
-        if self._on_state_change:
-            self._on_state_change(source, "volume", volume)
+        self._emit(source, "volume", volume, force=True)
 
     def start(self) -> None:
         """Start all audio sources and apply default volumes."""
-        self._running = True
+        self._stop_event.clear()
+        self._slew_queue = queue.SimpleQueue()  # Drop requests left over from a previous run
+        
+        self._slew_worker = threading.Thread(
+            target=self._slew_loop,
+            name="mixer-slew",
+            daemon=True,
+        )
+        self._slew_worker.start()
         
         # Apply default volumes to sources
         self.apply_default_volumes()
@@ -171,7 +329,7 @@ class AudioMixer:
         # Apply master volume
         self.set_master_volume(self._master_volume)
         
-        for name, source in self._sources.items():
+        for name, source in self._source_items:
             try:
                 source.start()
                 logger.info(f"Started source: {name}")
@@ -180,36 +338,43 @@ class AudioMixer:
 
     def stop(self) -> None:
         """Stop all audio sources."""
-        self._running = False
+        # Wake the slew worker so it drops all ramps and exits
+        self._stop_event.set()
+        self._slew_wake.set()
+        
+        if self._slew_worker:
+            self._slew_worker.join(timeout=1.0)
+            self._slew_worker = None
         
-        # Stop all active slews
-        with self._slew_lock:
-            for source_name in list(self._slew_state.keys()):
-                self._slew_state[source_name]["active"] = False
-            self._slew_state.clear()
+        for timer in list(self._default_volume_timers.values()):
+            timer.cancel()
+        self._default_volume_timers.clear()
         
-        for name, source in self._sources.items():
+        for name, source in self._source_items:
             try:
                 source.stop()
                 logger.info(f"Stopped source: {name}")
             except Exception as e:
                 logger.error(f"Error stopping source {name}: {e}")
+        
+        with self._pulse_lock:
+            self._close_pulse()
 
     def get_source(self, name: str) -> AudioSource | None:
         """Get a specific source by name."""
         return self._sources.get(name)
 
-    def get_all_sources(self) -> dict[str, AudioSource]:
-        """Get all sources."""
-        return dict(self._sources)
+    def get_all_sources(self) -> Mapping[str, AudioSource]:
+        """Get all sources (read-only view)."""
+        return self._sources
 
     def get_active_sources(self) -> list[str]:
         """Get list of currently active source names."""
-        return [name for name, source in self._sources.items() if source.is_active()]
+        return [name for name, source in self._source_items if source.is_active()]
 
     def get_all_states(self) -> dict[str, dict]:
         """Get state of all sources."""
-        return {name: source.state.to_dict() for name, source in self._sources.items()}
+        return {name: source.state.to_dict() for name, source in self._source_items}
 
     # Per-source controls
 
@@ -236,205 +401,190 @@ class AudioMixer:
     
     def _start_slew(self, source_name: str, target: int) -> None:
         """Start ramping volume toward target at slew_rate."""
-        source = self._sources.get(source_name)
-        if not source:
+        if source_name not in self._sources:
             return
         
-        with self._slew_lock:
-            current_vol = source.get_volume()
-            
-            # If already at target, nothing to do
-            if current_vol == target:
+        # Hand the request to the slew worker; it reads the current volume
+        # and starts or retargets the ramp, so callers never wait on a source
+        self._slew_queue.put((source_name, target))
+        self._slew_wake.set()
+    
+    def _drain_slew_queue(self, ramps: dict[str, SlewState]) -> None:
+        """Apply queued slew requests to ramps."""
+        while True:
+            try:
+                source_name, target = self._slew_queue.get_nowait()
+            except queue.Empty:
                 return
             
-            # Update or create slew state
-            if source_name in self._slew_state:
+            state = ramps.get(source_name)
+            if target is None:
+                ramps.pop(source_name, None)
+                self._slewing.discard(source_name)
+            elif state:
                 # Update target for existing ramp
-                self._slew_state[source_name]["target"] = target
+                ramps[source_name] = replace(state, target=target)
                 logger.debug(f"Updated slew target for {source_name}: {target}%")
-                return
-            
-            # Create new slew state
-            self._slew_state[source_name] = {
-                "target": target,
-                "current": float(current_vol),
-                "active": True,
-            }
-        
-        # Start slew thread
-        thread = threading.Thread(
-            target=self._slew_thread,
-            args=(source_name,),
-            name=f"slew-{source_name}",
-            daemon=True,
-        )
-        thread.start()
-        logger.info(f"Started slew for {source_name}: {current_vol}% -> {target}% at {self._slew_rate}%/s")
+            elif (current_vol := self._sources[source_name].get_volume()) != target:
+                ramps[source_name] = SlewState(
+                    target=target, current=current_vol * 100, last_volume=current_vol
+                )
+                self._slewing.add(source_name)
+                logger.info(
+                    f"Started slew for {source_name}: {current_vol}% -> {target}% "
+                    f"at {self._slew_rate}%/s"
+                )
     
-    def _slew_thread(self, source_name: str) -> None:
-        """Thread that gradually ramps volume toward target."""
-        source = self._sources.get(source_name)
-        if not source:
-            return
-        
-        step_interval = 0.05  # 50ms between steps
-        step_size = self._slew_rate * step_interval  # % per step
+    def _slew_loop(self) -> None:
+        """Worker thread that steps every active ramp toward its target.
         
-        try:
-            while self._running:
-                with self._slew_lock:
-                    if source_name not in self._slew_state:
-                        break
-                    
-                    state = self._slew_state[source_name]
-                    if not state.get("active", False):
-                        break
-                    
-                    target = state["target"]
-                    current = state["current"]
-                    
-                    # Calculate next step
-                    if current < target:
-                        new_vol = min(target, current + step_size)
-                    elif current > target:
-                        new_vol = max(target, current - step_size)
-                    else:
-                        # At target
-                        del self._slew_state[source_name]
-                        break
-                    
-                    state["current"] = new_vol
+        The ramp table is private to this thread; other threads only enqueue
+        requests, so no lock is taken on the step path.
+        """
+        ramps: dict[str, SlewState] = {}
+        next_step = time.monotonic()
+        emit = self._emit
+        
+        while not self._stop_event.is_set():
+            # Sleep until a request arrives, the next step is due, or stop() is called
+            self._slew_wake.wait(max(0.0, next_step - time.monotonic()) if ramps else None)
+            self._slew_wake.clear()
+            if self._stop_event.is_set():
+                break
+            
+            idle = not ramps
+            self._drain_slew_queue(ramps)
+            if idle:
+                # First step of a new ramp is applied immediately
+                next_step = time.monotonic()
+            if not ramps or time.monotonic() < next_step:
+                continue
+            
+            # Hundredths of a percent per step
+            step = self._slew_rate * round(_SLEW_STEP_INTERVAL * 100)
+            
+            for source_name, state in list(ramps.items()):
+                target = state.target
+                target_pos = target * 100
+                current = state.current
                 
-                # Apply volume (outside lock)
-                int_vol = int(round(new_vol))
-                source.set_volume(int_vol)
+                # Calculate next step (rate dropped to 0 mid-ramp: jump to target)
+                if step <= 0:
+                    new_pos = target_pos
+                elif current < target_pos:
+                    new_pos = min(target_pos, current + step)
+                else:
+                    new_pos = max(target_pos, current - step)
                 
-                # Notify of volume change
-                if self._on_state_change:
-                    self._on_state_change(source_name, "volume", int_vol)
+                int_vol = (new_pos + 50) // 100
                 
-                # Check if we've reached target
-                if abs(new_vol - target) < 0.5:
-                    with self._slew_lock:
-                        if source_name in self._slew_state:
-                            del self._slew_state[source_name]
+                # Detect the final step in the same branch that updates the ramp
+                done = int_vol == target
+                if done:
+                    del ramps[source_name]
                     logger.debug(f"Slew complete for {source_name}: {int_vol}%")
-                    break
+                else:
+                    ramps[source_name] = SlewState(
+                        target=target, current=new_pos, last_volume=int_vol
+                    )
+                    if int_vol == state.last_volume:
+                        continue  # Slow ramp: integer volume hasn't moved yet
                 
-                time.sleep(step_interval)
-                
-        except Exception as e:
-            logger.error(f"Slew thread error for {source_name}: {e}")
-            with self._slew_lock:
-                if source_name in self._slew_state:
-                    del self._slew_state[source_name]
+                try:
+                    self._sources[source_name].set_volume(int_vol)
+                    
+                    # Notify of volume change (intermediate steps are coalesced)
+                    emit(source_name, "volume", int_vol, force=done)
+                except Exception as e:
+                    logger.error(f"Slew error for {source_name}: {e}")
+                    ramps.pop(source_name, None)
+                    done = True
+                if done:
+                    self._slewing.discard(source_name)
+            
+            next_step = time.monotonic() + _SLEW_STEP_INTERVAL
+        
+        self._slewing.clear()
     
     def stop_slew(self, source_name: str) -> None:
         """Stop any active slewing for a source."""
-        with self._slew_lock:
-            if source_name in self._slew_state:
-                self._slew_state[source_name]["active"] = False
+        self._slew_queue.put((source_name, None))
+        self._slew_wake.set()
 
-    def set_source_mute(self, source_name: str, muted: bool) -> bool:
-        """Set mute for a specific source."""
+    def _call(self, source_name: str, method: str, *args: any) -> bool:
+        """Call a method on a source by name, warning if the source is unknown."""
         source = self._sources.get(source_name)
         if not source:
             logger.warning(f"Unknown source: {source_name}")
             return False
-        return source.set_muted(muted)
+        return getattr(source, method)(*args)
+
+    def set_source_mute(self, source_name: str, muted: bool) -> bool:
+        """Set mute for a specific source."""
+        return self._call(source_name, "set_muted", muted)
 
     def toggle_source_mute(self, source_name: str) -> bool:
         """Toggle mute for a specific source."""
-        source = self._sources.get(source_name)
-        if not source:
-            logger.warning(f"Unknown source: {source_name}")
-            return False
-        return source.toggle_mute()
+        return self._call(source_name, "toggle_mute")
 
     def source_play(self, source_name: str) -> bool:
         """Play a specific source."""
-        source = self._sources.get(source_name)
-        if not source:
-            logger.warning(f"Unknown source: {source_name}")
-            return False
-        return source.play()
+        return self._call(source_name, "play")
 
     def source_pause(self, source_name: str) -> bool:
         """Pause a specific source."""
-        source = self._sources.get(source_name)
-        if not source:
-            logger.warning(f"Unknown source: {source_name}")
-            return False
-        return source.pause()
+        return self._call(source_name, "pause")
 
     def source_stop(self, source_name: str) -> bool:
         """Stop a specific source."""
-        source = self._sources.get(source_name)
-        if not source:
-            logger.warning(f"Unknown source: {source_name}")
-            return False
-        return source.stop_playback()
+        return self._call(source_name, "stop_playback")
 
     # TV-specific settings
 
     def get_tv_silence_threshold(self) -> int:
         """Get TV silence detection threshold (dB)."""
-        tv = self._sources.get("tv")
-        if tv and hasattr(tv, "get_silence_threshold"):
-            return tv.get_silence_threshold()
-        return -50
+        fn = self._tv_api.get_silence_threshold
+        return fn() if fn else -50
 
     def set_tv_silence_threshold(self, threshold_db: int) -> bool:
         """Set TV silence detection threshold (dB)."""
-        tv = self._sources.get("tv")
-        if tv and hasattr(tv, "set_silence_threshold"):
-            return tv.set_silence_threshold(threshold_db)
-        return False
+        fn = self._tv_api.set_silence_threshold
+        return fn(threshold_db) if fn else False
 
     def get_tv_silence_duration(self) -> float:
         """Get TV silence detection duration (seconds)."""
-        tv = self._sources.get("tv")
-        if tv and hasattr(tv, "get_silence_duration"):
-            return tv.get_silence_duration()
-        return 3.0
+        fn = self._tv_api.get_silence_duration
+        return fn() if fn else 3.0
 
     def set_tv_silence_duration(self, duration: float) -> bool:
         """Set TV silence detection duration (seconds)."""
-        tv = self._sources.get("tv")
-        if tv and hasattr(tv, "set_silence_duration"):
-            return tv.set_silence_duration(duration)
-        return False
+        fn = self._tv_api.set_silence_duration
+        return fn(duration) if fn else False
 
     def get_tv_level_db(self) -> float:
         """Get TV current level in dB (for debugging)."""
-        tv = self._sources.get("tv")
-        if tv and hasattr(tv, "get_level_db"):
-            return tv.get_level_db()
-        return -100.0
+        fn = self._tv_api.get_level_db
+        return fn() if fn else -100.0
 
     def set_tv_power(self, power_on: bool) -> None:
         """Set TV power state - enables/disables TV audio pipeline."""
-        tv = self._sources.get("tv")
-        if tv and hasattr(tv, "set_tv_power"):
-            tv.set_tv_power(power_on)
+        fn = self._tv_api.set_tv_power
+        if fn:
+            fn(power_on)
 
     def get_tv_auto_mute(self) -> bool:
         """Get TV auto-mute on silence setting."""
-        tv = self._sources.get("tv")
-        if tv and hasattr(tv, "get_auto_mute"):
-            return tv.get_auto_mute()
-        return True
+        fn = self._tv_api.get_auto_mute
+        return fn() if fn else True
 
     def set_tv_auto_mute(self, enabled: bool) -> bool:
         """Enable/disable TV auto-mute on silence."""
-        tv = self._sources.get("tv")
-        if tv and hasattr(tv, "set_auto_mute"):
-            return tv.set_auto_mute(enabled)
-        return False
+        fn = self._tv_api.set_auto_mute
+        return fn(enabled) if fn else False
 
     def tv_volume_up(self, step: int = 5) -> bool:
         """Increase TV source volume by step."""
-        tv = self._sources.get("tv")
+        tv = self._tv
         if tv:
             current = tv.get_volume()
             new_volume = min(100, current + step)
@@ -444,7 +594,7 @@ class AudioMixer:
 
     def tv_volume_down(self, step: int = 5) -> bool:
         """Decrease TV source volume by step."""
-        tv = self._sources.get("tv")
+        tv = self._tv
         if tv:
             current = tv.get_volume()
             new_volume = max(0, current - step)
@@ -454,7 +604,7 @@ class AudioMixer:
 
     def tv_mute_toggle(self) -> bool:
         """Toggle TV source mute."""
-        tv = self._sources.get("tv")
+        tv = self._tv
         if tv:
             current = tv.get_muted()
             logger.debug(f"TV mute toggle: {current} -> {not current}")
@@ -474,21 +624,29 @@ class AudioMixer:
         Set master volume (0-100).
         
         This controls the main output sink volume, affecting all sources.
+        Uses libpulse when available, otherwise shells out to pactl.
         """
         volume = max(0, min(100, volume))
         self._master_volume = volume
         
+        if self._pulse_set_master_volume(volume):
+            logger.info(f"Master volume set to {volume}%")
+            self._emit("master", "volume", volume, force=True)
+            return True
+        
         try:
             # Apply to default sink
             result = subprocess.run(
-                ["pactl", "set-sink-volume", "@DEFAULT_SINK@", f"{volume}%"],
+                (*_PACTL_SET_MASTER, f"{volume}%"),
                 capture_output=True,
-                timeout=5,
+                timeout=_PACTL_TIMEOUT,
+                close_fds=False,
             )
             if result.returncode == 0:
+                self._master_vol_cache = volume
+                self._master_vol_read_ts = time.monotonic()
                 logger.info(f"Master volume set to {volume}%")
-                if self._on_state_change:
-                    self._on_state_change("master", "volume", volume)
+                self._emit("master", "volume", volume, force=True)
                 return True
             else:
                 logger.error(f"Failed to set master volume: {result.stderr}")
@@ -498,21 +656,78 @@ class AudioMixer:
             return False
 
     def _get_current_master_volume(self) -> int:
-        """Read current master volume from PulseAudio."""
+        """
+        Read current master volume from PulseAudio.
+        
+        Without libpulse, pactl readings are cached briefly and a slow or
+        failing pactl returns the last known value instead of blocking.
+        """
+        volume = self._pulse_get_master_volume()
+        if volume is not None:
+            return volume
+        
+        now = time.monotonic()
+        if now - self._master_vol_read_ts < _MASTER_VOL_CACHE_TTL:
+            return self._master_vol_cache
+        
         try:
             result = subprocess.run(
-                ["pactl", "get-sink-volume", "@DEFAULT_SINK@"],
+                _PACTL_GET_MASTER,
                 capture_output=True,
                 text=True,
-                timeout=5,
+                timeout=_MASTER_VOL_READ_TIMEOUT,
+                close_fds=False,
             )
             if result.returncode == 0:
-                match = re.search(r'(\d+)%', result.stdout)
+                match = _PULSE_VOL_RE.search(result.stdout)
                 if match:
-                    return int(match.group(1))
+                    self._master_vol_cache = int(match.group(1))
+                    self._master_vol_read_ts = now
+                    return self._master_vol_cache
         except Exception as e:
             logger.debug(f"Error reading master volume: {e}")
-        return self._master_volume
+        return self._master_vol_cache
+
+    def _pulse_default_sink(self) -> pulsectl.PulseSinkInfo:
+        """Look up the default sink, connecting to PulseAudio on first use.
+        
+        Must be called with _pulse_lock held.
+        """
+        if self._pulse is None:
+            self._pulse = pulsectl.Pulse("media-bridge-mixer")
+        return self._pulse.get_sink_by_name(self._pulse.server_info().default_sink_name)
+
+    def _close_pulse(self) -> None:
+        """Drop the libpulse connection (reopened on next use). Requires _pulse_lock."""
+        if self._pulse is not None:
+            self._pulse.close()
+            self._pulse = None
+
+    def _pulse_set_master_volume(self, volume: int) -> bool:
+        """Set default sink volume over libpulse. Returns False if unavailable."""
+        if not HAS_PULSECTL:
+            return False
+        with self._pulse_lock:
+            try:
+                sink = self._pulse_default_sink()
+                self._pulse.volume_set_all_chans(sink, volume / 100.0)
+                return True
+            except Exception as e:
+                logger.debug(f"libpulse master volume failed, using pactl: {e}")
+                self._close_pulse()
+                return False
+
+    def _pulse_get_master_volume(self) -> int | None:
+        """Read default sink volume over libpulse. Returns None if unavailable."""
+        if not HAS_PULSECTL:
+            return None
+        with self._pulse_lock:
+            try:
+                return round(self._pulse_default_sink().volume.value_flat * 100)
+            except Exception as e:
+                logger.debug(f"libpulse master volume read failed, using pactl: {e}")
+                self._close_pulse()
+                return None
 
     # =========================================================================
     # Default Volume Settings
@@ -531,15 +746,14 @@ class AudioMixer:
         volume = max(0, min(100, volume))
         
         if source_name == "all":
-            for name in self._sources:
+            for name in self._source_names:
                 self._default_volumes[name] = volume
             logger.info(f"All default volumes set to {volume}%")
         else:
             self._default_volumes[source_name] = volume
             logger.info(f"Default volume for {source_name} set to {volume}%")
         
-        if self._on_state_change:
-            self._on_state_change(source_name, "default_volume", volume)
+        self._emit(source_name, "default_volume", volume)
         
         return True
 
@@ -551,17 +765,49 @@ class AudioMixer:
         """Enable/disable volume reset when sources stop."""
         self._reset_on_stop = enabled
         logger.info(f"Reset-on-stop {'enabled' if enabled else 'disabled'}")
-        if self._on_state_change:
-            self._on_state_change("master", "reset_on_stop", enabled)
+        self._emit("master", "reset_on_stop", enabled)
         return True
 
     def apply_default_volumes(self) -> None:
         """Apply default volumes to all sources (called on startup)."""
-        for name, source in self._sources.items():
-            default_vol = self._default_volumes.get(name, 15)
-            source.set_volume(default_vol)
+        pairs = [(name, self._default_volumes[name]) for name in self._source_names]
+        self.set_volumes_bulk(pairs)
+        for name, default_vol in pairs:
             logger.info(f"Applied default volume {default_vol}% to {name}")
 
+    def set_volumes_bulk(self, pairs: list[tuple[str, int]]) -> bool:
+        """
+        Set the volume of several sources at once, without slewing.
+        
+        The calls run in parallel, which only helps on the pactl fallback:
+        libpulse calls are serialised by PulseAudioMixin._pulse_lock.
+        
+        Returns:
+            True if every source accepted its volume
+        """
+        calls = []
+        for source_name, volume in pairs:
+            source = self._sources.get(source_name)
+            if not source:
+                logger.warning(f"Unknown source: {source_name}")
+                continue
+            calls.append((source_name, source.set_volume, max(0, min(100, volume))))
+        
+        def apply(call: tuple[str, Callable[[int], bool], int]) -> bool:
+            source_name, set_volume, volume = call
+            try:
+                return set_volume(volume)
+            except Exception as e:
+                logger.error(f"Error setting volume for {source_name}: {e}")
+                return False
+        
+        if len(calls) <= 1:
+            results = list(map(apply, calls))
+        else:
+            with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+                results = list(pool.map(apply, calls))
+        return len(results) == len(pairs) and all(results)
+
     # =========================================================================
     # Slew Rate Control
     # =========================================================================
@@ -574,7 +820,6 @@ class AudioMixer:
         """Set volume slew rate (%/second). 0 = instant (no limit)."""
         self._slew_rate = max(0, rate)
         logger.info(f"Slew rate set to {self._slew_rate}%/s")
-        if self._on_state_change:
-            self._on_state_change("master", "slew_rate", self._slew_rate)
+        self._emit("master", "slew_rate", self._slew_rate)
         return True
 
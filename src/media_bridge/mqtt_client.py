@@ -11,13 +11,24 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
+import socket
+import sys
 import threading
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Callable
+from types import MappingProxyType
+from typing import Any, Callable
 
 import paho.mqtt.client as mqtt
 
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,14 +43,48 @@ class MQTTConfig:
     topic_prefix: str = "media/living_room"
     keepalive: int = 60
     reconnect_delay: float = 5.0
+    tcp_nodelay: bool = True  # Disable Nagle so bursts of small PUBLISHes aren't delayed
+    send_buffer: int = 64 * 1024  # SO_SNDBUF bytes (0 keeps the kernel default)
+
+
+# Most queued messages handed to paho per publisher wakeup
+PUBLISH_BURST = 64
+
+# Payload encoders by exact type, for the common cases
+_BOOL_PAYLOADS = ("false", "true")
+# Volumes and levels are 0-100, so most int payloads are one of these
+_INT_PAYLOADS = tuple(str(i) for i in range(256))
+
 
+def _encode_int(value: int) -> str:
+    return _INT_PAYLOADS[value] if 0 <= value < 256 else str(value)
+
+
+_PAYLOAD_ENCODERS: dict[type, Callable[[Any], str]] = {
+    bool: _BOOL_PAYLOADS.__getitem__,
+    int: _encode_int,
+    float: str,
+    str: str,
+    dict: json.dumps,
+    list: json.dumps,
+}
 
 # Sources we support
-SOURCES = ["spotify", "airplay", "tv"]
+SOURCES = ("spotify", "airplay", "tv")
+
+# Per-source command verbs: source/<source>/<verb> -> source_<source>_<verb>
+SOURCE_COMMAND_VERBS = (
+    "set_volume",
+    "mute",
+    "set_mute",
+    "play",
+    "pause",
+    "stop",
+    "set_default_volume",
+)
 
-# Command topic suffixes and their handlers
-# Per-source commands are handled dynamically
-COMMAND_TOPICS = {
+# Command topic suffixes and their handlers (read-only, interned keys)
+COMMAND_TOPICS: Mapping[str, str] = MappingProxyType({
     # TV power
     "tv/power_on": "tv_power_on",
     "tv/power_off": "tv_power_off",
@@ -51,17 +96,13 @@ COMMAND_TOPICS = {
     "master/set_volume": "set_master_volume",
     "master/set_reset_on_stop": "set_reset_on_stop",
     "master/set_slew_rate": "set_slew_rate",
-}
-
-# Add per-source command topics
-for source in SOURCES:
-    COMMAND_TOPICS[f"source/{source}/set_volume"] = f"source_{source}_set_volume"
-    COMMAND_TOPICS[f"source/{source}/mute"] = f"source_{source}_mute"
-    COMMAND_TOPICS[f"source/{source}/set_mute"] = f"source_{source}_set_mute"
-    COMMAND_TOPICS[f"source/{source}/play"] = f"source_{source}_play"
-    COMMAND_TOPICS[f"source/{source}/pause"] = f"source_{source}_pause"
-    COMMAND_TOPICS[f"source/{source}/stop"] = f"source_{source}_stop"
-    COMMAND_TOPICS[f"source/{source}/set_default_volume"] = f"source_{source}_set_default_volume"
+    # Per-source commands
+    **{
+        sys.intern(f"source/{source}/{verb}"): sys.intern(f"source_{source}_{verb}")
+        for source in SOURCES
+        for verb in SOURCE_COMMAND_VERBS
+    },
+})
 
 
 class MQTTClient:
@@ -81,21 +122,44 @@ class MQTTClient:
         self.on_command = on_command
         
         self._client: mqtt.Client | None = None
-        self._connected = False
-        self._lock = threading.Lock()
+        # Connection state: set by paho's network thread, read lock-free elsewhere
+        self._connected_event = threading.Event()
         self._running = False
         
-        # Track last published state to avoid duplicates
-        self._last_state: dict[str, str] = {}
+        # Outgoing messages (topic, payload, retain, qos, force), None to stop.
+        # A single publisher thread feeds them to paho in bursts.
+        self._publish_q: queue.SimpleQueue[tuple[str, str, bool, int, bool] | None] = (
+            queue.SimpleQueue()
+        )
+        self._publisher: threading.Thread | None = None
+        
+        # 64-bit fingerprint (builtin str hash) of the last published payload per
+        # topic, to avoid duplicates without keeping payloads in memory
+        self._last_state: dict[str, int] = {}
+        
+        # Full topic per suffix (interned), filled on first use
+        self._prefix = f"{config.topic_prefix}/"
+        self._topics: dict[str, str] = {}
+        
+        # Full command topic -> command name, so dispatch is a single lookup
+        self._command_by_topic = {
+            self._topic(suffix): command for suffix, command in COMMAND_TOPICS.items()
+        }
 
     @property
     def connected(self) -> bool:
-        with self._lock:
-            return self._connected
+        return self._connected_event.is_set()
+
+    def wait_connected(self, timeout: float) -> bool:
+        """Block until connected to the broker or timeout. Returns the connected state."""
+        return self._connected_event.wait(timeout)
 
     def _topic(self, suffix: str) -> str:
         """Build full topic from suffix."""
-        return f"{self.config.topic_prefix}/{suffix}"
+        topic = self._topics.get(suffix)
+        if topic is None:
+            topic = self._topics[suffix] = sys.intern(self._prefix + suffix)
+        return topic
 
     def _on_connect(
         self,
@@ -108,21 +172,18 @@ class MQTTClient:
         """Handle MQTT connection."""
         if reason_code == 0:
             logger.info(f"Connected to MQTT broker at {self.config.host}:{self.config.port}")
-            with self._lock:
-                self._connected = True
+            self._connected_event.set()
             
             # Publish online status
             self._publish_availability(True)
             
             # Subscribe to command topics
-            for topic_suffix in COMMAND_TOPICS:
-                topic = self._topic(topic_suffix)
+            for topic in self._command_by_topic:
                 client.subscribe(topic, qos=0)
                 logger.debug(f"Subscribed to {topic}")
         else:
             logger.error(f"MQTT connection failed: {reason_code}")
-            with self._lock:
-                self._connected = False
+            self._connected_event.clear()
 
     def _on_disconnect(
         self,
@@ -134,8 +195,7 @@ class MQTTClient:
     ) -> None:
         """Handle MQTT disconnection."""
         logger.warning(f"Disconnected from MQTT broker: {reason_code}")
-        with self._lock:
-            self._connected = False
+        self._connected_event.clear()
 
     def _on_message(
         self,
@@ -145,28 +205,35 @@ class MQTTClient:
     ) -> None:
         """Handle incoming MQTT messages."""
         try:
-            topic = message.topic
+            command = self._command_by_topic.get(message.topic)
+            if command is None:
+                logger.debug(f"Message on unexpected topic: {message.topic}")
+                return
+            
             payload = message.payload.decode("utf-8") if message.payload else ""
+            logger.info(f"Received command: {command} with payload: {payload}")
             
-            # Extract the topic suffix
-            prefix = self.config.topic_prefix + "/"
-            if topic.startswith(prefix):
-                suffix = topic[len(prefix):]
-                
-                if suffix in COMMAND_TOPICS:
-                    command = COMMAND_TOPICS[suffix]
-                    logger.info(f"Received command: {command} with payload: {payload}")
-                    
-                    if self.on_command:
-                        self.on_command(command, payload)
-                else:
-                    logger.debug(f"Unknown topic suffix: {suffix}")
-            else:
-                logger.debug(f"Message on unexpected topic: {topic}")
+            if self.on_command:
+                self.on_command(command, payload)
                 
         except Exception as e:
             logger.error(f"Error handling MQTT message: {e}")
 
+    def _on_socket_open(self, client: mqtt.Client, userdata: any, sock: socket.socket) -> None:
+        """Tune the broker socket as soon as it is opened (before CONNECT)."""
+        if self.config.tcp_nodelay:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except (OSError, AttributeError) as e:
+                logger.debug(f"Could not set TCP_NODELAY: {e}")
+        
+        # Room for a burst of queued publishes without waiting on the socket
+        if self.config.send_buffer > 0:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.config.send_buffer)
+            except (OSError, AttributeError) as e:
+                logger.debug(f"Could not set SO_SNDBUF: {e}")
+
     def _publish_availability(self, online: bool) -> None:
         """Publish availability status."""
         self.publish("availability", "online" if online else "offline", retain=True)
@@ -178,6 +245,13 @@ class MQTTClient:
         
         self._running = True
         
+        self._publisher = threading.Thread(
+            target=self._run_publisher,
+            name="mqtt-publisher",
+            daemon=True,
+        )
+        self._publisher.start()
+        
         # Create MQTT client with version 5
         self._client = mqtt.Client(
             callback_api_version=mqtt.CallbackAPIVersion.VERSION2,
@@ -189,6 +263,7 @@ class MQTTClient:
         self._client.on_connect = self._on_connect
         self._client.on_disconnect = self._on_disconnect
         self._client.on_message = self._on_message
+        self._client.on_socket_open = self._on_socket_open
         
         # Set credentials if provided
         if self.config.username:
@@ -210,6 +285,7 @@ class MQTTClient:
         except Exception as e:
             logger.error(f"Failed to connect to MQTT broker: {e}")
             self._running = False
+            self._stop_publisher()
 
     def stop(self) -> None:
         """Stop the MQTT client gracefully."""
@@ -221,64 +297,150 @@ class MQTTClient:
         if self._client:
             # Publish offline status before disconnecting
             self._publish_availability(False)
+            self._stop_publisher()  # Flushes the queue, offline status included
             time.sleep(0.1)  # Brief delay to ensure message is sent
             
             self._client.loop_stop()
             self._client.disconnect()
             self._client = None
         
-        with self._lock:
-            self._connected = False
+        self._connected_event.clear()
+        self._stop_publisher()
         
         logger.info("MQTT client stopped")
 
+    def _stop_publisher(self) -> None:
+        """Send everything already queued, then end the publisher thread."""
+        if self._publisher:
+            self._publish_q.put(None)
+            self._publisher.join(timeout=2.0)
+            self._publisher = None
+
+    def _run_publisher(self) -> None:
+        """Publisher thread: drain queued messages and hand them to paho back-to-back."""
+        publish_q = self._publish_q
+        send = self._send
+        
+        while True:
+            burst = [publish_q.get()]
+            while len(burst) < PUBLISH_BURST:
+                try:
+                    burst.append(publish_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            for message in burst:
+                if message is None:
+                    return
+                send(*message)
+
+    @staticmethod
+    def _format_payload(payload: str | int | bool | dict | list, binary: bool = False) -> str | bytes:
+        """Convert a payload to its MQTT form (MessagePack bytes for binary dicts/lists)."""
+        if binary and HAS_MSGPACK and isinstance(payload, (dict, list)):
+            return msgpack.packb(payload, use_bin_type=True)
+        encode = _PAYLOAD_ENCODERS.get(type(payload))
+        if encode is not None:
+            return encode(payload)
+        # Subclasses (e.g. OrderedDict) and other types
+        if isinstance(payload, (dict, list)):
+            return json.dumps(payload)
+        return str(payload)
+
+    def _send(self, topic: str, payload_str: str | bytes, retain: bool, qos: int, force: bool) -> bool:
+        """Hand one message to paho, skipping retained state that is unchanged.
+        
+        Runs on the publisher thread.
+        """
+        # Skip if unchanged (for state topics)
+        payload_hash = hash(payload_str)
+        if retain and not force and self._last_state.get(topic) == payload_hash:
+            return True
+        
+        client = self._client
+        if client is None:
+            return False
+        
+        try:
+            result = client.publish(topic, payload_str, qos=qos, retain=retain)
+            if result.rc == mqtt.MQTT_ERR_SUCCESS:
+                self._last_state[topic] = payload_hash
+                logger.debug(f"Published {topic}: {payload_str}")
+                return True
+            else:
+                logger.error(f"Failed to publish to {topic}: {result.rc}")
+                return False
+        except Exception as e:
+            logger.error(f"Error publishing to {topic}: {e}")
+            return False
+
     def publish(
         self,
         topic_suffix: str,
         payload: str | int | bool | dict | list,
         retain: bool = True,
         qos: int = 1,
+        force: bool = False,
+        binary: bool = False,
     ) -> bool:
         """
-        Publish a message to MQTT.
+        Queue a message for publishing to MQTT.
+        
+        The message is sent by the publisher thread, so callers never block
+        on the broker socket.
         
         Args:
             topic_suffix: Topic suffix (appended to prefix)
             payload: Message payload
             retain: Whether to retain the message
             qos: Quality of service level
+            force: Publish even if the payload is unchanged
+            binary: Send dict/list payloads as MessagePack instead of JSON
+                (falls back to JSON when msgpack isn't installed)
             
         Returns:
-            True if published successfully
+            True if queued (False when not connected)
         """
         if not self._client or not self.connected:
             logger.warning(f"Cannot publish, not connected to MQTT")
             return False
         
-        topic = self._topic(topic_suffix)
+        self._publish_q.put(
+            (self._topic(topic_suffix), self._format_payload(payload, binary), retain, qos, force)
+        )
+        return True
+
+    def publish_batch(
+        self,
+        messages: list[tuple[str, str | int | bool | dict | list]],
+        retain: bool = True,
+        qos: int = 1,
+        force: bool = False,
+        binary: bool = False,
+    ) -> int:
+        """
+        Queue several messages for publishing in one burst.
         
-        # Convert payload to string
-        if isinstance(payload, bool):
-            payload_str = "true" if payload else "false"
-        elif isinstance(payload, (dict, list)):
-            payload_str = json.dumps(payload)
-        else:
-            payload_str = str(payload)
+        The connection is checked once and all messages are queued together,
+        so the publisher thread hands them to paho back-to-back.
         
-        # Skip if unchanged (for state topics)
-        if retain and topic in self._last_state:
-            if self._last_state[topic] == payload_str:
-                return True
+        Args:
+            messages: (topic_suffix, payload) pairs
+            retain: Whether to retain the messages
+            qos: Quality of service level
+            force: Publish even if a payload is unchanged
+            binary: Send dict/list payloads as MessagePack instead of JSON
+            
+        Returns:
+            Number of messages queued
+        """
+        if not self._client or not self.connected:
+            logger.warning("Cannot publish, not connected to MQTT")
+            return 0
         
-        try:
-            result = self._client.publish(topic, payload_str, qos=qos, retain=retain)
-            if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                self._last_state[topic] = payload_str
-                logger.debug(f"Published {topic}: {payload_str}")
-                return True
-            else:
-                logger.error(f"Failed to publish to {topic}: {result.rc}")
-                return False
-        except Exception as e:
-            logger.error(f"Error publishing to {topic}: {e}")
-            return False
+        topic = self._topic
+        fmt = self._format_payload
+        put = self._publish_q.put
+        for suffix, payload in messages:
+            put((topic(suffix), fmt(payload, binary), retain, qos, force))
+        return len(messages)
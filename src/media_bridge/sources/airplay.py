@@ -22,24 +22,126 @@ from __future__ import annotations
 import base64
 import logging
 import os
-import re
-import select
+import selectors
 import threading
 import time
+import xml.etree.ElementTree as ET
 from typing import Callable
 
 from media_bridge.sources.base import AudioSource, PlaybackState, PulseAudioMixin
 
 logger = logging.getLogger(__name__)
 
-# Regex to parse shairport-sync XML metadata items
-METADATA_ITEM_RE = re.compile(
-    r'<item><type>([0-9a-fA-F]+)</type><code>([0-9a-fA-F]+)</code>'
-    r'<length>(\d+)</length>\s*'
-    r'(?:<data encoding="base64">\s*([^<]*)</data>)?</item>',
-    re.DOTALL
+# The metadata stream is a sequence of <item> elements with no document
+# element; the reader wraps it in this synthetic root so it parses as one document
+METADATA_ROOT = b"<metadata>"
+
+# Bytes per read from the metadata pipe (shairport writes items in bursts)
+METADATA_READ_SIZE = 65536
+
+# Hex-encoded type/code values seen in the stream -> ASCII (e.g. '73736e63' -> 'ssnc')
+_HEX_TO_ASCII = {
+    code.encode("ascii").hex(): code
+    for code in (
+        "ssnc", "core", "pvol", "pbeg", "pend", "pfls", "prsm", "prgr",
+        "mdst", "mden", "pcst", "pcen", "minm", "asar", "asal", "asgn",
+    )
+}
+
+# AirPlay volume (dB) -> percent for the whole-dB steps phones usually send,
+# indexed by dB + 144 over the full -144 (mute) .. 0 range
+_PVOL_PCT = tuple(
+    0 if db <= -144 else max(0, min(100, int((db + 30) * 100 / 30)))
+    for db in range(-144, 1)
 )
 
+# How long a found sink-input is reused before `pactl list sink-inputs` runs again
+_SINK_INPUT_CACHE_TTL = 2.0
+
+
+class MetadataParser:
+    """
+    Incremental parser for the shairport-sync metadata stream.
+    
+    Chunks are fed to expat as they arrive; completed <item> elements are
+    returned as (type_hex, code_hex, data_b64) tuples and then discarded.
+    Malformed input drops only the broken item; parsing resumes at the next <item>.
+    """
+
+    ITEM_START = b"<item>"
+    ITEM_END = b"</item>"
+
+    def __init__(self):
+        self._reset()
+        self._resyncing = False
+
+    def _reset(self) -> None:
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._parser.feed(METADATA_ROOT)
+        self._root: ET.Element | None = None
+
+    def feed(self, chunk: bytes) -> list[tuple[str, str, str]]:
+        """Feed a chunk of the stream and return the items it completed."""
+        items: list[tuple[str, str, str]] = []
+        if self._resyncing:
+            # Skip the rest of the broken item
+            _, sep, chunk = chunk.partition(self.ITEM_END)
+            if not sep:
+                return items
+            self._resyncing = False
+        
+        try:
+            self._parse(chunk, items)
+        except ET.ParseError as e:
+            logger.debug(f"Malformed metadata, resynchronising: {e}")
+            # Items parsed before the error each ended at one of the first
+            # len(items) item boundaries; carry on after the last of them
+            pos = 0
+            for _ in items:
+                pos = chunk.index(self.ITEM_END, pos) + len(self.ITEM_END)
+            self._reset()
+            self._resync(chunk, pos, items)
+        return items
+
+    def _resync(self, chunk: bytes, pos: int, items: list[tuple[str, str, str]]) -> None:
+        """Parse chunk[pos:] one item at a time, dropping only malformed items."""
+        while (start := chunk.find(self.ITEM_START, pos)) != -1:
+            end = chunk.find(self.ITEM_END, start)
+            if end == -1:
+                # Unfinished item - the next chunk continues it
+                try:
+                    self._parse(chunk[start:], items)
+                except ET.ParseError:
+                    self._reset()
+                    self._resyncing = True
+                return
+            
+            pos = end + len(self.ITEM_END)
+            try:
+                self._parse(chunk[start:pos], items)
+            except ET.ParseError:
+                self._reset()
+
+    def _parse(self, chunk: bytes, items: list[tuple[str, str, str]]) -> None:
+        """Feed chunk to the pull parser, appending completed items (kept on error)."""
+        self._parser.feed(chunk)
+        completed = len(items)
+        try:
+            for event, elem in self._parser.read_events():
+                if event == "start":
+                    if self._root is None:
+                        self._root = elem
+                elif elem.tag == "item":
+                    items.append((
+                        elem.findtext("type", ""),
+                        elem.findtext("code", ""),
+                        (elem.findtext("data") or "").strip(),
+                    ))
+        finally:
+            # Drop parsed items so the synthetic document doesn't grow
+            if len(items) > completed and self._root is not None:
+                self._root.clear()
+
 
 class AirPlaySource(AudioSource, PulseAudioMixin):
     """
@@ -57,33 +159,48 @@ class AirPlaySource(AudioSource, PulseAudioMixin):
         on_external_volume: Callable[[str, int], None] | None = None,
         poll_interval: float = 1.0,
         metadata_pipe: str | None = None,
+        cpu_affinity: bool = False,
     ):
         super().__init__(name="airplay", on_state_change=on_state_change, 
                          on_external_volume=on_external_volume)
         
         self._poll_interval = poll_interval
         self._metadata_pipe = metadata_pipe or self.METADATA_PIPE
+        self._cpu_affinity = cpu_affinity
         self._thread: threading.Thread | None = None
-        self._metadata_thread: threading.Thread | None = None
         self._sink_input_id: str | None = None
+        # (lookup time, sink-input info) shared by polling, volume sync and mute
+        self._sink_cache: tuple[float, dict | None] = (0.0, None)
+        
+        # Self-pipe written by stop() so the metadata reader can sleep without a timeout
+        self._stop_r: int | None = None
+        self._stop_w: int | None = None
+        
+        # (type, code) -> handler for the metadata items we act on; keys use the
+        # same interned strings _hex_to_ascii returns from _HEX_TO_ASCII
+        self._metadata_handlers: dict[tuple[str, str], Callable[[bytes], None]] = {
+            ("ssnc", "pvol"): self._handle_volume,
+            ("ssnc", "pbeg"): self._handle_play_begin,
+            ("ssnc", "pend"): self._handle_play_end,
+            ("core", "minm"): self._handle_title,
+            ("core", "asar"): self._handle_artist,
+            ("core", "asal"): self._handle_album,
+        }
         
         # AirPlay volume from phone (-144 to 0, where -144 is mute)
         self._airplay_volume: float = 0.0
         self._airplay_muted: bool = False
+        
+        # Last phone volume passed on, so repeated pvol events are dropped
+        self._last_external_volume: int | None = None
+        self._last_external_muted: bool | None = None
 
     def start(self) -> None:
         """Start AirPlay source monitoring."""
         self._running = True
+        self._stop_r, self._stop_w = os.pipe()
         
-        # Start metadata pipe reader thread
-        self._metadata_thread = threading.Thread(
-            target=self._run_metadata_reader,
-            daemon=True,
-            name="airplay-metadata",
-        )
-        self._metadata_thread.start()
-        
-        # Start state polling thread
+        # One thread handles both the metadata pipe and PulseAudio polling
         self._thread = threading.Thread(
             target=self._run,
             daemon=True,
@@ -96,108 +213,125 @@ class AirPlaySource(AudioSource, PulseAudioMixin):
     def stop(self) -> None:
         """Stop AirPlay source monitoring."""
         self._running = False
+        if self._stop_w is not None:
+            os.write(self._stop_w, b"x")  # Wake the event loop
         if self._thread:
             self._thread.join(timeout=5)
             self._thread = None
-        if self._metadata_thread:
-            self._metadata_thread.join(timeout=5)
-            self._metadata_thread = None
+        if self._stop_r is not None:
+            os.close(self._stop_r)
+            os.close(self._stop_w)
+            self._stop_r = self._stop_w = None
         logger.info("AirPlay source stopped")
 
-    def _run_metadata_reader(self) -> None:
-        """Read metadata from shairport-sync pipe (XML format)."""
+    def _pin_to_last_cpu(self) -> None:
+        """Keep this thread on one core so the parser's working set stays cached."""
+        try:
+            cpu = (os.cpu_count() or 1) - 1
+            os.sched_setaffinity(0, {cpu})  # 0: the calling thread on Linux
+            logger.info(f"AirPlay thread pinned to CPU {cpu}")
+        except (AttributeError, OSError) as e:
+            # Not Linux, or the CPU isn't in our allowed set
+            logger.debug(f"Could not pin AirPlay thread: {e}")
+
+    def _open_metadata_pipe(self) -> int | None:
+        """Open the shairport-sync metadata pipe (non-blocking), or None to retry later."""
+        try:
+            # Check if pipe exists
+            if not os.path.exists(self._metadata_pipe):
+                logger.warning(f"Metadata pipe does not exist: {self._metadata_pipe}")
+                return None
+            
+            logger.debug(f"Opening metadata pipe: {self._metadata_pipe}")
+            
+            # Open pipe (non-blocking); read raw bytes straight into the parser
+            fd = os.open(self._metadata_pipe, os.O_RDONLY | os.O_NONBLOCK)
+            logger.info(f"Metadata pipe opened successfully (fd={fd})")
+            return fd
+            
+        except OSError as e:
+            if e.errno == 6:  # No such device or address (pipe closed)
+                logger.info("Metadata pipe closed, will retry")
+            else:
+                logger.warning(f"Metadata pipe error (errno={e.errno}): {e}")
+            return None
+
+    def _run(self) -> None:
+        """Event loop: parse the metadata pipe and poll PulseAudio state.
+        
+        Sleeps in the selector until metadata arrives, the next poll is due,
+        or stop() writes to the self-pipe.
+        """
         logger.info(f"Starting metadata reader for {self._metadata_pipe}")
+        if self._cpu_affinity:
+            self._pin_to_last_cpu()
         
-        buffer = ""
+        fd: int | None = None
+        parser = MetadataParser()
         consecutive_empty_reads = 0
+        next_poll = next_open = time.monotonic()
         
-        while self._running:
+        with selectors.DefaultSelector() as sel:
+            sel.register(self._stop_r, selectors.EVENT_READ)
+            
             try:
-                # Check if pipe exists
-                if not os.path.exists(self._metadata_pipe):
-                    logger.warning(f"Metadata pipe does not exist: {self._metadata_pipe}")
-                    time.sleep(1)
-                    continue
-                
-                logger.debug(f"Opening metadata pipe: {self._metadata_pipe}")
-                
-                # Open pipe (non-blocking)
-                fd = os.open(self._metadata_pipe, os.O_RDONLY | os.O_NONBLOCK)
-                logger.debug(f"Opened fd={fd}, wrapping in file object...")
-                pipe = os.fdopen(fd, 'r', encoding='utf-8', errors='replace')
-                
-                logger.info(f"Metadata pipe opened successfully (fd={fd})")
-                buffer = ""
-                consecutive_empty_reads = 0
-                
                 while self._running:
-                    # Use select to avoid blocking forever
-                    readable, _, _ = select.select([pipe], [], [], 1.0)
-                    if not readable:
-                        continue
-                    
-                    # Read available data
-                    try:
-                        chunk = pipe.read(4096)
-                    except IOError as e:
-                        # Handle EAGAIN/EWOULDBLOCK - no data available yet
-                        import errno
-                        if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
-                            continue
-                        raise
+                    now = time.monotonic()
+                    if now >= next_poll:
+                        try:
+                            self._poll_state()
+                        except Exception as e:
+                            logger.debug(f"AirPlay poll error: {e}")
+                        next_poll = now + self._poll_interval
                     
-                    if not chunk:
-                        # Empty read - could be EOF or just no data
-                        # With non-blocking FIFO, this can happen transiently
-                        # Only consider pipe closed after many consecutive empty reads
-                        consecutive_empty_reads += 1
-                        if consecutive_empty_reads > 10:
-                            logger.debug("Metadata pipe appears closed (repeated empty reads)")
-                            break
-                        continue
-                    
-                    # Got data - reset counter
-                    consecutive_empty_reads = 0
-                    buffer += chunk
+                    if fd is None and now >= next_open:
+                        fd = self._open_metadata_pipe()
+                        if fd is None:
+                            next_open = now + 1.0
+                        else:
+                            sel.register(fd, selectors.EVENT_READ)
+                            parser = MetadataParser()
+                            consecutive_empty_reads = 0
                     
-                    # Extract complete <item>...</item> elements
-                    while True:
-                        match = METADATA_ITEM_RE.search(buffer)
-                        if not match:
-                            # No complete item, trim buffer if it's getting too long
-                            if len(buffer) > 10000:
-                                # Find last complete item end
-                                last_end = buffer.rfind('</item>')
-                                if last_end > 0:
-                                    buffer = buffer[last_end + 7:]
-                            break
+                    deadline = next_poll if fd is not None else min(next_poll, next_open)
+                    for key, _ in sel.select(max(0.0, deadline - time.monotonic())):
+                        if key.fd == self._stop_r:
+                            return
                         
-                        # Process the item
-                        type_hex = match.group(1)
-                        code_hex = match.group(2)
-                        data_b64 = match.group(4) or ""
+                        try:
+                            chunk = os.read(fd, METADATA_READ_SIZE)
+                        except BlockingIOError:
+                            # EAGAIN/EWOULDBLOCK - no data available yet
+                            continue
                         
-                        self._process_metadata_xml(type_hex, code_hex, data_b64)
+                        if not chunk:
+                            # Empty read - could be EOF or just no data
+                            # With non-blocking FIFO, this can happen transiently
+                            # Only consider pipe closed after many consecutive empty reads
+                            consecutive_empty_reads += 1
+                            if consecutive_empty_reads > 10:
+                                logger.debug("Metadata pipe appears closed (repeated empty reads)")
+                                sel.unregister(fd)
+                                os.close(fd)
+                                fd = None
+                            continue
                         
-                        # Remove processed item from buffer
-                        buffer = buffer[match.end():]
-                
-                pipe.close()
-                
-            except OSError as e:
-                if e.errno == 6:  # No such device or address (pipe closed)
-                    logger.info("Metadata pipe closed, will retry")
-                else:
-                    logger.warning(f"Metadata pipe error (errno={e.errno}): {e}")
-                time.sleep(1)
-            except Exception as e:
-                logger.warning(f"Metadata reader error: {type(e).__name__}: {e}")
-                time.sleep(1)
-        
-        logger.info("Metadata reader stopped")
+                        # Got data - reset counter
+                        consecutive_empty_reads = 0
+                        
+                        # Process the complete <item> elements in this chunk
+                        for type_hex, code_hex, data_b64 in parser.feed(chunk):
+                            self._process_metadata_xml(type_hex, code_hex, data_b64)
+            finally:
+                if fd is not None:
+                    os.close(fd)
+                logger.info("Metadata reader stopped")
 
     def _hex_to_ascii(self, hex_str: str) -> str:
         """Convert hex string to ASCII (e.g., '73736e63' -> 'ssnc')."""
+        known = _HEX_TO_ASCII.get(hex_str)
+        if known is not None:
+            return known
         try:
             return bytes.fromhex(hex_str).decode('ascii')
         except (ValueError, UnicodeDecodeError):
@@ -209,65 +343,83 @@ class AirPlaySource(AudioSource, PulseAudioMixin):
             type_str = self._hex_to_ascii(type_hex)
             code_str = self._hex_to_ascii(code_hex)
             
+            handler = self._metadata_handlers.get((type_str, code_str))
+            if handler is None:
+                logger.debug(f"Metadata: type={type_str} code={code_str} (ignored)")
+                return
+            
             # Decode base64 data if present
             data = base64.b64decode(data_b64) if data_b64.strip() else b''
             
             logger.debug(f"Metadata: type={type_str} code={code_str} data_len={len(data)}")
-            
-            # Volume: ssnc pvol
-            if type_str == 'ssnc' and code_str == 'pvol':
-                # Volume data format: "airplay_volume,volume,lowest_volume,highest_volume"
-                # airplay_volume is -144 (mute) to 0 (max)
-                try:
-                    parts = data.decode('ascii').split(',')
-                    if len(parts) >= 1:
-                        airplay_vol = float(parts[0])
-                        
-                        # Convert AirPlay volume (-144 to 0) to 0-100%
-                        if airplay_vol <= -144:
-                            volume = 0
-                            self._airplay_muted = True
-                        else:
-                            # Linear conversion: -30 to 0 -> 0 to 100
-                            # AirPlay typically uses -30 to 0 range
-                            volume = max(0, min(100, int((airplay_vol + 30) * 100 / 30)))
-                            self._airplay_muted = False
-                        
-                        self._airplay_volume = volume
-                        logger.info(f"AirPlay volume from phone: {airplay_vol} dB -> {volume}%")
-                        
-                        # Apply volume to PulseAudio sink-input
-                        self._sync_volume_to_pulseaudio(volume)
-                        
-                        # Notify mixer of external volume change (updates HA)
-                        if self.on_external_volume:
-                            self.on_external_volume(self.name, volume)
-                        else:
-                            self._update_state(volume=volume)
-                        
-                except (ValueError, IndexError) as e:
-                    logger.debug(f"Failed to parse volume: {data} - {e}")
-            
-            # Play start: ssnc pbeg
-            elif type_str == 'ssnc' and code_str == 'pbeg':
-                logger.info("AirPlay playback started")
-            
-            # Play end: ssnc pend
-            elif type_str == 'ssnc' and code_str == 'pend':
-                logger.info("AirPlay playback ended")
-            
-            # Track info: core asal (album), core asar (artist), core minm (title)
-            elif type_str == 'core':
-                if code_str == 'minm':
-                    title = data.decode('utf-8', errors='ignore')
-                    logger.debug(f"AirPlay track: {title}")
-                elif code_str == 'asar':
-                    artist = data.decode('utf-8', errors='ignore')
-                    logger.debug(f"AirPlay artist: {artist}")
+            handler(data)
                     
         except Exception as e:
             logger.debug(f"Error processing metadata: {e}")
 
+    def _handle_volume(self, data: bytes) -> None:
+        """ssnc pvol: volume set on the phone."""
+        # Volume data format: "airplay_volume,volume,lowest_volume,highest_volume"
+        # airplay_volume is -144 (mute) to 0 (max)
+        try:
+            airplay_vol = float(data.partition(b',')[0])
+        except ValueError as e:
+            logger.debug(f"Failed to parse volume: {data} - {e}")
+            return
+        
+        # Convert AirPlay volume (-144 to 0) to 0-100%
+        if airplay_vol <= -144:
+            volume = 0
+            self._airplay_muted = True
+        else:
+            # Linear conversion: -30 to 0 -> 0 to 100
+            # AirPlay typically uses -30 to 0 range
+            db = int(airplay_vol)
+            if db == airplay_vol and db <= 0:
+                volume = _PVOL_PCT[db + 144]
+            else:
+                # Fractional dB (rare) or out of range
+                volume = max(0, min(100, int((airplay_vol + 30) * 100 / 30)))
+            self._airplay_muted = False
+        
+        if volume == self._last_external_volume and self._airplay_muted == self._last_external_muted:
+            logger.debug(f"AirPlay volume from phone unchanged: {volume}%")
+            return
+        self._last_external_volume = volume
+        self._last_external_muted = self._airplay_muted
+        
+        self._airplay_volume = volume
+        logger.info(f"AirPlay volume from phone: {airplay_vol} dB -> {volume}%")
+        
+        # Apply volume to PulseAudio sink-input
+        self._sync_volume_to_pulseaudio(volume)
+        
+        # Notify mixer of external volume change (updates HA)
+        if self.on_external_volume:
+            self.on_external_volume(self.name, volume)
+        else:
+            self._update_state(volume=volume)
+
+    def _handle_play_begin(self, data: bytes) -> None:
+        """ssnc pbeg: play session started."""
+        logger.info("AirPlay playback started")
+
+    def _handle_play_end(self, data: bytes) -> None:
+        """ssnc pend: play session ended."""
+        logger.info("AirPlay playback ended")
+
+    def _handle_title(self, data: bytes) -> None:
+        """core minm: track title."""
+        logger.debug(f"AirPlay track: {data.decode('utf-8', errors='ignore')}")
+
+    def _handle_artist(self, data: bytes) -> None:
+        """core asar: track artist."""
+        logger.debug(f"AirPlay artist: {data.decode('utf-8', errors='ignore')}")
+
+    def _handle_album(self, data: bytes) -> None:
+        """core asal: track album."""
+        logger.debug(f"AirPlay album: {data.decode('utf-8', errors='ignore')}")
+
     def _sync_volume_to_pulseaudio(self, volume: int) -> None:
         """Sync volume from phone to PulseAudio sink-input."""
         if not self._sink_input_id:
@@ -276,27 +428,37 @@ class AirPlaySource(AudioSource, PulseAudioMixin):
                 self._sink_input_id = info.get("id")
         
         if self._sink_input_id:
-            self._set_sink_input_volume(self._sink_input_id, volume)
-            logger.debug(f"Synced AirPlay volume {volume}% to PulseAudio")
-
-    def _run(self) -> None:
-        """Main polling loop for PulseAudio state."""
-        while self._running:
-            try:
-                self._poll_state()
-            except Exception as e:
-                logger.debug(f"AirPlay poll error: {e}")
-            
-            time.sleep(self._poll_interval)
+            if self._set_sink_input_volume(self._sink_input_id, volume):
+                self._update_sink_cache(volume=volume)
+                logger.debug(f"Synced AirPlay volume {volume}% to PulseAudio")
+            else:
+                self._invalidate_sink_cache()
 
     def _find_airplay_sink_input(self) -> dict | None:
-        """Find AirPlay sink-input (shairport-sync)."""
+        """Find AirPlay sink-input (shairport-sync), reusing a recent lookup."""
+        looked_up_at, cached = self._sink_cache
+        now = time.monotonic()
+        if cached is not None and now - looked_up_at < _SINK_INPUT_CACHE_TTL:
+            return cached
+        
         for pattern in self.SINK_INPUT_PATTERNS:
             info = self._get_sink_input_info(pattern)
             if info:
+                self._sink_cache = (now, info)
                 return info
+        self._sink_cache = (now, None)
         return None
 
+    def _update_sink_cache(self, **fields) -> None:
+        """Record a successful change so the cached info doesn't report stale values."""
+        looked_up_at, cached = self._sink_cache
+        if cached is not None:
+            self._sink_cache = (looked_up_at, {**cached, **fields})
+
+    def _invalidate_sink_cache(self) -> None:
+        """Force the next lookup to query PulseAudio (e.g. after a failed set)."""
+        self._sink_cache = (0.0, None)
+
     def _poll_state(self) -> None:
         """Poll current state from PulseAudio."""
         info = self._find_airplay_sink_input()
@@ -342,6 +504,8 @@ class AirPlaySource(AudioSource, PulseAudioMixin):
         The phone controls AirPlay volume, but we can adjust output via PA.
         """
         volume = max(0, min(100, volume))
+        # The next phone volume must be applied even if it repeats the last one
+        self._last_external_volume = None
         
         if not self._sink_input_id:
             info = self._find_airplay_sink_input()
@@ -351,9 +515,11 @@ class AirPlaySource(AudioSource, PulseAudioMixin):
         if self._sink_input_id:
             success = self._set_sink_input_volume(self._sink_input_id, volume)
             if success:
+                self._update_sink_cache(volume=volume)
                 self._airplay_volume = volume
                 self._update_state(volume=volume)
                 return True
+            self._invalidate_sink_cache()
         
         # Still update state for HA even if PA failed
         self._airplay_volume = volume
@@ -366,7 +532,7 @@ class AirPlaySource(AudioSource, PulseAudioMixin):
 
     def set_muted(self, muted: bool) -> bool:
         """Set mute via sink-input."""
-        # Always refresh sink-input ID
+        # Refresh sink-input ID (from the shared lookup cache)
         info = self._find_airplay_sink_input()
         if info:
             self._sink_input_id = info.get("id")
@@ -378,15 +544,18 @@ class AirPlaySource(AudioSource, PulseAudioMixin):
         logger.info(f"Setting AirPlay mute={muted} on sink-input {self._sink_input_id}")
         success = self._set_sink_input_mute(self._sink_input_id, muted)
         if success:
+            self._update_sink_cache(muted=muted)
             self._update_state(muted=muted)
             logger.info(f"AirPlay mute set to {muted}")
         else:
+            self._invalidate_sink_cache()
             logger.warning(f"Failed to set AirPlay mute on sink-input {self._sink_input_id}")
         return success
 
     def get_level(self) -> int:
         """Get current audio level (stub)."""
-        if self._state.state == PlaybackState.PLAYING and not self._state.muted:
+        state = self._state
+        if state.state == PlaybackState.PLAYING and not state.muted:
             return 50
         return 0
 
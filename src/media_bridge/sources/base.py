@@ -7,18 +7,84 @@ unified volume, mute, level, and state management.
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
 import re
+import shutil
 import subprocess
 import threading
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
-from typing import Callable
+from typing import Any, Callable
+
+try:
+    from fastrlock.rlock import FastRLock
+    HAS_FASTRLOCK = True
+except ImportError:
+    HAS_FASTRLOCK = False
+
+try:
+    import pulsectl
+    HAS_PULSECTL = True
+except ImportError:
+    HAS_PULSECTL = False
 
 logger = logging.getLogger(__name__)
 
+# First percentage in pactl volume output (e.g. "front-left: 42597 /  65% / ...")
+_PCT_RE = re.compile(r'(\d+)%')
+
+# The `pactl list sink-inputs` lines PulseAudioMixin reads; one finditer pass
+# over the output replaces splitting and stripping every line
+_SINK_INPUT_LINE_RE = re.compile(
+    r'^Sink Input #(\d+)'
+    r'|^[ \t]+(Corked|Mute|Volume): ([^\n]*)'
+    r'|^[ \t]+application\.process\.binary = "([^"\n]*)"',
+    re.MULTILINE,
+)
+
+
+def _parse_sink_input(output: str, pattern: str) -> dict | None:
+    """First sink-input in `pactl list sink-inputs` output whose binary contains pattern."""
+    current: dict | None = None
+    for match in _SINK_INPUT_LINE_RE.finditer(output):
+        sink_id, key, value, binary = match.groups()
+        
+        if sink_id is not None:
+            if current is not None and pattern in current.get("binary", "").lower():
+                return current
+            current = {"id": sink_id}
+        elif current is None:
+            continue
+        elif key == "Corked":
+            current["corked"] = value.strip().lower() == "yes"
+        elif key == "Mute":
+            current["muted"] = value.strip().lower() == "yes"
+        elif key == "Volume":
+            pct = _PCT_RE.search(value)
+            if pct:
+                current["volume"] = int(pct.group(1))
+        else:
+            current["binary"] = binary
+    
+    if current is not None and pattern in current.get("binary", "").lower():
+        return current
+    return None
+
+
+# Absolute pactl path: together with close_fds=False this lets subprocess use
+# posix_spawn instead of fork+exec (our own fds are non-inheritable anyway)
+_PACTL = shutil.which("pactl") or "pactl"
+
+# Seconds before a pactl fallback call is abandoned
+_PACTL_TIMEOUT = 5
+
+# Returned by PulseAudioMixin._pulse_call when libpulse can't be used (fall back to pactl)
+_NO_PULSE = object()
+
 
 class PlaybackState(Enum):
     """Playback states."""
@@ -27,7 +93,7 @@ class PlaybackState(Enum):
     PAUSED = "paused"
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceState:
     """Current state of an audio source."""
     name: str
@@ -38,7 +104,7 @@ class SourceState:
     level_db: float = -100.0  # Current level in dB
     title: str = ""
     artist: str = ""
-    last_update: float = field(default_factory=time.time)
+    last_update: int = field(default_factory=time.monotonic_ns)  # time.monotonic_ns()
 
     def to_dict(self) -> dict:
         return {
@@ -53,6 +119,16 @@ class SourceState:
         }
 
 
+# Keys _update_state accepts
+_SOURCE_STATE_FIELDS = frozenset(f.name for f in fields(SourceState))
+
+# VU meter fields are stored on every update but only notified when the level
+# moves by LEVEL_NOTIFY_STEP or LEVEL_NOTIFY_INTERVAL has passed
+_LEVEL_FIELDS = frozenset(("level", "level_db"))
+LEVEL_NOTIFY_INTERVAL = 0.1  # seconds
+LEVEL_NOTIFY_STEP = 5
+
+
 class StateCallback:
     """Protocol for state change callbacks."""
     def __call__(self, source: str, key: str, value: any) -> None: ...
@@ -82,24 +158,19 @@ class AudioSource(ABC):
         # This allows the mixer to apply slew rate and other processing
         self.on_external_volume = on_external_volume
         
+        # Published snapshot: writers swap in a new SourceState instead of
+        # mutating this one, so lock-free reads of its fields are consistent
         self._state = SourceState(name=name)
-        self._lock = threading.RLock()  # Reentrant lock - callbacks may re-acquire
+        # Reentrant lock serialising writers - callbacks may re-acquire (Cython FastRLock if installed)
+        self._lock = FastRLock() if HAS_FASTRLOCK else threading.RLock()
         self._running = False
+        # key -> (monotonic time, value) of the last level notification
+        self._level_notified: dict[str, tuple[float, float]] = {}
 
     @property
     def state(self) -> SourceState:
         """Get current source state (thread-safe copy)."""
-        with self._lock:
-            return SourceState(
-                name=self._state.name,
-                state=self._state.state,
-                volume=self._state.volume,
-                muted=self._state.muted,
-                level=self._state.level,
-                title=self._state.title,
-                artist=self._state.artist,
-                last_update=self._state.last_update,
-            )
+        return replace(self._state)
 
     def _notify(self, key: str, value: any) -> None:
         """Notify callback of state change."""
@@ -107,19 +178,51 @@ class AudioSource(ABC):
             self.on_state_change(self.name, key, value)
 
     def _update_state(self, **kwargs) -> None:
-        """Update state and notify on changes."""
+        """Update state and notify on changes.
+        
+        Publishes a new SourceState rather than mutating the current one, so
+        get_volume()/get_muted()/is_active() read self._state without the lock.
+        Callbacks run after the lock is released, so slow listeners don't
+        block other writers. level/level_db notifications are throttled.
+        """
+        changes = []
         with self._lock:
-            changed = False
+            state = self._state
+            updates = {}
             for key, value in kwargs.items():
-                if hasattr(self._state, key):
-                    current = getattr(self._state, key)
-                    if current != value:
-                        setattr(self._state, key, value)
-                        changed = True
-                        self._notify(key, value.value if isinstance(value, Enum) else value)
+                if key not in _SOURCE_STATE_FIELDS:
+                    continue
+                current = getattr(state, key)
+                if current != value:
+                    updates[key] = value
+                if key in _LEVEL_FIELDS:
+                    # Compared with the last notified value, so a throttled
+                    # level is still sent once the level settles on it
+                    if self._level_due(key, value, current):
+                        changes.append((key, value))
+                elif current != value:
+                    changes.append((key, value.value if isinstance(value, Enum) else value))
             
-            if changed:
-                self._state.last_update = time.time()
+            if updates:
+                self._state = replace(state, last_update=time.monotonic_ns(), **updates)
+        
+        for key, value in changes:
+            self._notify(key, value)
+
+    def _level_due(self, key: str, value: float, current: float) -> bool:
+        """Whether a level update should be notified (call with _lock held).
+        
+        current is the stored value, which counts as notified until the first
+        notification for key.
+        """
+        now = time.monotonic()
+        last_time, last_value = self._level_notified.get(key, (float("-inf"), current))
+        if value == last_value:
+            return False
+        if now - last_time < LEVEL_NOTIFY_INTERVAL and abs(value - last_value) < LEVEL_NOTIFY_STEP:
+            return False
+        self._level_notified[key] = (now, value)
+        return True
 
     @abstractmethod
     def start(self) -> None:
@@ -180,49 +283,206 @@ class AudioSource(ABC):
         return False
 
 
+class SourceScheduler:
+    """
+    One shared thread running periodic source polls.
+    
+    Sources without an event-driven loop register a tick here instead of
+    each sleeping in a thread of their own. With nothing scheduled the
+    thread sleeps without a timeout.
+    """
+
+    def __init__(self, name: str = "source-scheduler"):
+        self._name = name
+        self._cond = threading.Condition()
+        # (due, job id, interval, tick) - job id breaks ties between equal deadlines
+        self._heap: list[tuple[float, int, float, Callable[[], None]]] = []
+        self._cancelled: set[int] = set()
+        self._ids = itertools.count()
+        self._thread: threading.Thread | None = None
+
+    def schedule(self, interval: float, tick: Callable[[], None]) -> int:
+        """Run tick now and then every interval seconds. Returns a job id for cancel()."""
+        with self._cond:
+            job = next(self._ids)
+            heapq.heappush(self._heap, (time.monotonic(), job, interval, tick))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name=self._name)
+                self._thread.start()
+            self._cond.notify()
+        return job
+
+    def cancel(self, job: int) -> None:
+        """Stop running a scheduled tick (a tick already running finishes)."""
+        with self._cond:
+            self._cancelled.add(job)
+            self._cond.notify()
+
+    def _next_due(self) -> tuple[float, int, float, Callable[[], None]]:
+        """Wait for the earliest live job to fall due and pop it. Requires _cond."""
+        while True:
+            while self._heap and self._heap[0][1] in self._cancelled:
+                self._cancelled.discard(heapq.heappop(self._heap)[1])
+            
+            timeout = None
+            if self._heap:
+                timeout = self._heap[0][0] - time.monotonic()
+                if timeout <= 0:
+                    return heapq.heappop(self._heap)
+            self._cond.wait(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                due, job, interval, tick = self._next_due()
+            
+            try:
+                tick()
+            except Exception as e:
+                logger.error(f"Scheduled source poll failed: {e}")
+            
+            with self._cond:
+                if job in self._cancelled:
+                    self._cancelled.discard(job)
+                else:
+                    # Keep the cadence, but don't queue up missed runs
+                    heapq.heappush(self._heap, (max(due + interval, time.monotonic()), job, interval, tick))
+
+
+# Shared by all sources
+source_scheduler = SourceScheduler()
+
+
 class PulseAudioMixin:
     """
     Mixin providing PulseAudio sink-input operations.
     
     Used by sources that output to PulseAudio (Spotify, AirPlay, TV).
+    
+    With pulsectl installed, all sources share one persistent libpulse
+    connection; otherwise (or if it fails) each call runs pactl.
     """
 
+    # Shared libpulse connection (None: not connected). pulsectl connections
+    # aren't thread-safe, so every use holds _pulse_lock.
+    _pulse: pulsectl.Pulse | None = None
+    _pulse_lock = threading.Lock()
+    
+    # Channel count per sink-input index (indices are never reused), so a
+    # volume set is a single libpulse call once the sink-input has been seen
+    _pulse_channels: dict[int, int] = {}
+
+    @staticmethod
+    def _pulse_call(op: Callable[[pulsectl.Pulse], Any]) -> Any:
+        """Run op on the shared libpulse connection, connecting on first use.
+        
+        Returns None if PulseAudio rejected the operation (e.g. the sink-input
+        is gone), or _NO_PULSE if libpulse is unavailable, in which case the
+        connection is dropped (reopened on next use) and the caller uses pactl.
+        """
+        if not HAS_PULSECTL:
+            return _NO_PULSE
+        with PulseAudioMixin._pulse_lock:
+            try:
+                if PulseAudioMixin._pulse is None:
+                    PulseAudioMixin._pulse = pulsectl.Pulse("media-bridge-sources")
+                return op(PulseAudioMixin._pulse)
+            except (pulsectl.PulseIndexError, pulsectl.PulseOperationFailed) as e:
+                logger.debug(f"PulseAudio operation failed: {e}")
+                return None
+            except Exception as e:
+                logger.debug(f"libpulse call failed, using pactl: {e}")
+                pulse, PulseAudioMixin._pulse = PulseAudioMixin._pulse, None
+                if pulse is not None:
+                    try:
+                        pulse.close()
+                    except Exception:
+                        pass
+                return _NO_PULSE
+
+    @staticmethod
+    def _pulse_find(pulse: pulsectl.Pulse, pattern: str) -> pulsectl.PulseSinkInputInfo | None:
+        """First sink-input whose application.process.binary contains pattern."""
+        for si in pulse.sink_input_list():
+            if pattern in si.proplist.get("application.process.binary", "").lower():
+                PulseAudioMixin._remember_channels(si)
+                return si
+        return None
+
+    @staticmethod
+    def _remember_channels(si: pulsectl.PulseSinkInputInfo) -> None:
+        """Record a sink-input's channel count for later volume sets. Requires _pulse_lock."""
+        channels = PulseAudioMixin._pulse_channels
+        if len(channels) >= 64:
+            channels.clear()  # Drop entries for long-gone sink-inputs
+        channels[si.index] = len(si.volume.values)
+
+    @staticmethod
+    def _pulse_set_volume(pulse: pulsectl.Pulse, index: int, volume: int) -> bool:
+        """Set a sink-input's volume on all channels (0-100). Requires _pulse_lock."""
+        channels = PulseAudioMixin._pulse_channels.get(index)
+        if channels is None:
+            si = pulse.sink_input_info(index)
+            PulseAudioMixin._remember_channels(si)
+            channels = len(si.volume.values)
+        pulse.sink_input_volume_set(index, pulsectl.PulseVolumeInfo(volume / 100.0, channels))
+        return True
+
+    @staticmethod
+    def _pulse_sink_input_dict(si: pulsectl.PulseSinkInputInfo) -> dict:
+        """Sink-input info in the same form as the pactl parser produces."""
+        info = {
+            "id": str(si.index),
+            "corked": bool(si.corked),
+            "muted": bool(si.mute),
+            "volume": round(si.volume.value_flat * 100),
+        }
+        binary = si.proplist.get("application.process.binary")
+        if binary is not None:
+            info["binary"] = binary
+        return info
+
     def _find_sink_input(self, pattern: str) -> str | None:
         """Find sink-input ID matching pattern in application.process.binary."""
+        si = self._pulse_call(lambda pulse: self._pulse_find(pulse, pattern))
+        if si is not _NO_PULSE:
+            return str(si.index) if si is not None else None
+        
         try:
             result = subprocess.run(
-                ["pactl", "list", "sink-inputs"],
+                [_PACTL, "list", "sink-inputs"],
                 capture_output=True,
                 text=True,
-                timeout=5,
+                timeout=_PACTL_TIMEOUT,
+                close_fds=False,
             )
             if result.returncode != 0:
                 return None
             
-            current_id = None
-            for line in result.stdout.split('\n'):
-                stripped = line.strip()
-                if stripped.startswith("Sink Input #"):
-                    current_id = stripped.split("#")[1]
-                elif "application.process.binary" in stripped and pattern in stripped.lower():
-                    return current_id
-            
-            return None
+            info = _parse_sink_input(result.stdout, pattern)
+            return info["id"] if info else None
         except Exception as e:
             logger.debug(f"Error finding sink-input: {e}")
             return None
 
     def _get_sink_input_volume(self, sink_input_id: str) -> int | None:
         """Get volume of a sink-input (0-100)."""
+        volume = self._pulse_call(
+            lambda pulse: round(pulse.sink_input_info(int(sink_input_id)).volume.value_flat * 100)
+        )
+        if volume is not _NO_PULSE:
+            return volume
+        
         try:
             result = subprocess.run(
-                ["pactl", "get-sink-input-volume", sink_input_id],
+                [_PACTL, "get-sink-input-volume", sink_input_id],
                 capture_output=True,
                 text=True,
-                timeout=5,
+                timeout=_PACTL_TIMEOUT,
+                close_fds=False,
             )
             if result.returncode == 0:
-                match = re.search(r'(\d+)%', result.stdout)
+                match = _PCT_RE.search(result.stdout)
                 if match:
                     return int(match.group(1))
         except Exception as e:
@@ -231,12 +491,17 @@ class PulseAudioMixin:
 
     def _set_sink_input_volume(self, sink_input_id: str, volume: int) -> bool:
         """Set volume of a sink-input (0-100)."""
+        volume = max(0, min(100, volume))
+        ok = self._pulse_call(lambda pulse: self._pulse_set_volume(pulse, int(sink_input_id), volume))
+        if ok is not _NO_PULSE:
+            return bool(ok)
+        
         try:
-            volume = max(0, min(100, volume))
             result = subprocess.run(
-                ["pactl", "set-sink-input-volume", sink_input_id, f"{volume}%"],
+                [_PACTL, "set-sink-input-volume", sink_input_id, f"{volume}%"],
                 capture_output=True,
-                timeout=5,
+                timeout=_PACTL_TIMEOUT,
+                close_fds=False,
             )
             return result.returncode == 0
         except Exception as e:
@@ -245,12 +510,17 @@ class PulseAudioMixin:
 
     def _get_sink_input_mute(self, sink_input_id: str) -> bool | None:
         """Get mute state of a sink-input."""
+        muted = self._pulse_call(lambda pulse: bool(pulse.sink_input_info(int(sink_input_id)).mute))
+        if muted is not _NO_PULSE:
+            return muted
+        
         try:
             result = subprocess.run(
-                ["pactl", "get-sink-input-mute", sink_input_id],
+                [_PACTL, "get-sink-input-mute", sink_input_id],
                 capture_output=True,
                 text=True,
-                timeout=5,
+                timeout=_PACTL_TIMEOUT,
+                close_fds=False,
             )
             if result.returncode == 0:
                 return "yes" in result.stdout.lower()
@@ -260,69 +530,51 @@ class PulseAudioMixin:
 
     def _set_sink_input_mute(self, sink_input_id: str, muted: bool) -> bool:
         """Set mute state of a sink-input."""
+        ok = self._pulse_call(lambda pulse: pulse.sink_input_mute(int(sink_input_id), muted) or True)
+        if ok is not _NO_PULSE:
+            return bool(ok)
+        
         try:
             result = subprocess.run(
-                ["pactl", "set-sink-input-mute", sink_input_id, "1" if muted else "0"],
+                [_PACTL, "set-sink-input-mute", sink_input_id, "1" if muted else "0"],
                 capture_output=True,
-                timeout=5,
+                timeout=_PACTL_TIMEOUT,
+                close_fds=False,
             )
             return result.returncode == 0
         except Exception as e:
             logger.error(f"Error setting sink-input mute: {e}")
             return False
 
+    def _get_sink_input_info_by_id(self, sink_input_id: str) -> dict | None:
+        """Info for one sink-input by id over libpulse.
+        
+        Returns None if the sink-input is gone or libpulse is unavailable
+        (pactl has no single-sink-input listing); callers then search by pattern.
+        """
+        si = self._pulse_call(lambda pulse: pulse.sink_input_info(int(sink_input_id)))
+        if si is _NO_PULSE or si is None:
+            return None
+        return self._pulse_sink_input_dict(si)
+
     def _get_sink_input_info(self, pattern: str) -> dict | None:
         """Get full info about a sink-input matching pattern."""
+        si = self._pulse_call(lambda pulse: self._pulse_find(pulse, pattern))
+        if si is not _NO_PULSE:
+            return self._pulse_sink_input_dict(si) if si is not None else None
+        
         try:
             result = subprocess.run(
-                ["pactl", "list", "sink-inputs"],
+                [_PACTL, "list", "sink-inputs"],
                 capture_output=True,
                 text=True,
-                timeout=5,
+                timeout=_PACTL_TIMEOUT,
+                close_fds=False,
             )
             if result.returncode != 0:
                 return None
             
-            current = {}
-            found = False
-            
-            for line in result.stdout.split('\n'):
-                stripped = line.strip()
-                
-                if stripped.startswith("Sink Input #"):
-                    if found and current:
-                        return current
-                    current = {"id": stripped.split("#")[1]}
-                    found = False
-                elif current:
-                    if ": " in stripped and "=" not in stripped:
-                        key, _, value = stripped.partition(": ")
-                        key = key.strip()
-                        value = value.strip()
-                        
-                        if key == "Corked":
-                            current["corked"] = value.lower() == "yes"
-                        elif key == "Mute":
-                            current["muted"] = value.lower() == "yes"
-                        elif key == "Volume":
-                            match = re.search(r'(\d+)%', value)
-                            if match:
-                                current["volume"] = int(match.group(1))
-                    
-                    elif " = " in stripped:
-                        key, _, value = stripped.partition(" = ")
-                        key = key.strip()
-                        value = value.strip().strip('"')
-                        
-                        if key == "application.process.binary":
-                            current["binary"] = value
-                            if pattern in value.lower():
-                                found = True
-            
-            if found and current:
-                return current
-            
-            return None
+            return _parse_sink_input(result.stdout, pattern)
         except Exception as e:
             logger.debug(f"Error getting sink-input info: {e}")
             return None
@@ -24,11 +24,32 @@ try:
 except ImportError:
     HAS_DBUS = False
 
-from media_bridge.sources.base import AudioSource, PlaybackState, PulseAudioMixin
+try:
+    from dbus.mainloop.glib import DBusGMainLoop
+    from gi.repository import GLib
+    HAS_GLIB = True
+except ImportError:
+    HAS_GLIB = False
+
+try:
+    import pulsectl
+    HAS_PULSECTL = True
+except ImportError:
+    HAS_PULSECTL = False
+
+from media_bridge.sources.base import AudioSource, PlaybackState, PulseAudioMixin, source_scheduler
 
 logger = logging.getLogger(__name__)
 
 
+def _ignore_reply(*args) -> None:
+    """Reply handler for MPRIS calls whose result isn't needed."""
+
+
+def _log_mpris_volume_error(e: Exception) -> None:
+    logger.debug(f"MPRIS volume sync failed: {e}")
+
+
 class SpotifySource(AudioSource, PulseAudioMixin):
     """
     Spotify audio source via spotifyd.
@@ -39,13 +60,23 @@ class SpotifySource(AudioSource, PulseAudioMixin):
 
     # spotifyd uses non-standard MPRIS naming: rs.spotifyd.instance<PID>
     # But also registers standard MPRIS: org.mpris.MediaPlayer2.spotifyd.instance<PID>
-    MPRIS_PREFIXES = [
+    MPRIS_PREFIXES = (
         "org.mpris.MediaPlayer2.spotifyd",  # Standard MPRIS (preferred)
         "rs.spotifyd.instance",              # Non-standard fallback
-    ]
+    )
     MPRIS_PATH = "/org/mpris/MediaPlayer2"
     MPRIS_PLAYER_IFACE = "org.mpris.MediaPlayer2.Player"
     DBUS_PROPS_IFACE = "org.freedesktop.DBus.Properties"
+    
+    # With PulseAudio events / MPRIS signals, state is still fully re-read this often (seconds)
+    SAFETY_REFRESH_INTERVAL = 30.0
+    
+    # Quiet period before a Spotify app volume change is applied, so a slider
+    # drag becomes one PulseAudio write and one HA update (seconds)
+    VOLUME_SYNC_DELAY = 0.08
+    
+    # How long a found sink-input id is trusted before searching for spotifyd again (seconds)
+    SINK_ID_TTL = 10.0
 
     def __init__(
         self,
@@ -58,11 +89,43 @@ class SpotifySource(AudioSource, PulseAudioMixin):
         
         self._poll_interval = poll_interval
         self._thread: threading.Thread | None = None
+        # Polling job on the shared scheduler (used when PulseAudio events aren't)
+        self._poll_job: int | None = None
+        self._next_mpris_refresh = 0.0
         self._bus: dbus.SessionBus | None = None
         self._sink_input_id: str | None = None
+        # When _sink_input_id was found (monotonic), and whether a PulseAudio
+        # new/remove event means it must be searched for again
+        self._sink_input_id_ts = 0.0
+        self._sink_id_stale = True
         self._last_level_time = 0
         self._mpris_name: str | None = None  # Discovered MPRIS bus name
         self._last_mpris_volume: int = -1  # Track last volume to detect changes
+        
+        # Sink-input state from the last PulseAudio read
+        self._sink_volume: int | None = None
+        self._sink_muted = False
+        self._sink_active = False
+        # Set by the PulseAudio event callback; the loop then re-reads the sink-input
+        self._pulse_dirty = False
+        
+        # (state, volume, muted, title, artist) from the last poll; cleared when
+        # state is changed by other means so the next poll reapplies it
+        self._last_polled: tuple | None = None
+        
+        # Latest Spotify app volume waiting for the debounce timer
+        self._vol_sync_lock = threading.Lock()
+        self._vol_sync_pending: int | None = None
+        self._vol_sync_timer: threading.Timer | None = None
+        
+        # Signal-driven MPRIS state (only used when a GLib main context is pumped):
+        # player properties kept current by PropertiesChanged, and whether
+        # NameOwnerChanged says spotifyd may have (re)appeared on the bus
+        self._glib_context = None
+        self._mpris_props: dict | None = None
+        self._mpris_match = None
+        self._mpris_dirty = False
+        self._mpris_lookup_needed = True
 
     def _init_dbus(self) -> bool:
         """Initialize D-Bus connection."""
@@ -71,12 +134,73 @@ class SpotifySource(AudioSource, PulseAudioMixin):
             return False
         
         try:
+            # Signals are only dispatched if the bus is attached to a main loop
+            if HAS_GLIB:
+                DBusGMainLoop(set_as_default=True)
+                self._glib_context = GLib.MainContext.default()
+            else:
+                logger.info("PyGObject not installed, polling Spotify MPRIS properties")
+            
             self._bus = dbus.SessionBus()
+            if self._glib_context is not None:
+                self._bus.add_signal_receiver(
+                    self._on_name_owner_changed,
+                    signal_name="NameOwnerChanged",
+                    dbus_interface="org.freedesktop.DBus",
+                )
             return True
         except Exception as e:
             logger.error(f"Failed to connect to D-Bus: {e}")
             return False
 
+    def _on_name_owner_changed(self, name: str, old_owner: str, new_owner: str) -> None:
+        """Re-resolve the MPRIS player when a spotifyd bus name appears or goes away."""
+        if name.startswith(self.MPRIS_PREFIXES):
+            logger.debug(f"Spotify MPRIS name {name} changed owner")
+            self._evict_mpris()
+            self._mpris_dirty = True
+
+    def _on_mpris_props_changed(self, interface: str, changed: dict, invalidated: list) -> None:
+        """Merge a PropertiesChanged signal into the cached MPRIS properties."""
+        if interface != self.MPRIS_PLAYER_IFACE or self._mpris_props is None:
+            return  # Not seeded yet - next poll reads all properties
+        self._mpris_props = {**self._mpris_props, **changed}
+        self._mpris_dirty = True
+
+    def _evict_mpris(self) -> None:
+        """Forget the resolved MPRIS player and its cached properties."""
+        self._mpris_name = None
+        self._mpris_props = None
+        self._mpris_lookup_needed = True
+        match, self._mpris_match = self._mpris_match, None
+        if match is not None:
+            match.remove()
+
+    def _resolve_mpris_name(self) -> str | None:
+        """The spotifyd MPRIS bus name, looked up if not cached.
+        
+        With signals, the bus is only searched again after NameOwnerChanged
+        reports a spotifyd name, rather than on every poll while it is absent.
+        """
+        if not self._mpris_name and (self._glib_context is None or self._mpris_lookup_needed):
+            self._mpris_lookup_needed = False
+            self._mpris_name = self._find_mpris_name()
+            if self._mpris_name and self._glib_context is not None:
+                self._mpris_match = self._bus.add_signal_receiver(
+                    self._on_mpris_props_changed,
+                    signal_name="PropertiesChanged",
+                    dbus_interface=self.DBUS_PROPS_IFACE,
+                    path=self.MPRIS_PATH,
+                    bus_name=self._mpris_name,
+                )
+        return self._mpris_name
+
+    def _dispatch_dbus_events(self) -> None:
+        """Dispatch any pending D-Bus signals without blocking."""
+        if self._glib_context is not None:
+            while self._glib_context.iteration(False):
+                pass
+
     def _find_mpris_name(self) -> str | None:
         """Find the spotifyd MPRIS bus name (includes instance suffix)."""
         if not self._bus:
@@ -106,17 +230,14 @@ class SpotifySource(AudioSource, PulseAudioMixin):
             return None
         
         # Find MPRIS name if not cached or stale
-        if not self._mpris_name:
-            self._mpris_name = self._find_mpris_name()
-        
-        if not self._mpris_name:
+        if not self._resolve_mpris_name():
             return None
         
         try:
             obj = self._bus.get_object(self._mpris_name, self.MPRIS_PATH)
             return dbus.Interface(obj, self.MPRIS_PLAYER_IFACE)
         except dbus.DBusException:
-            self._mpris_name = None  # Clear cached name, will re-discover
+            self._evict_mpris()  # Clear cached name, will re-discover
             return None
 
     def _get_mpris_props(self):
@@ -125,17 +246,14 @@ class SpotifySource(AudioSource, PulseAudioMixin):
             return None
         
         # Find MPRIS name if not cached
-        if not self._mpris_name:
-            self._mpris_name = self._find_mpris_name()
-        
-        if not self._mpris_name:
+        if not self._resolve_mpris_name():
             return None
         
         try:
             obj = self._bus.get_object(self._mpris_name, self.MPRIS_PATH)
             return dbus.Interface(obj, self.DBUS_PROPS_IFACE)
         except dbus.DBusException:
-            self._mpris_name = None  # Clear cached name
+            self._evict_mpris()  # Clear cached name
             return None
 
     def start(self) -> None:
@@ -155,91 +273,197 @@ class SpotifySource(AudioSource, PulseAudioMixin):
         if self._thread:
             self._thread.join(timeout=5)
             self._thread = None
+        if self._poll_job is not None:
+            source_scheduler.cancel(self._poll_job)
+            self._poll_job = None
+        with self._vol_sync_lock:
+            if self._vol_sync_timer:
+                self._vol_sync_timer.cancel()
+                self._vol_sync_timer = None
+            self._vol_sync_pending = None
         logger.info("Spotify source stopped")
 
     def _run(self) -> None:
-        """Main polling loop."""
-        while self._running:
+        """Main loop: PulseAudio events if available, else polling on the shared scheduler."""
+        if HAS_PULSECTL:
             try:
-                self._poll_state()
+                self._run_pulse_events()
             except Exception as e:
-                logger.debug(f"Spotify poll error: {e}")
+                logger.warning(f"Spotify PulseAudio subscription failed, polling instead: {e}")
+        
+        if self._running:
+            self._poll_job = source_scheduler.schedule(self._poll_interval, self._poll_tick)
+
+    def _poll_tick(self) -> None:
+        """One polling-mode refresh (runs on the shared scheduler thread)."""
+        now = time.monotonic()
+        refresh_mpris = now >= self._next_mpris_refresh
+        try:
+            self._dispatch_dbus_events()
+            self._mpris_dirty = False
+            self._poll_state(refresh_mpris=refresh_mpris)
+            if refresh_mpris:
+                self._next_mpris_refresh = now + self.SAFETY_REFRESH_INTERVAL
+        except Exception as e:
+            logger.debug(f"Spotify poll error: {e}")
+
+    def _on_pulse_event(self, event: pulsectl.PulseEventInfo) -> None:
+        """Handle a PulseAudio sink-input event (runs inside event_listen)."""
+        self._pulse_dirty = True
+        if event.t != pulsectl.PulseEventTypeEnum.change:
+            self._sink_id_stale = True  # A sink-input appeared or went away
+        # libpulse calls can't be made from the callback - return to the loop
+        raise pulsectl.PulseLoopStop
+
+    def _run_pulse_events(self) -> None:
+        """Event-driven loop: re-read state only when PulseAudio or MPRIS reports a change.
+        
+        D-Bus signals are dispatched between event_listen calls, so they are
+        picked up within poll_interval. Without GLib there are no MPRIS
+        signals, and spotifyd's properties are read every poll_interval.
+        """
+        with pulsectl.Pulse("media-bridge-spotify") as pulse:
+            pulse.event_mask_set("sink_input")
+            pulse.event_callback_set(self._on_pulse_event)
+            logger.info("Spotify subscribed to PulseAudio sink-input events")
             
-            time.sleep(self._poll_interval)
+            next_full_refresh = 0.0
+            while self._running:
+                now = time.monotonic()
+                try:
+                    if self._pulse_dirty or now >= next_full_refresh:
+                        self._pulse_dirty = self._mpris_dirty = False
+                        self._poll_state()
+                        next_full_refresh = now + self.SAFETY_REFRESH_INTERVAL
+                    elif self._mpris_dirty:
+                        self._mpris_dirty = False
+                        self._poll_state(refresh_sink=False, refresh_mpris=False)
+                    elif self._mpris_name and self._mpris_match is None:
+                        self._poll_state(refresh_sink=False)
+                except Exception as e:
+                    logger.debug(f"Spotify poll error: {e}")
+                
+                pulse.event_listen(timeout=self._poll_interval)
+                self._dispatch_dbus_events()
 
-    def _poll_state(self) -> None:
-        """Poll current state from MPRIS and PulseAudio."""
-        # Always check for sink-input first (works even without MPRIS)
-        self._sink_input_id = self._find_sink_input("spotifyd")
+    def _read_sink_input(self) -> None:
+        """Re-read the spotifyd sink-input (volume, mute, corked) from PulseAudio.
         
-        # Get sink-input info for mute state and active detection
-        volume = self._state.volume
-        muted = False
-        sink_active = False
+        A recently found id is read directly; the sink-inputs are only searched
+        again when it is missing, older than SINK_ID_TTL, or invalidated by a
+        PulseAudio event.
+        """
+        now = time.monotonic()
+        info = None
+        if (
+            self._sink_input_id
+            and not self._sink_id_stale
+            and now - self._sink_input_id_ts < self.SINK_ID_TTL
+        ):
+            info = self._get_sink_input_info_by_id(self._sink_input_id)
         
-        if self._sink_input_id:
+        if info is None:
+            # Check for sink-input first (works even without MPRIS)
+            self._sink_id_stale = False
+            self._sink_input_id_ts = now
+            # One listing gives both the id and its state
             info = self._get_sink_input_info("spotifyd")
-            if info:
-                volume = info.get("volume", 100)  # Read volume from PulseAudio
-                muted = info.get("muted", False)
-                sink_active = not info.get("corked", True)
+            self._sink_input_id = info["id"] if info else None
         
-        # Try MPRIS for playback status, volume, and metadata
+        self._sink_volume = None
+        self._sink_muted = False
+        self._sink_active = False
+        
+        if info:
+            self._sink_volume = info.get("volume", 100)  # Read volume from PulseAudio
+            self._sink_muted = info.get("muted", False)
+            self._sink_active = not info.get("corked", True)
+
+    def _read_mpris_props(self) -> dict | None:
+        """Read the spotifyd player properties in one GetAll call (None if unavailable)."""
         props = self._get_mpris_props()
+        if not props:
+            return None
+        
+        try:
+            return dict(props.GetAll(self.MPRIS_PLAYER_IFACE))
+        except dbus.DBusException as e:
+            logger.debug(f"MPRIS error: {e}")
+            return None
+
+    def _get_mpris_values(self, refresh: bool) -> dict | None:
+        """MPRIS player properties, from the signal-maintained cache unless refresh."""
+        if not refresh and self._mpris_match is not None and self._mpris_props is not None:
+            return self._mpris_props
+        
+        values = self._read_mpris_props()
+        if self._mpris_match is not None:
+            # Kept current by PropertiesChanged from here on
+            self._mpris_props = values
+        return values
+
+    def _poll_state(self, refresh_sink: bool = True, refresh_mpris: bool = True) -> None:
+        """Poll current state from MPRIS and PulseAudio.
+        
+        refresh_sink=False reuses the last sink-input read; refresh_mpris=False
+        uses the MPRIS properties kept current by signals (when available).
+        """
+        if refresh_sink:
+            self._read_sink_input()
+        
+        # Sink-input state for volume, mute and active detection
+        volume = self._sink_volume if self._sink_volume is not None else self._state.volume
+        muted = self._sink_muted
+        sink_active = self._sink_active
+        
+        # Try MPRIS for playback status, volume, and metadata
+        values = self._get_mpris_values(refresh_mpris)
         state = PlaybackState.IDLE
         title = ""
         artist = ""
         
-        if props:
-            try:
-                # Get playback status
-                status = str(props.Get(self.MPRIS_PLAYER_IFACE, "PlaybackStatus"))
-                
-                if status == "Playing":
-                    state = PlaybackState.PLAYING
-                elif status == "Paused":
-                    state = PlaybackState.PAUSED
+        if values:
+            # Get playback status
+            status = str(values.get("PlaybackStatus", ""))
+            
+            if status == "Playing":
+                state = PlaybackState.PLAYING
+            elif status == "Paused":
+                state = PlaybackState.PAUSED
+            
+            # Detect volume changes from Spotify app (via MPRIS)
+            # When phone changes volume, we sync to PulseAudio and notify HA.
+            if "Volume" in values:
+                mpris_vol = float(values["Volume"])
+                mpris_volume = int(mpris_vol * 100)
                 
-                # Detect volume changes from Spotify app (via MPRIS)
-                # When phone changes volume, we sync to PulseAudio and notify HA.
-                try:
-                    mpris_vol = float(props.Get(self.MPRIS_PLAYER_IFACE, "Volume"))
-                    mpris_volume = int(mpris_vol * 100)
-                    
-                    # Detect external volume change (from Spotify app)
-                    if self._last_mpris_volume >= 0 and mpris_volume != self._last_mpris_volume:
-                        logger.info(f"Spotify app volume: {self._last_mpris_volume}% -> {mpris_volume}%")
-                        # Sync to PulseAudio (actual audio control)
-                        self._sync_volume_to_pulseaudio(mpris_volume)
-                        # Use this as current volume (PA will match after sync)
-                        volume = mpris_volume
-                        # Notify HA of the change
-                        if self.on_external_volume:
-                            self.on_external_volume(self.name, mpris_volume)
-                    
-                    self._last_mpris_volume = mpris_volume
-                except dbus.DBusException:
-                    pass
+                # Detect external volume change (from Spotify app)
+                if self._last_mpris_volume >= 0 and mpris_volume != self._last_mpris_volume:
+                    logger.info(f"Spotify app volume: {self._last_mpris_volume}% -> {mpris_volume}%")
+                    # Sync to PulseAudio and notify HA once the slider settles
+                    self._schedule_volume_sync(mpris_volume)
+                    # Use this as current volume (PA will match after sync)
+                    volume = mpris_volume
                 
-                # Get metadata
-                try:
-                    metadata = props.Get(self.MPRIS_PLAYER_IFACE, "Metadata")
-                    if "xesam:title" in metadata:
-                        title = str(metadata["xesam:title"])
-                    if "xesam:artist" in metadata:
-                        artists = metadata["xesam:artist"]
-                        if artists:
-                            artist = str(artists[0]) if len(artists) == 1 else ", ".join(str(a) for a in artists)
-                except dbus.DBusException:
-                    pass
-                    
-            except dbus.DBusException as e:
-                logger.debug(f"MPRIS error: {e}")
+                self._last_mpris_volume = mpris_volume
+            
+            # Get metadata
+            metadata = values.get("Metadata", {})
+            # dbus.String is a str subclass, so values are used without str() copies
+            title = metadata.get("xesam:title", "")
+            if artists := metadata.get("xesam:artist"):
+                artist = ", ".join(artists)
         
         # Fall back to sink-input state if MPRIS not available
         if state == PlaybackState.IDLE and sink_active:
             state = PlaybackState.PLAYING
         
+        # Steady state (same track, nothing touched) needs no state update at all
+        polled = (state, volume, muted, title, artist)
+        if polled == self._last_polled:
+            return
+        self._last_polled = polled
+        
         self._update_state(
             state=state,
             volume=volume,
@@ -264,28 +488,30 @@ class SpotifySource(AudioSource, PulseAudioMixin):
         spotifyd has --volume-controller none, so MPRIS doesn't affect audio.
         """
         volume = max(0, min(100, volume))
+        self._last_polled = None
         
-        # Set PulseAudio sink-input volume (the actual audio control)
-        if not self._sink_input_id:
-            self._sink_input_id = self._find_sink_input("spotifyd")
-        
-        pa_success = False
-        if self._sink_input_id:
-            pa_success = self._set_sink_input_volume(self._sink_input_id, volume)
-        
-        # Also update MPRIS so Spotify app shows correct value
+        # Update MPRIS so Spotify app shows correct value. With a main loop the
+        # call is sent without waiting for the reply, so spotifyd's round-trip
+        # overlaps the PulseAudio write below.
         props = self._get_mpris_props()
         if props:
+            no_wait = {}
+            if self._glib_context is not None:
+                no_wait = {"reply_handler": _ignore_reply, "error_handler": _log_mpris_volume_error}
             try:
                 props.Set(
                     self.MPRIS_PLAYER_IFACE,
                     "Volume",
                     dbus.Double(volume / 100.0),
+                    **no_wait,
                 )
                 # Track this to avoid detecting it as an external change
                 self._last_mpris_volume = volume
             except dbus.DBusException as e:
-                logger.debug(f"MPRIS volume sync failed: {e}")
+                _log_mpris_volume_error(e)
+        
+        # Set PulseAudio sink-input volume (the actual audio control)
+        pa_success = self._with_sink_input(lambda sid: self._set_sink_input_volume(sid, volume))
         
         if pa_success:
             self._update_state(volume=volume)
@@ -294,13 +520,52 @@ class SpotifySource(AudioSource, PulseAudioMixin):
         
         return pa_success
     
+    def _schedule_volume_sync(self, volume: int) -> None:
+        """(Re)start the debounce timer for a Spotify app volume change."""
+        with self._vol_sync_lock:
+            self._vol_sync_pending = volume
+            if self._vol_sync_timer:
+                self._vol_sync_timer.cancel()
+            timer = threading.Timer(self.VOLUME_SYNC_DELAY, self._apply_volume_sync)
+            timer.daemon = True
+            self._vol_sync_timer = timer
+            timer.start()
+
+    def _apply_volume_sync(self) -> None:
+        """Timer callback: apply the latest Spotify app volume."""
+        with self._vol_sync_lock:
+            volume, self._vol_sync_pending = self._vol_sync_pending, None
+            self._vol_sync_timer = None
+        if volume is None:
+            return
+        
+        # Sync to PulseAudio (actual audio control)
+        self._sync_volume_to_pulseaudio(volume)
+        # Notify HA of the change
+        if self.on_external_volume:
+            self.on_external_volume(self.name, volume)
+
+    def _with_sink_input(self, op: Callable[[str], bool]) -> bool:
+        """Run op on the spotifyd sink-input id, using the cached id if there is one.
+        
+        If op fails on a cached id (e.g. spotifyd restarted and got a new
+        sink-input), the id is looked up again and op retried once.
+        """
+        cached = self._sink_input_id is not None
+        if cached and op(self._sink_input_id):
+            return True
+        
+        self._sink_input_id = self._find_sink_input("spotifyd")
+        self._sink_input_id_ts = time.monotonic()
+        if not self._sink_input_id:
+            return False
+        if cached:
+            logger.debug(f"Spotify sink-input changed, retrying on {self._sink_input_id}")
+        return op(self._sink_input_id)
+
     def _sync_volume_to_pulseaudio(self, volume: int) -> None:
         """Sync external volume change to PulseAudio sink-input."""
-        if not self._sink_input_id:
-            self._sink_input_id = self._find_sink_input("spotifyd")
-        
-        if self._sink_input_id:
-            self._set_sink_input_volume(self._sink_input_id, volume)
+        if self._with_sink_input(lambda sid: self._set_sink_input_volume(sid, volume)):
             logger.debug(f"Synced Spotify volume {volume}% to PulseAudio")
 
     def get_muted(self) -> bool:
@@ -309,18 +574,15 @@ class SpotifySource(AudioSource, PulseAudioMixin):
 
     def set_muted(self, muted: bool) -> bool:
         """Set mute via sink-input."""
-        # Always refresh sink-input ID (it can change on spotifyd restart)
-        self._sink_input_id = self._find_sink_input("spotifyd")
-        
-        if not self._sink_input_id:
-            logger.warning("No Spotify sink-input found for mute")
-            return False
-        
-        logger.info(f"Setting Spotify mute={muted} on sink-input {self._sink_input_id}")
-        success = self._set_sink_input_mute(self._sink_input_id, muted)
+        logger.info(f"Setting Spotify mute={muted}")
+        self._last_polled = None
+        # The cached sink-input ID is re-found if it went stale (spotifyd restart)
+        success = self._with_sink_input(lambda sid: self._set_sink_input_mute(sid, muted))
         if success:
             self._update_state(muted=muted)
-            logger.info(f"Spotify mute set to {muted}")
+            logger.info(f"Spotify mute set to {muted} on sink-input {self._sink_input_id}")
+        elif not self._sink_input_id:
+            logger.warning("No Spotify sink-input found for mute")
         else:
             logger.warning(f"Failed to set Spotify mute on sink-input {self._sink_input_id}")
         return success
@@ -329,7 +591,8 @@ class SpotifySource(AudioSource, PulseAudioMixin):
         """Get current audio level (stub - needs peak detection)."""
         # TODO: Implement proper level metering via PulseAudio
         # For now, return 50 if playing, 0 otherwise
-        if self._state.state == PlaybackState.PLAYING and not self._state.muted:
+        state = self._state
+        if state.state == PlaybackState.PLAYING and not state.muted:
             return 50
         return 0
 
@@ -14,20 +14,54 @@ Handles:
 from __future__ import annotations
 
 import logging
-import math
 import os
+import re
+import selectors
 import shutil
 import signal
-import struct
 import subprocess
 import threading
 import time
 from typing import Callable
 
+try:
+    import pulsectl
+    HAS_PULSECTL = True
+except ImportError:
+    HAS_PULSECTL = False
+
 from media_bridge.sources.base import AudioSource, PlaybackState, PulseAudioMixin
 
 logger = logging.getLogger(__name__)
 
+# External tools, resolved once so pipeline restarts don't walk $PATH
+_ARECORD = shutil.which("arecord")
+_GST = shutil.which("gst-launch-1.0")
+_FFMPEG = shutil.which("ffmpeg")
+_PACTL = shutil.which("pactl") or "pactl"
+
+# `pactl subscribe` lines that mean the TV sink-input must be re-read
+_PACTL_EVENT_RE = re.compile(r"^Event '(?:new|change|remove)' on sink-input #\d+")
+# ... and lines that mean a sink appeared or went away (the output sink may have changed)
+_PACTL_SINK_EVENT_RE = re.compile(r"^Event '(?:new|remove)' on sink #\d+")
+
+# Per-channel RMS (dB) in a `level` element message printed by `gst-launch-1.0 -m`,
+# e.g. "rms=(double)< -23.4, -23.5 >" (older GStreamer: "rms=(GValueArray){ ... }")
+_LEVEL_RMS_RE = re.compile(rb"\brms=\([^)]*\)\s*[<{]([^>}]*)[>}]")
+
+# IEC 61937 preamble: Pa=0xF872, Pb=0x4E1F as little-endian 16-bit words
+SPDIF_SYNC = b"\x72\xf8\x1f\x4e"
+# Bytes of capture scanned for a burst (1 s of 48 kHz stereo S16LE)
+SPDIF_PROBE_BYTES = 192000
+# IEC 61937 data types (low byte of Pc) for the bitstreams the decoder handles
+SPDIF_DATA_TYPES = {
+    0x01: "ac3",
+    0x0B: "dts",  # DTS type I
+    0x0C: "dts",  # DTS type II
+    0x0D: "dts",  # DTS type III
+    0x15: "eac3",
+}
+
 
 class TVSource(AudioSource, PulseAudioMixin):
     """
@@ -39,8 +73,11 @@ class TVSource(AudioSource, PulseAudioMixin):
     DEFAULT_ALSA_DEVICE = "hw:CARD=ClearClick,DEV=0"
     DEFAULT_SILENCE_THRESHOLD_DB = -50
     DEFAULT_SILENCE_DURATION = 3.0  # Seconds before marking as idle
+    DEFAULT_LEVEL_METER_HZ = 10  # Level messages per second from the pipeline
     PROBE_TIMEOUT = 2  # Seconds to probe for bitstream
     DELAY_MS = 120  # Audio delay for sync
+    TV_OFF_WAIT = 5.0  # Seconds between main-loop passes while the TV is off
+    PIPELINE_LINGER = 10.0  # Seconds the pipeline outlives TV power-off, to ride out power flaps
 
     def __init__(
         self,
@@ -51,21 +88,44 @@ class TVSource(AudioSource, PulseAudioMixin):
         poll_interval: float = 0.1,
         silence_threshold_db: float = DEFAULT_SILENCE_THRESHOLD_DB,
         silence_duration: float = DEFAULT_SILENCE_DURATION,
+        level_meter_hz: float = DEFAULT_LEVEL_METER_HZ,
     ):
         super().__init__(name="tv", on_state_change=on_state_change, on_external_volume=on_external_volume)
         
         self._alsa_device = alsa_device or self.DEFAULT_ALSA_DEVICE
         self._pulse_sink = pulse_sink
+        # Auto-detected sinks are re-detected when PulseAudio adds/removes a sink
+        self._auto_sink = not pulse_sink
+        self._sinks_dirty = False
         self._poll_interval = poll_interval
         
         self._thread: threading.Thread | None = None
+        # Wakes the main loop early: TV power change, stop, pipeline exit
+        self._wake = threading.Event()
+        # Self-pipe written by stop() so the level meter can wait without a timeout
+        self._stop_r: int | None = None
+        self._stop_w: int | None = None
+        self._meter_thread: threading.Thread | None = None
         self._pipeline_proc: subprocess.Popen | None = None
+        # Earlier stages feeding _pipeline_proc (bitstream pipeline), in order.
+        # Every stage runs in the process group led by the first one.
+        self._upstream_procs: list[subprocess.Popen] = []
         self._pipeline_type: str | None = None  # "bitstream" or "pcm"
         self._sink_input_id: str | None = None
         
+        # Cached TV sink-input info, re-read only after PulseAudio reports a
+        # sink-input event (or every poll while no subscription is running)
+        self._sink_info: dict | None = None
+        self._sink_dirty = True
+        self._subscribed = False
+        self._subscribe_proc: subprocess.Popen | None = None
+        
         # Level metering
+        self._level_meter_hz = level_meter_hz
         self._current_level_db = -100.0
         self._last_sound_time = 0.0
+        # PLAYING/IDLE from silence detection, decided by the level meter thread
+        self._audio_state = PlaybackState.IDLE
         
         # Mute state (separate from sink-input mute for silence detection)
         self._user_muted = False
@@ -81,6 +141,7 @@ class TVSource(AudioSource, PulseAudioMixin):
         # TV power state - pipeline only runs when TV is on
         self._tv_power_on = False
         self._pipeline_enabled = False
+        self._power_off_time = 0.0
         
         # Pipeline restart debounce - prevent rapid restart on crashes
         self._last_pipeline_start = 0.0
@@ -94,6 +155,7 @@ class TVSource(AudioSource, PulseAudioMixin):
     def start(self) -> None:
         """Start TV audio source."""
         self._running = True
+        self._stop_r, self._stop_w = os.pipe()
         self._thread = threading.Thread(target=self._run, daemon=True, name="tv-source")
         self._thread.start()
         logger.info("TV source started")
@@ -111,16 +173,33 @@ class TVSource(AudioSource, PulseAudioMixin):
         else:
             logger.info("TV power OFF - disabling audio pipeline")
             self._pipeline_enabled = False
-            self._stop_pipeline()
+            # The main loop stops the pipeline after PIPELINE_LINGER, unless
+            # the TV comes back on first and it can carry on as it is
+            self._power_off_time = time.monotonic()
             self._update_state(state=PlaybackState.IDLE, level=0, level_db=-100.0)
+        
+        self._wake.set()
 
     def stop(self) -> None:
         """Stop TV audio source."""
         self._running = False
+        self._wake.set()
+        if self._stop_w is not None:
+            os.write(self._stop_w, b"x")  # Wake the level meter
         self._stop_pipeline()
+        proc = self._subscribe_proc
+        if proc:
+            proc.terminate()
         if self._thread:
             self._thread.join(timeout=5)
             self._thread = None
+        if self._meter_thread:
+            self._meter_thread.join(timeout=5)
+            self._meter_thread = None
+        if self._stop_r is not None:
+            os.close(self._stop_r)
+            os.close(self._stop_w)
+            self._stop_r = self._stop_w = None
         logger.info("TV source stopped")
 
     def _run(self) -> None:
@@ -128,21 +207,34 @@ class TVSource(AudioSource, PulseAudioMixin):
         # Wait for PulseAudio
         self._wait_for_pulse()
         
+        threading.Thread(
+            target=self._run_sink_events,
+            daemon=True,
+            name="tv-sink-events",
+        ).start()
+        
         # Find output sink
-        if not self._pulse_sink:
+        if self._auto_sink:
             self._pulse_sink = self._find_scarlett_sink()
-        
-        if not self._pulse_sink:
-            logger.error("No Scarlett sink found for TV audio")
-            return
+            if not self._pulse_sink:
+                logger.error("No Scarlett sink found for TV audio, waiting for one to appear")
         
         while self._running:
+            # Cleared before the pass, so wakeups during it aren't lost
+            self._wake.clear()
+            now = time.monotonic()
             try:
-                # Only run pipeline if TV is on
-                if self._pipeline_enabled:
+                # Re-detect the output sink after a sink was added or removed
+                # (or periodically while it is missing and no events arrive)
+                if self._auto_sink and (self._sinks_dirty or not (self._pulse_sink or self._subscribed)):
+                    self._sinks_dirty = False
+                    self._refresh_pulse_sink()
+                
+                # Only run pipeline if TV is on and there is somewhere to play it
+                if self._pipeline_enabled and self._pulse_sink:
                     if not self._pipeline_proc or self._pipeline_proc.poll() is not None:
                         # Pipeline not running - check cooldown before restart
-                        time_since_last = time.time() - self._last_pipeline_start
+                        time_since_last = now - self._last_pipeline_start
                         if time_since_last >= self._pipeline_restart_cooldown:
                             self._start_pipeline()
                         # Else: still in cooldown, wait
@@ -150,8 +242,11 @@ class TVSource(AudioSource, PulseAudioMixin):
                     # Poll for state updates (even during cooldown)
                     self._poll_state()
                 else:
-                    # TV is off - ensure pipeline is stopped
-                    if self._pipeline_proc:
+                    # TV is off - stop the pipeline once it has lingered
+                    if self._pipeline_proc and (
+                        not self._pulse_sink
+                        or now - self._power_off_time >= self.PIPELINE_LINGER
+                    ):
                         self._stop_pipeline()
                     # Still update state to show idle
                     if self._state.state != PlaybackState.IDLE:
@@ -162,17 +257,111 @@ class TVSource(AudioSource, PulseAudioMixin):
                 self._stop_pipeline()
                 time.sleep(1)
             
-            time.sleep(self._poll_interval)
+            # Poll at poll_interval while the pipeline runs (level metering,
+            # silence detection); otherwise sleep until woken or the linger ends
+            if self._pipeline_enabled and self._pulse_sink:
+                timeout = self._poll_interval
+            elif self._pipeline_proc:
+                linger_left = self._power_off_time + self.PIPELINE_LINGER - time.monotonic()
+                timeout = min(self.TV_OFF_WAIT, max(0.0, linger_left))
+            else:
+                timeout = self.TV_OFF_WAIT
+            self._wake.wait(timeout)
+
+    def _refresh_pulse_sink(self) -> None:
+        """Re-detect the Scarlett sink; restart the pipeline on it if it changed."""
+        sink = self._find_scarlett_sink()
+        if sink == self._pulse_sink:
+            return
+        
+        if sink:
+            logger.info(f"TV output sink: {sink}")
+        else:
+            logger.warning(f"TV output sink {self._pulse_sink} went away")
+        self._pulse_sink = sink
+        # The main loop starts a new pipeline on the new sink (if any)
+        self._stop_pipeline()
+
+    def _on_sinks_changed(self) -> None:
+        """A sink was added or removed - have the main loop re-detect ours."""
+        if self._auto_sink:
+            self._sinks_dirty = True
+            self._wake.set()
+
+    def _run_sink_events(self) -> None:
+        """Watch for sink/sink-input changes: libpulse events if available, else `pactl subscribe`."""
+        if HAS_PULSECTL:
+            try:
+                self._run_pulse_events()
+            except Exception as e:
+                logger.warning(f"TV PulseAudio subscription failed, using pactl subscribe: {e}")
+            finally:
+                self._subscribed = False
+        
+        if self._running:
+            self._run_pactl_subscribe()
+
+    def _on_pulse_event(self, event: pulsectl.PulseEventInfo) -> None:
+        """Handle a PulseAudio sink or sink-input event (runs inside event_listen)."""
+        if event.facility == pulsectl.PulseEventFacilityEnum.sink_input:
+            self._sink_dirty = True
+        elif event.t != pulsectl.PulseEventTypeEnum.change:
+            self._on_sinks_changed()
+
+    def _run_pulse_events(self) -> None:
+        """Flag sink and sink-input events from a dedicated libpulse connection."""
+        with pulsectl.Pulse("media-bridge-tv") as pulse:
+            pulse.event_mask_set("sink", "sink_input")
+            pulse.event_callback_set(self._on_pulse_event)
+            self._subscribed = True
+            self._sink_dirty = True
+            logger.info("TV subscribed to PulseAudio sink and sink-input events")
+            
+            while self._running:
+                pulse.event_listen(timeout=1.0)
+
+    def _run_pactl_subscribe(self) -> None:
+        """Flag sink and sink-input events from a long-running `pactl subscribe`."""
+        while self._running:
+            try:
+                proc = subprocess.Popen(
+                    [_PACTL, "subscribe"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    close_fds=False,
+                )
+            except Exception as e:
+                logger.warning(f"pactl subscribe failed, polling TV sink-input: {e}")
+                return
+            
+            self._subscribe_proc = proc
+            self._subscribed = True
+            # Events may have been missed while no subscriber was running
+            self._sink_dirty = True
+            for line in proc.stdout:
+                if _PACTL_EVENT_RE.match(line):
+                    self._sink_dirty = True
+                elif _PACTL_SINK_EVENT_RE.match(line):
+                    self._on_sinks_changed()
+            
+            proc.wait()
+            self._subscribed = False
+            self._subscribe_proc = None
+            if self._running:
+                logger.debug("pactl subscribe exited, restarting")
+                time.sleep(1)
 
     def _wait_for_pulse(self, timeout: float = 30) -> bool:
         """Wait for PulseAudio to be available."""
-        start = time.time()
-        while time.time() - start < timeout:
+        start = time.monotonic()
+        while time.monotonic() - start < timeout:
             try:
                 result = subprocess.run(
-                    ["pactl", "info"],
+                    [_PACTL, "info"],
                     capture_output=True,
                     timeout=2,
+                    close_fds=False,
                 )
                 if result.returncode == 0:
                     return True
@@ -185,10 +374,11 @@ class TVSource(AudioSource, PulseAudioMixin):
         """Find Scarlett Focusrite sink."""
         try:
             result = subprocess.run(
-                ["pactl", "list", "short", "sinks"],
+                [_PACTL, "list", "short", "sinks"],
                 capture_output=True,
                 text=True,
                 timeout=5,
+                close_fds=False,
             )
             for line in result.stdout.split('\n'):
                 if "Scarlett" in line and "analog-stereo" in line:
@@ -204,44 +394,76 @@ class TVSource(AudioSource, PulseAudioMixin):
         Probe S/PDIF input for bitstream codec (AC3/EAC3/DTS).
         Returns codec name or None if PCM.
         """
-        if not shutil.which("ffprobe") or not shutil.which("arecord"):
-            logger.warning("ffprobe or arecord not found, assuming PCM")
+        if not _ARECORD:
+            logger.warning("arecord not found, assuming PCM")
             return None
         
         try:
-            # Capture ~1 second and test for S/PDIF bitstream
-            cmd = f"""
-                arecord -D '{self._alsa_device}' -f S16_LE -r 48000 -c 2 -t raw -d 1 2>/dev/null |
-                head -c 192000 |
-                ffprobe -hide_banner -loglevel error -f spdif -i pipe:0 \
-                    -show_entries stream=codec_name -of csv=p=0 -select_streams a
-            """
-            
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=self.PROBE_TIMEOUT + 2,
+            # Capture up to ~1 second, scanning for an IEC 61937 burst as data
+            # arrives; bitstreams are found within the first few bursts
+            proc = subprocess.Popen(
+                [
+                    _ARECORD, "-q", "-D", self._alsa_device,
+                    "-f", "S16_LE", "-r", "48000", "-c", "2", "-t", "raw", "-d", "1",
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
             )
-            
-            codec = result.stdout.strip().split('\n')[0] if result.stdout.strip() else None
-            
-            if codec in ("ac3", "eac3", "dts"):
-                logger.info(f"Detected bitstream codec: {codec}")
-                return codec
-            
-        except subprocess.TimeoutExpired:
-            logger.debug("Bitstream probe timed out")
         except Exception as e:
             logger.debug(f"Bitstream probe error: {e}")
+            return None
+        
+        deadline = time.monotonic() + self.PROBE_TIMEOUT + 2
+        buf = bytearray()
+        try:
+            with selectors.DefaultSelector() as sel:
+                sel.register(proc.stdout, selectors.EVENT_READ)
+                while len(buf) < SPDIF_PROBE_BYTES:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not sel.select(remaining):
+                        logger.debug("Bitstream probe timed out")
+                        break
+                    
+                    chunk = proc.stdout.read1(SPDIF_PROBE_BYTES - len(buf))
+                    if not chunk:
+                        break
+                    
+                    # Rescan the tail of the previous chunk too, in case a
+                    # preamble straddles the boundary (kept 16-bit aligned)
+                    start = max(0, len(buf) - 6) & ~1
+                    buf += chunk
+                    codec = self._detect_spdif_codec(buf[start:])
+                    if codec:
+                        logger.info(f"Detected bitstream codec: {codec}")
+                        return codec
+        except Exception as e:
+            logger.debug(f"Bitstream probe error: {e}")
+        finally:
+            proc.kill()
+            proc.wait()
         
         return None
 
+    def _detect_spdif_codec(self, buf: bytes) -> str | None:
+        """Find an IEC 61937 burst in raw S16LE capture and return its codec.
+        
+        Same check as FFmpeg's spdif demuxer: the Pa/Pb sync words followed by
+        the Pc burst-info word, whose low byte is the data type.
+        """
+        offset = buf.find(SPDIF_SYNC)
+        while offset != -1 and offset + 6 <= len(buf):
+            # Sync words sit on 16-bit sample boundaries
+            if offset % 2 == 0:
+                codec = SPDIF_DATA_TYPES.get(buf[offset + 4])
+                if codec:
+                    return codec
+            offset = buf.find(SPDIF_SYNC, offset + 1)
+        return None
+
     def _start_pipeline(self) -> None:
         """Start the appropriate audio pipeline (bitstream or PCM)."""
         self._stop_pipeline()
-        self._last_pipeline_start = time.time()
+        self._last_pipeline_start = time.monotonic()
         
         codec = self._probe_bitstream()
         
@@ -249,61 +471,112 @@ class TVSource(AudioSource, PulseAudioMixin):
             self._start_bitstream_pipeline(codec)
         else:
             self._start_pcm_pipeline()
+        
+        if self._pipeline_proc:
+            threading.Thread(
+                target=self._watch_pipeline,
+                args=(self._pipeline_proc,),
+                daemon=True,
+                name="tv-pipeline-watch",
+            ).start()
+
+    def _watch_pipeline(self, proc: subprocess.Popen) -> None:
+        """Wake the main loop as soon as the pipeline exits."""
+        proc.wait()
+        self._wake.set()
 
     def _start_bitstream_pipeline(self, codec: str) -> None:
         """Start GStreamer/FFmpeg pipeline for bitstream decoding."""
-        if not shutil.which("gst-launch-1.0") or not shutil.which("ffmpeg"):
+        if not _GST or not _FFMPEG:
             logger.error("gst-launch-1.0 or ffmpeg not found")
             return
         
         logger.info(f"Starting bitstream pipeline for {codec}")
         
         # Pipeline: ALSA capture -> FFmpeg S/PDIF decode -> GStreamer -> PulseAudio
-        # We use a shell pipeline with gst-launch for capture -> ffmpeg for decode -> gst-launch for output
-        cmd = f"""
-            gst-launch-1.0 -q alsasrc device="{self._alsa_device}" provide-clock=false \
-                ! audio/x-raw,format=S16LE,rate=48000,channels=2 \
-                ! fdsink fd=1 2>/dev/null |
-            ffmpeg -hide_banner -loglevel warning -f spdif -i pipe:0 -c:a copy -f ac3 - 2>/dev/null |
-            gst-launch-1.0 -q fdsrc \
-                ! audio/x-ac3,rate=48000,channels=2 \
-                ! ac3parse ! avdec_ac3 ! audioconvert ! audioresample \
-                ! identity ts-offset={self.DELAY_MS * 1000000} \
-                ! audio/x-raw,format=S16LE,rate=48000,channels=2 \
-                ! pulsesink device="{self._pulse_sink}" sync=true
-        """
+        # Three processes connected by pipes: gst-launch capture | ffmpeg | gst-launch output
+        capture_cmd = [
+            _GST, "-q",
+            "alsasrc", f"device={self._alsa_device}", "provide-clock=false",
+            "!", "audio/x-raw,format=S16LE,rate=48000,channels=2",
+            "!", "fdsink", "fd=1",
+        ]
+        decode_cmd = [
+            _FFMPEG, "-hide_banner", "-loglevel", "warning",
+            "-f", "spdif", "-i", "pipe:0", "-c:a", "copy", "-f", "ac3", "-",
+        ]
+        output_cmd = [
+            _GST, "-m",
+            "fdsrc",
+            "!", "audio/x-ac3,rate=48000,channels=2",
+            "!", "ac3parse", "!", "avdec_ac3", "!", "audioconvert", "!", "audioresample",
+            "!", "level", f"interval={self._level_interval_ns()}", "post-messages=true",
+            "!", "identity", f"ts-offset={self.DELAY_MS * 1000000}",
+            "!", "audio/x-raw,format=S16LE,rate=48000,channels=2",
+            "!", "pulsesink", f"device={self._pulse_sink}", "sync=true",
+        ]
         
+        procs = []
         try:
-            self._pipeline_proc = subprocess.Popen(
-                cmd,
-                shell=True,
+            capture = subprocess.Popen(
+                capture_cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                # New process group in our session, so the later stages can join it
+                process_group=0,
+            )
+            procs.append(capture)
+            decode = subprocess.Popen(
+                decode_cmd,
+                stdin=capture.stdout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                process_group=capture.pid,
+            )
+            procs.append(decode)
+            output = subprocess.Popen(
+                output_cmd,
+                stdin=decode.stdout,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                preexec_fn=os.setsid,
+                process_group=capture.pid,
             )
-            self._pipeline_type = "bitstream"
-            logger.info("Bitstream pipeline started")
+            procs.append(output)
         except Exception as e:
             logger.error(f"Failed to start bitstream pipeline: {e}")
+            for proc in procs:
+                proc.kill()
+                proc.wait()
+            return
+        finally:
+            # Only the children hold the intermediate pipes, so a stage exiting
+            # gives its neighbours EOF/SIGPIPE
+            for proc in procs[:2]:
+                proc.stdout.close()
+        
+        self._upstream_procs = [capture, decode]
+        self._pipeline_proc = output
+        self._pipeline_type = "bitstream"
+        self._start_level_meter()
+        logger.info("Bitstream pipeline started")
 
     def _start_pcm_pipeline(self) -> None:
         """Start PCM passthrough pipeline with level monitoring."""
-        if not shutil.which("gst-launch-1.0"):
+        if not _GST:
             logger.error("gst-launch-1.0 not found")
             return
         
         logger.info("Starting PCM passthrough pipeline")
         
-        # Pipeline: ALSA capture -> tee -> (PulseAudio + level meter output)
-        # Use tee to split audio: one path to PulseAudio, one to stdout for level metering
+        # Pipeline: ALSA capture -> level -> PulseAudio
+        # The level element computes RMS in GStreamer; -m prints its messages to stdout
         cmd = [
-            "gst-launch-1.0", "-q",
+            _GST, "-m",
             "alsasrc", f"device={self._alsa_device}", "provide-clock=false",
             "!", "audio/x-raw,format=S16LE,rate=48000,channels=2",
-            "!", "tee", "name=t",
-            "t.", "!", "queue", "!", "audioconvert", "!", "audioresample",
-            "!", f"pulsesink", f"device={self._pulse_sink}", "sync=true",
-            "t.", "!", "queue", "max-size-buffers=2", "!", "fdsink", "fd=1",
+            "!", "level", f"interval={self._level_interval_ns()}", "post-messages=true",
+            "!", "audioconvert", "!", "audioresample",
+            "!", "pulsesink", f"device={self._pulse_sink}", "sync=true",
         ]
         
         try:
@@ -311,16 +584,11 @@ class TVSource(AudioSource, PulseAudioMixin):
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                preexec_fn=os.setsid,
+                # Own process group, like the bitstream pipeline, for _stop_pipeline
+                process_group=0,
             )
             self._pipeline_type = "pcm"
-            
-            # Start level metering thread
-            threading.Thread(
-                target=self._level_meter_loop,
-                daemon=True,
-                name="tv-level-meter",
-            ).start()
+            self._start_level_meter()
             
             logger.info("PCM pipeline started with level metering")
         except Exception as e:
@@ -329,127 +597,162 @@ class TVSource(AudioSource, PulseAudioMixin):
     def _stop_pipeline(self) -> None:
         """Stop the audio pipeline."""
         if self._pipeline_proc:
+            # The first stage leads the process group
+            pgid = (self._upstream_procs or [self._pipeline_proc])[0].pid
             try:
                 # Kill process group
-                os.killpg(os.getpgid(self._pipeline_proc.pid), signal.SIGTERM)
+                os.killpg(pgid, signal.SIGTERM)
                 self._pipeline_proc.wait(timeout=2)
             except Exception:
                 try:
-                    os.killpg(os.getpgid(self._pipeline_proc.pid), signal.SIGKILL)
+                    os.killpg(pgid, signal.SIGKILL)
+                except Exception:
+                    pass
+            for proc in self._upstream_procs:
+                try:
+                    proc.wait(timeout=2)
                 except Exception:
                     pass
+            self._upstream_procs = []
             self._pipeline_proc = None
             self._pipeline_type = None
             logger.info("Pipeline stopped")
 
+    def _level_interval_ns(self) -> int:
+        """Interval between `level` element messages, in nanoseconds."""
+        return int(1_000_000_000 / self._level_meter_hz)
+
+    def _start_level_meter(self) -> None:
+        """Start the thread reading level messages from the pipeline."""
+        self._meter_thread = threading.Thread(
+            target=self._level_meter_loop,
+            daemon=True,
+            name="tv-level-meter",
+        )
+        self._meter_thread.start()
+
     def _level_meter_loop(self) -> None:
-        """Read audio samples from pipeline for level metering."""
+        """Read RMS levels posted by the pipeline's `level` element."""
         if not self._pipeline_proc or not self._pipeline_proc.stdout:
             return
+        fd = self._pipeline_proc.stdout.fileno()
+        os.set_blocking(fd, False)
+        pending = b""
         
-        # Read in ~50ms chunks (48000 * 2ch * 2bytes * 0.05 = 9600 bytes)
-        chunk_size = 9600
-        
-        while self._running and self._pipeline_proc:
-            try:
-                data = self._pipeline_proc.stdout.read(chunk_size)
-                if not data:
-                    break
-                
-                # Calculate RMS level in dB
-                level_db = self._calculate_rms_db(data)
-                self._current_level_db = level_db
-                
-                # Track last time we had sound
-                if level_db > self._silence_threshold_db:
-                    self._last_sound_time = time.time()
+        with selectors.DefaultSelector() as sel:
+            sel.register(self._stop_r, selectors.EVENT_READ)
+            sel.register(fd, selectors.EVENT_READ)
+            
+            while self._running and self._pipeline_proc:
+                try:
+                    for key, _ in sel.select():
+                        if key.fd == self._stop_r:
+                            return
+                        
+                        try:
+                            chunk = os.read(fd, 4096)
+                        except BlockingIOError:
+                            continue
+                        if not chunk:
+                            return  # Pipeline exited
+                        
+                        lines = (pending + chunk).split(b"\n")
+                        pending = lines.pop()
+                        for line in lines:
+                            self._handle_level_line(line)
                 
-            except Exception as e:
-                logger.debug(f"Level meter error: {e}")
-                break
+                except Exception as e:
+                    logger.debug(f"Level meter error: {e}")
+                    break
 
-    def _calculate_rms_db(self, samples: bytes) -> float:
-        """Calculate RMS level in dB from raw S16LE samples."""
-        if len(samples) < 2:
-            return -100.0
+    def _handle_level_line(self, line: bytes) -> None:
+        """Update the current level from one line of gst-launch -m output."""
+        match = _LEVEL_RMS_RE.search(line)
+        if not match:
+            return  # Other bus messages / progress output
         
-        sample_count = len(samples) // 2
-        try:
-            values = struct.unpack(f'<{sample_count}h', samples)
-            square_sum = sum(v * v for v in values)
-            rms = math.sqrt(square_sum / sample_count)
-            if rms == 0:
-                return -100.0
-            return 20 * math.log10(rms / 32768.0)
-        except Exception:
-            return -100.0
+        # Loudest channel; digital silence is reported as -inf
+        level_db = max(-100.0, max(float(v) for v in match.group(1).split(b",")))
+        self._current_level_db = level_db
+        
+        self._detect_silence(level_db)
 
-    def _poll_state(self) -> None:
-        """Update state based on pipeline and level."""
-        # Find our sink-input
-        self._sink_input_id = self._find_sink_input("gst-launch")
+    def _detect_silence(self, level_db: float) -> None:
+        """Update the silence state from a new level, auto-muting/unmuting the sink-input.
         
-        if not self._sink_input_id:
+        Runs on the level meter thread as each level arrives; _poll_state only
+        publishes the resulting _audio_state.
+        """
+        now = time.monotonic()
+        sink_input_id = self._sink_input_id
+        
+        if level_db > self._silence_threshold_db:
+            self._last_sound_time = now
+            self._audio_state = PlaybackState.PLAYING
+            # Unmute if we had auto-muted due to silence
+            if self._auto_mute_enabled and self._silence_muted and sink_input_id:
+                logger.info("Audio detected, unmuting TV")
+                self._set_sink_input_mute(sink_input_id, self._user_muted)
+                self._silence_muted = False
+        elif now - self._last_sound_time >= self._silence_duration:
+            self._audio_state = PlaybackState.IDLE  # Sustained silence
+            # Auto-mute on sustained silence
+            if (self._auto_mute_enabled and not self._silence_muted and not self._user_muted
+                    and sink_input_id):
+                logger.info(f"Silence detected ({level_db:.1f} dB < {self._silence_threshold_db} dB for {self._silence_duration}s), muting TV")
+                self._set_sink_input_mute(sink_input_id, True)
+                self._silence_muted = True
+        # Else: brief silence - still "playing"
+
+    def _poll_state(self) -> None:
+        """Publish state from the sink-input, level and silence detection."""
+        # Find our sink-input (cached until PulseAudio reports a change)
+        if self._sink_dirty or not self._subscribed:
+            self._sink_dirty = False
+            self._sink_info = self._get_sink_input_info("gst-launch")
+            self._sink_input_id = self._sink_info["id"] if self._sink_info else None
+        
+        info = self._sink_info
+        if not info:
             # No sink-input means pipeline not outputting
             if self._state.state != PlaybackState.IDLE:
                 self._update_state(state=PlaybackState.IDLE, level=0)
             return
         
-        # Get volume/mute from sink-input
-        info = self._get_sink_input_info("gst-launch")
-        if info:
-            now = time.time()
-            
-            # Only update volume from poll if we didn't just set it (prevent race condition)
-            if now - self._volume_set_time > self._set_debounce:
-                volume = info.get("volume", 100)
-            else:
-                volume = self._state.volume  # Keep our just-set value
-            
-            # Determine state based on silence
-            time_since_sound = time.time() - self._last_sound_time
-            is_silent = self._current_level_db <= self._silence_threshold_db
-            silence_exceeded = time_since_sound >= self._silence_duration
-            
-            if not is_silent:
-                state = PlaybackState.PLAYING
-                # Unmute if we had auto-muted due to silence
-                if self._auto_mute_enabled and self._silence_muted:
-                    logger.info("Audio detected, unmuting TV")
-                    self._set_sink_input_mute(self._sink_input_id, self._user_muted)
-                    self._silence_muted = False
-            elif not silence_exceeded:
-                state = PlaybackState.PLAYING  # Still "playing" during brief silence
-            else:
-                state = PlaybackState.IDLE  # Sustained silence
-                # Auto-mute on sustained silence
-                if self._auto_mute_enabled and not self._silence_muted and not self._user_muted:
-                    logger.info(f"Silence detected ({self._current_level_db:.1f} dB < {self._silence_threshold_db} dB for {self._silence_duration}s), muting TV")
-                    self._set_sink_input_mute(self._sink_input_id, True)
-                    self._silence_muted = True
-            
-            # Determine effective mute state (respect debounce after user mute change)
-            if now - self._mute_set_time > self._set_debounce:
-                muted = info.get("muted", False) or self._user_muted or self._silence_muted
-            else:
-                muted = self._state.muted  # Keep our just-set value
-            
-            # Convert dB to 0-100 level
-            # -50dB = 0, 0dB = 100
-            level = max(0, min(100, int((self._current_level_db + 50) * 2)))
-            if muted:
-                level = 0
-            
-            # Also publish level_db for debugging
-            level_db = round(self._current_level_db, 1)
-            
-            self._update_state(
-                state=state,
-                volume=volume,
-                muted=muted,
-                level=level,
-                level_db=level_db,
-            )
+        # Volume/mute from the sink-input
+        now = time.monotonic()
+        
+        # Only update volume from poll if we didn't just set it (prevent race condition)
+        if now - self._volume_set_time > self._set_debounce:
+            volume = info.get("volume", 100)
+        else:
+            volume = self._state.volume  # Keep our just-set value
+        
+        # Playing vs sustained silence, as decided by the level meter
+        state = self._audio_state
+        
+        # Determine effective mute state (respect debounce after user mute change)
+        if now - self._mute_set_time > self._set_debounce:
+            muted = info.get("muted", False) or self._user_muted or self._silence_muted
+        else:
+            muted = self._state.muted  # Keep our just-set value
+        
+        # Convert dB to 0-100 level
+        # -50dB = 0, 0dB = 100
+        level = max(0, min(100, int((self._current_level_db + 50) * 2)))
+        if muted:
+            level = 0
+        
+        # Also publish level_db for debugging
+        level_db = round(self._current_level_db, 1)
+        
+        self._update_state(
+            state=state,
+            volume=volume,
+            muted=muted,
+            level=level,
+            level_db=level_db,
+        )
 
     def is_active(self) -> bool:
         """Check if TV audio is playing."""
@@ -471,7 +774,7 @@ class TVSource(AudioSource, PulseAudioMixin):
         volume = max(0, min(100, volume))
         success = self._set_sink_input_volume(self._sink_input_id, volume)
         if success:
-            self._volume_set_time = time.time()  # Prevent poll from overwriting
+            self._volume_set_time = time.monotonic()  # Prevent poll from overwriting
             self._update_state(volume=volume)
         return success
 
@@ -491,7 +794,7 @@ class TVSource(AudioSource, PulseAudioMixin):
         self._user_muted = muted
         success = self._set_sink_input_mute(self._sink_input_id, muted)
         if success:
-            self._mute_set_time = time.time()  # Prevent poll from overwriting
+            self._mute_set_time = time.monotonic()  # Prevent poll from overwriting
             self._update_state(muted=muted)
         return success
 
@@ -0,0 +1,63 @@
+"""Tests for the incremental shairport-sync metadata parser."""
+
+import base64
+
+from media_bridge.sources.airplay import MetadataParser
+
+
+def _item(type_str: str, code_str: str, data: bytes = b"") -> bytes:
+    """One metadata item as shairport-sync writes it (hex type/code, base64 data)."""
+    type_hex, code_hex = type_str.encode().hex(), code_str.encode().hex()
+    item = f"<item><type>{type_hex}</type><code>{code_hex}</code><length>{len(data)}</length>"
+    if data:
+        item += f'\n<data encoding="base64">\n{base64.b64encode(data).decode()}</data>'
+    return (item + "</item>\n").encode()
+
+
+def _parsed(type_str: str, code_str: str, data: bytes = b"") -> tuple[str, str, str]:
+    return type_str.encode().hex(), code_str.encode().hex(), base64.b64encode(data).decode()
+
+
+def test_items_in_one_chunk():
+    parser = MetadataParser()
+
+    items = parser.feed(_item("ssnc", "pvol", b"-20.0,0,0,0") + _item("ssnc", "pend"))
+
+    assert items == [_parsed("ssnc", "pvol", b"-20.0,0,0,0"), _parsed("ssnc", "pend")]
+
+
+def test_item_split_across_reads():
+    parser = MetadataParser()
+    stream = _item("core", "minm", b"Title") + _item("core", "asar", b"Artist")
+
+    items = []
+    for i in range(0, len(stream), 7):
+        items += parser.feed(stream[i:i + 7])
+
+    assert items == [_parsed("core", "minm", b"Title"), _parsed("core", "asar", b"Artist")]
+
+
+def test_resync_keeps_items_after_malformed_one():
+    parser = MetadataParser()
+
+    items = parser.feed(b"<item><type>zz</ty></item>" + _item("ssnc", "pend"))
+
+    assert items == [_parsed("ssnc", "pend")]
+
+
+def test_resync_keeps_items_around_garbage():
+    parser = MetadataParser()
+    chunk = _item("core", "asar", b"A") + b"garbage<<" + _item("ssnc", "pend")
+
+    assert parser.feed(chunk) == [_parsed("core", "asar", b"A"), _parsed("ssnc", "pend")]
+    # Parsing carries on normally afterwards
+    assert parser.feed(_item("ssnc", "prsm")) == [_parsed("ssnc", "prsm")]
+
+
+def test_resync_across_reads():
+    parser = MetadataParser()
+    tail = _item("ssnc", "pend")
+
+    assert parser.feed(b"<item><type>zz</ty>") == []
+    assert parser.feed(b"more</item>" + tail[:10]) == []
+    assert parser.feed(tail[10:]) == [_parsed("ssnc", "pend")]
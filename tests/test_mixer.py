@@ -0,0 +1,79 @@
+"""Tests for AudioMixer volume slewing and update coalescing."""
+
+import threading
+import time
+
+import pytest
+
+from media_bridge import mixer
+from media_bridge.sources.base import AudioSource
+
+
+class DummySource(AudioSource):
+    """Source that reports every volume set back through its state callback."""
+
+    def __init__(self, name, on_state_change=None, on_external_volume=None, **kwargs):
+        super().__init__(name=name, on_state_change=on_state_change,
+                         on_external_volume=on_external_volume)
+
+    def start(self): pass
+    def stop(self): pass
+    def is_active(self): return False
+    def get_volume(self): return self._state.volume
+    def get_muted(self): return self._state.muted
+    def set_muted(self, muted): return True
+    def get_level(self): return self._state.level
+
+    def set_volume(self, volume):
+        self._update_state(volume=volume)
+        return True
+
+
+@pytest.fixture
+def audio_mixer(monkeypatch):
+    for cls_name, source_name in (
+        ("SpotifySource", "spotify"), ("AirPlaySource", "airplay"), ("TVSource", "tv"),
+    ):
+        monkeypatch.setattr(mixer, cls_name, lambda source_name=source_name, **kw: DummySource(source_name, **kw))
+
+    emitted = []
+    audio_mixer = mixer.AudioMixer(
+        on_state_change=lambda source, key, value: emitted.append((source, key, value)),
+        slew_rate=100,
+    )
+    audio_mixer.emitted = emitted
+
+    # Run only the slew worker; start() would also touch PulseAudio
+    audio_mixer._slew_worker = threading.Thread(target=audio_mixer._slew_loop, daemon=True)
+    audio_mixer._slew_worker.start()
+    yield audio_mixer
+    audio_mixer.stop()
+
+
+def _tv_volumes(audio_mixer):
+    return [value for source, key, value in audio_mixer.emitted if (source, key) == ("tv", "volume")]
+
+
+def test_slew_updates_coalesced_and_final_value_sent_once(audio_mixer):
+    audio_mixer.set_source_volume("tv", 100, use_slew=False)
+    audio_mixer.emitted.clear()
+
+    audio_mixer.set_source_volume("tv", 40)
+    deadline = time.monotonic() + 2.0
+    while 40 not in _tv_volumes(audio_mixer) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+
+    volumes = _tv_volumes(audio_mixer)
+    # 12 steps of 5% over ~0.6 s, forwarded at most every _MIN_EMIT_INTERVAL
+    assert len(volumes) < 6
+    assert volumes[-1] == 40
+    assert volumes.count(40) == 1
+    assert audio_mixer._slewing == set()
+
+
+def test_source_volume_forwarded_outside_slew(audio_mixer):
+    audio_mixer.set_source_volume("tv", 55, use_slew=False)
+    audio_mixer.set_source_volume("tv", 60, use_slew=False)
+
+    assert _tv_volumes(audio_mixer) == [55, 60]
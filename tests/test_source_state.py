@@ -0,0 +1,73 @@
+"""Tests for AudioSource state updates and level notification throttling."""
+
+from media_bridge.sources import base
+from media_bridge.sources.base import AudioSource, PlaybackState
+
+
+class DummySource(AudioSource):
+    """Minimal concrete source recording its notifications."""
+
+    def __init__(self):
+        self.notified = []
+        super().__init__(
+            name="dummy",
+            on_state_change=lambda name, key, value: self.notified.append((key, value)),
+        )
+
+    def start(self): pass
+    def stop(self): pass
+    def is_active(self): return False
+    def get_volume(self): return self._state.volume
+    def set_volume(self, volume): return True
+    def get_muted(self): return self._state.muted
+    def set_muted(self, muted): return True
+    def get_level(self): return self._state.level
+
+
+def _levels(source):
+    return [value for key, value in source.notified if key == "level"]
+
+
+def test_level_change_notified_when_due(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(base.time, "monotonic", lambda: clock[0])
+    source = DummySource()
+    
+    source._update_state(level=52)
+    clock[0] += 0.01
+    source._update_state(level=70)  # Large jump - sent immediately
+    
+    assert _levels(source) == [52, 70]
+
+
+def test_throttled_level_sent_once_it_settles(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(base.time, "monotonic", lambda: clock[0])
+    source = DummySource()
+    
+    source._update_state(level=52)
+    clock[0] += 0.05
+    source._update_state(level=50)  # Small step inside the interval - throttled
+    assert _levels(source) == [52]
+    assert source.state.level == 50
+    
+    clock[0] += 0.1
+    source._update_state(level=50)  # Level settled on the throttled value
+    clock[0] += 0.1
+    source._update_state(level=50)
+    
+    assert _levels(source) == [52, 50]
+
+
+def test_unchanged_level_not_notified():
+    source = DummySource()
+    source._update_state(level=0, level_db=-100.0)
+    assert source.notified == []
+
+
+def test_other_fields_notified_on_change_only():
+    source = DummySource()
+    source._update_state(state=PlaybackState.PLAYING, volume=40)
+    source._update_state(state=PlaybackState.PLAYING, volume=40)
+    
+    assert source.notified == [("state", "playing"), ("volume", 40)]
@@ -0,0 +1,115 @@
+"""Tests for TV source S/PDIF codec detection and level parsing."""
+
+import os
+
+import pytest
+
+from media_bridge.sources import tv
+from media_bridge.sources.tv import SPDIF_SYNC, TVSource
+
+
+def _burst(data_type: int) -> bytes:
+    """IEC 61937 preamble: Pa/Pb sync words, then Pc with the data type in its low byte."""
+    return SPDIF_SYNC + bytes([data_type, 0x00, 0x00, 0x10])
+
+
+@pytest.fixture
+def source():
+    return TVSource()
+
+
+def test_aligned_preamble_detected(source):
+    buf = bytes(64) + _burst(0x01) + bytes(64)
+    assert source._detect_spdif_codec(buf) == "ac3"
+
+
+def test_misaligned_preamble_ignored(source):
+    # Sync pattern straddling two samples is just PCM that happens to match
+    buf = bytes(63) + _burst(0x15) + bytes(65)
+    assert source._detect_spdif_codec(buf) is None
+
+
+def test_later_aligned_preamble_found_after_misaligned_match(source):
+    buf = bytes(1) + _burst(0x15) + bytes(1) + _burst(0x0B)
+    assert source._detect_spdif_codec(buf) == "dts"
+
+
+def test_unknown_data_type_ignored(source):
+    assert source._detect_spdif_codec(_burst(0x00) + bytes(64)) is None
+
+
+class _FakeStdout:
+    """arecord stdout handing out fixed chunks; fileno() is a pipe that is always readable."""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+        self._r, self._w = os.pipe()
+        os.write(self._w, b"x")
+
+    def fileno(self):
+        return self._r
+
+    def read1(self, size):
+        return self._chunks.pop(0) if self._chunks else b""
+
+    def close(self):
+        os.close(self._r)
+        os.close(self._w)
+
+
+class _FakeArecord:
+    def __init__(self, chunks):
+        self.stdout = _FakeStdout(chunks)
+
+    def kill(self): pass
+    def wait(self): return 0
+
+
+def test_probe_finds_preamble_split_across_chunks(source, monkeypatch):
+    burst = _burst(0x15)
+    chunks = [bytes(100) + burst[:3], burst[3:] + bytes(100)]
+    proc = _FakeArecord(chunks)
+    monkeypatch.setattr(tv, "_ARECORD", "arecord")
+    monkeypatch.setattr(tv.subprocess, "Popen", lambda *args, **kwargs: proc)
+
+    try:
+        assert source._probe_bitstream() == "eac3"
+    finally:
+        proc.stdout.close()
+
+
+@pytest.mark.parametrize("line, expected", [
+    (
+        b'Got message #42 from element "level0" (element): level, '
+        b'endtime=(guint64)1000000000, rms=(GValueArray)< -20.5, -inf >, '
+        b'peak=(GValueArray)< -3.0, -inf >, decay=(GValueArray)< -3.0, -inf >;',
+        -20.5,
+    ),
+    (
+        b'Got message #42 from element "level0" (element): level, '
+        b'rms=(double){ -31.25, -18 }, peak=(double){ -2.5, -1 };',
+        -18.0,
+    ),
+    (
+        b'Got message #42 from element "level0" (element): level, '
+        b'rms=(GValueArray)< -inf, -inf >, peak=(GValueArray)< -inf, -inf >;',
+        -100.0,
+    ),
+])
+def test_level_line_parsed(source, monkeypatch, line, expected):
+    seen = []
+    monkeypatch.setattr(source, "_detect_silence", seen.append)
+
+    source._handle_level_line(line)
+
+    assert seen == [expected]
+    assert source._current_level_db == expected
+
+
+def test_non_level_line_ignored(source, monkeypatch):
+    seen = []
+    monkeypatch.setattr(source, "_detect_silence", seen.append)
+
+    source._handle_level_line(b"Setting pipeline to PLAYING ...")
+
+    assert seen == []